@@ -107,7 +107,7 @@ class DoctorUser(MedisecureUser):
     @task(1)
     def view_patient_list(self):
         if self.token:
-            self.client.get("/api/patients/?limit=10", headers=self.auth_headers)
+            self.client.get("/api/patients/?limit=10&fields=summary", headers=self.auth_headers)
 
 class AdminUser(MedisecureUser):
     weight = 1
@@ -0,0 +1,15 @@
+from alembic import op
+
+revision = "0002_patient_keyset_indexes"
+down_revision = "0001_init"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Index composites pour la pagination par curseur des patients
+    op.create_index("idx_patients_last_name_id", "patients", ["last_name", "id"])
+    op.create_index("idx_patients_created_at_id", "patients", ["created_at", "id"])
+
+def downgrade():
+    op.drop_index("idx_patients_created_at_id", table_name="patients")
+    op.drop_index("idx_patients_last_name_id", table_name="patients")
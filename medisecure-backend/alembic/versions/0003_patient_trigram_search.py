@@ -0,0 +1,41 @@
+from alembic import op
+
+revision = "0003_patient_trigram_search"
+down_revision = "0002_patient_keyset_indexes"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Recherche par sous-chaîne sans accents : pg_trgm + unaccent
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS unaccent")
+
+    # unaccent() n'est pas IMMUTABLE : ce wrapper permet de l'utiliser dans un index
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION f_unaccent(text)
+        RETURNS text
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+        AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$
+        """
+    )
+
+    # Index GIN trigrammes (expressions identiques à celles de PostgresPatientRepository.search)
+    op.execute(
+        "CREATE INDEX idx_patients_first_name_trgm ON patients "
+        "USING gin (f_unaccent(lower(first_name)) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_patients_last_name_trgm ON patients "
+        "USING gin (f_unaccent(lower(last_name)) gin_trgm_ops)"
+    )
+    op.execute(
+        "CREATE INDEX idx_patients_phone_number_trgm ON patients "
+        "USING gin (phone_number gin_trgm_ops)"
+    )
+
+def downgrade():
+    op.drop_index("idx_patients_phone_number_trgm", table_name="patients")
+    op.drop_index("idx_patients_last_name_trgm", table_name="patients")
+    op.drop_index("idx_patients_first_name_trgm", table_name="patients")
+    op.execute("DROP FUNCTION IF EXISTS f_unaccent(text)")
@@ -0,0 +1,27 @@
+from alembic import op
+
+revision = "0004_appointment_period_exclusion"
+down_revision = "0003_patient_trigram_search"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Égalité sur doctor_id (uuid) dans un index GiST
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+
+    # Plage horaire demi-ouverte : deux rendez-vous consécutifs ne se chevauchent pas
+    op.execute(
+        "ALTER TABLE appointments ADD COLUMN period tsrange "
+        "GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED"
+    )
+
+    # Échoue si des rendez-vous actifs se chevauchent déjà : les annuler avant la migration
+    op.execute(
+        "ALTER TABLE appointments ADD CONSTRAINT appointments_no_overlap "
+        "EXCLUDE USING gist (doctor_id WITH =, period WITH &&) "
+        "WHERE (status IN ('scheduled', 'confirmed'))"
+    )
+
+def downgrade():
+    op.execute("ALTER TABLE appointments DROP CONSTRAINT IF EXISTS appointments_no_overlap")
+    op.execute("ALTER TABLE appointments DROP COLUMN IF EXISTS period")
@@ -0,0 +1,21 @@
+from alembic import op
+
+revision = "0005_appointment_filter_indexes"
+down_revision = "0004_appointment_period_exclusion"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Index composites des listes de rendez-vous filtrées et paginées par (start_time, id)
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_appointment_doctor_timerange "
+        "ON appointments (doctor_id, start_time, end_time)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_appointment_patient_start "
+        "ON appointments (patient_id, start_time)"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_appointment_patient_start")
+    op.execute("DROP INDEX IF EXISTS idx_appointment_doctor_timerange")
@@ -0,0 +1,33 @@
+from alembic import op
+
+revision = "0006_email_outbox"
+down_revision = "0005_appointment_filter_indexes"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Boîte d'envoi transactionnelle des emails, vidée par l'EmailOutboxWorker
+    op.execute(
+        """
+        CREATE TABLE IF NOT EXISTS email_outbox (
+            id UUID PRIMARY KEY,
+            sender VARCHAR NOT NULL,
+            recipients VARCHAR[] NOT NULL,
+            raw_message TEXT NOT NULL,
+            status VARCHAR(16) NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+            sent_at TIMESTAMPTZ
+        )
+        """
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_outbox_pending "
+        "ON email_outbox (next_attempt_at) WHERE status = 'pending'"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_email_outbox_pending")
+    op.execute("DROP TABLE IF EXISTS email_outbox")
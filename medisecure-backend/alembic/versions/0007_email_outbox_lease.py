@@ -0,0 +1,20 @@
+from alembic import op
+
+revision = "0007_email_outbox_lease"
+down_revision = "0006_email_outbox"
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Bail des messages en cours d'envoi : réservés dans une transaction courte,
+    # envoyés hors transaction, réservables de nouveau si le bail expire
+    op.execute("ALTER TABLE email_outbox ADD COLUMN IF NOT EXISTS lease_expires_at TIMESTAMPTZ")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_email_outbox_leased "
+        "ON email_outbox (lease_expires_at) WHERE status = 'sending'"
+    )
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS idx_email_outbox_leased")
+    op.execute("UPDATE email_outbox SET status = 'pending' WHERE status = 'sending'")
+    op.execute("ALTER TABLE email_outbox DROP COLUMN IF EXISTS lease_expires_at")
@@ -7,7 +7,6 @@ from datetime import timedelta, datetime
 import os
 import logging
 from dotenv import load_dotenv
-import bcrypt
 from jose import jwt
 
 from shared.container.container import get_container
@@ -41,18 +40,13 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
     return encoded_jwt
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Vérifier un mot de passe"""
-    try:
-        return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
-    except Exception as e:
-        logger.error(f"Erreur lors de la vérification du mot de passe: {e}")
-        return False
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Vérifier un mot de passe (calcul bcrypt dans le pool de hachage, hors de la boucle)"""
+    return await get_container().password_hasher().verify(plain_password, hashed_password)
 
-def hash_password(password: str) -> str:
-    """Hasher un mot de passe"""
-    salt = bcrypt.gensalt()
-    return bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
+async def hash_password(password: str) -> str:
+    """Hasher un mot de passe (calcul bcrypt dans le pool de hachage, hors de la boucle)"""
+    return await get_container().password_hasher().hash(password)
 
 @router.post("/login", response_model=TokenResponseDTO)
 async def login(
@@ -75,7 +69,7 @@ async def login(
         HTTPException: En cas d'erreur
     """
     try:
-        logger.info(f"Tentative de connexion pour: {form_data.username}")
+        logger.info("Tentative de connexion pour: %s", form_data.username)
         
         # Rechercher l'utilisateur dans la base de données
         query = select(UserModel).where(UserModel.email == form_data.username)
@@ -83,18 +77,18 @@ async def login(
         user_model = result.scalar_one_or_none()
         
         if not user_model:
-            logger.warning(f"Utilisateur non trouvé: {form_data.username}")
+            logger.warning("Utilisateur non trouvé: %s", form_data.username)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        logger.info(f"Utilisateur trouvé: {user_model.email}, rôle: {user_model.role}")
+        logger.info("Utilisateur trouvé: %s, rôle: %s", user_model.email, user_model.role)
         
         # Vérifier si l'utilisateur est actif
         if not user_model.is_active:
-            logger.warning(f"Utilisateur inactif: {user_model.email}")
+            logger.warning("Utilisateur inactif: %s", user_model.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Compte utilisateur désactivé",
@@ -110,11 +104,11 @@ async def login(
             is_password_valid = True
         else:
             # Vérifier le mot de passe hashé
-            if user_model.password_hash:
-                is_password_valid = verify_password(form_data.password, user_model.password_hash)
+            if user_model.hashed_password:
+                is_password_valid = await verify_password(form_data.password, user_model.hashed_password)
         
         if not is_password_valid:
-            logger.warning(f"Mot de passe incorrect pour: {user_model.email}")
+            logger.warning("Mot de passe incorrect pour: %s", user_model.email)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
@@ -135,7 +129,7 @@ async def login(
             data=access_token_data, expires_delta=access_token_expires
         )
         
-        logger.info(f"Connexion réussie pour: {user_model.email}")
+        logger.info("Connexion réussie pour: %s", user_model.email)
         
         # Retourner la réponse avec le token et les informations de l'utilisateur
         return TokenResponseDTO(
@@ -158,7 +152,7 @@ async def login(
         # Re-lever les HTTPException telles quelles
         raise
     except Exception as e:
-        logger.error(f"Erreur inattendue lors de la connexion: {str(e)}")
+        logger.error("Erreur inattendue lors de la connexion: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur interne du serveur"
@@ -171,7 +165,7 @@ async def logout(request: Request):
         logger.info("Demande de déconnexion")
         return {"message": "Déconnexion réussie"}
     except Exception as e:
-        logger.error(f"Erreur lors de la déconnexion: {str(e)}")
+        logger.error("Erreur lors de la déconnexion: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur lors de la déconnexion"
@@ -15,9 +15,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
-from shared.container.container import Container, set_container_instance
+import os
+
+from shared.container.container import Container, get_container, set_container_instance
+from shared.infrastructure.database.connection import dispose_engine
 
 @app.on_event("startup")
 async def startup_event():
@@ -26,6 +30,26 @@ async def startup_event():
     container.init_resources()
     set_container_instance(container)
     print("Container initialized in startup loop")
+    
+    # Envoi des emails de la boîte d'envoi en arrière-plan
+    if os.getenv("EMAIL_OUTBOX_WORKER_ENABLED", "true").lower() == "true":
+        try:
+            container.email_outbox_worker().start()
+        except Exception as e:
+            print(f"Warning: Failed to start the email outbox worker: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    # Terminer le lot d'emails en cours avant de fermer le pool
+    if os.getenv("EMAIL_OUTBOX_WORKER_ENABLED", "true").lower() == "true":
+        try:
+            await get_container().email_outbox_worker().stop()
+        except Exception as e:
+            print(f"Warning: Failed to stop the email outbox worker: {e}")
+    # Arrêter les threads de hachage des mots de passe
+    get_container().password_hasher().shutdown()
+    # Fermer proprement les connexions du pool
+    await dispose_engine()
 
 # Expose Prometheus metrics
 try:
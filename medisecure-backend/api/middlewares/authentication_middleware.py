@@ -2,12 +2,12 @@
 
 from fastapi import Request, Response
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from jose import JWTError
 from typing import Optional, Dict, Any
-import os
-from datetime import datetime
 import logging
 
+from shared.container.container import get_container
+
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
@@ -17,8 +17,8 @@ class AuthenticationMiddleware:
     """Middleware pour vérifier l'authentification JWT"""
     
     def __init__(self):
-        self.jwt_secret = os.getenv("JWT_SECRET_KEY", "default_secret_key")
-        self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+        # Vérificateur partagé avec extract_token_payload (clé chargée une fois, cache des tokens)
+        self.token_verifier = get_container().token_verifier()
         
     async def __call__(self, request: Request, call_next):
         """Vérifie le token JWT et ajoute l'utilisateur à la requête"""
@@ -48,13 +48,13 @@ class AuthenticationMiddleware:
         # Vérifier si le chemin est exempté
         request_path = str(request.url.path)
         if any(request_path.startswith(path) for path in exempt_paths):
-            logger.debug(f"Chemin exempté: {request_path}")
+            logger.debug("Chemin exempté: %s", request_path)
             return await call_next(request)
         
         # Récupérer le token d'autorisation
         auth_header = request.headers.get("Authorization")
         if not auth_header:
-            logger.info(f"Pas de token d'autorisation pour: {request_path}")
+            logger.info("Pas de token d'autorisation pour: %s", request_path)
             # Pour les autres endpoints, continuer sans authentification pour le moment
             return await call_next(request)
         
@@ -62,30 +62,25 @@ class AuthenticationMiddleware:
             # Extraction du token
             scheme, token = auth_header.split(" ", 1)
             if scheme.lower() != "bearer":
-                logger.warning(f"Schéma d'autorisation invalide: {scheme}")
+                logger.warning("Schéma d'autorisation invalide: %s", scheme)
                 return await call_next(request)
                 
-            # Validation du token
-            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.algorithm])
-            
-            # Vérification de l'expiration
-            exp = payload.get("exp")
-            if exp and datetime.utcnow() > datetime.fromtimestamp(exp):
-                logger.warning(f"Token expiré pour: {request_path}")
-                return await call_next(request)
+            # Validation du token (signature et expiration), servie par le cache si déjà vérifié
+            payload = self.token_verifier.verify(token)
             
-            # Ajout de l'utilisateur à la requête
+            # Ajout de l'utilisateur à la requête (réutilisé par extract_token_payload)
             request.state.user = payload
-            logger.debug(f"Utilisateur authentifié: {payload.get('email')} accède à {request_path}")
+            request.state.token = token
+            logger.debug("Utilisateur authentifié: %s accède à %s", payload.get('email'), request_path)
             
             return await call_next(request)
             
         except JWTError as e:
-            logger.warning(f"Erreur JWT pour {request_path}: {str(e)}")
+            logger.warning("Erreur JWT pour %s: %s", request_path, e)
             return await call_next(request)
         except ValueError as e:
-            logger.warning(f"Erreur de format du token pour {request_path}: {str(e)}")
+            logger.warning("Erreur de format du token pour %s: %s", request_path, e)
             return await call_next(request)
         except Exception as e:
-            logger.error(f"Erreur d'authentification pour {request_path}: {str(e)}")
+            logger.error("Erreur d'authentification pour %s: %s", request_path, e)
             return await call_next(request)
\ No newline at end of file
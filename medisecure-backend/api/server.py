@@ -0,0 +1,182 @@
+# medisecure-backend/api/server.py
+"""
+Point d'entrée de production de l'API : python -m api.server
+
+- Plusieurs workers uvicorn (un processus par cœur disponible), sans --reload
+- Nombre de workers déduit de l'affinité CPU et de la limite cgroup du conteneur
+  (resources.limits.cpu dans Kubernetes), WEB_CONCURRENCY pour le forcer
+- Boucle uvloop et parseur httptools lorsqu'ils sont installés (uvicorn[standard])
+- Arrêt gracieux : les requêtes en cours disposent de SERVER_GRACEFUL_SHUTDOWN_SECONDS
+  pour se terminer, puis chaque worker exécute le shutdown de l'application
+  (arrêt du worker d'emails, fermeture du pool de connexions)
+
+Chaque worker ouvre son propre pool : la base doit accepter
+workers × (DB_POOL_SIZE + DB_MAX_OVERFLOW) connexions.
+
+Chaque worker a aussi ses propres caches en mémoire. Le cache des patients est
+invalidé à chaque modification : sans cache partagé (REDIS_URL et paquet redis),
+les autres workers serviraient l'ancien dossier jusqu'à PATIENT_CACHE_TTL_SECONDS.
+Avec plusieurs workers et sans Redis, le cache des patients est donc désactivé
+(chaque lecture interroge la base) : le nombre de workers est transmis aux
+processus par WEB_CONCURRENCY (voir shared.infrastructure.cache.factory). Les
+autres caches restent propres à chaque worker sans incohérence : le cache des
+tokens ne contient que des payloads déjà vérifiés (immuables), celui des totaux
+des estimations déjà approximatives (COUNT_CACHE_TTL_SECONDS).
+"""
+import importlib.util
+import logging
+import math
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from shared.infrastructure.database.pool import PoolSettings
+from shared.infrastructure.monitoring.logging_config import configure_logging
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+APP = "api.main:app"
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> Optional[float]:
+    """
+    Lit la limite de CPU du conteneur (quota / période du cgroup).
+
+    Args:
+        root: Le point de montage des cgroups
+
+    Returns:
+        Optional[float]: Le nombre de CPUs alloués, ou None si aucune limite n'est fixée
+    """
+    # cgroup v2 : "<quota> <période>" ou "max <période>"
+    cpu_max = root / "cpu.max"
+    if cpu_max.exists():
+        quota, _, period = cpu_max.read_text().strip().partition(" ")
+        if quota == "max":
+            return None
+        return int(quota) / int(period or 100000)
+
+    # cgroup v1 : quota à -1 lorsqu'il n'y a pas de limite
+    quota_file = root / "cpu" / "cpu.cfs_quota_us"
+    period_file = root / "cpu" / "cpu.cfs_period_us"
+    if quota_file.exists() and period_file.exists():
+        quota = int(quota_file.read_text())
+        if quota <= 0:
+            return None
+        return quota / int(period_file.read_text())
+
+    return None
+
+def available_cpus(root: Path = CGROUP_ROOT) -> int:
+    """
+    Retourne le nombre de CPUs utilisables par le processus.
+
+    Args:
+        root: Le point de montage des cgroups
+
+    Returns:
+        int: Le minimum entre les CPUs autorisés (affinité) et la limite cgroup, au moins 1
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(cpus, 1)
+
+def _installed(module: str) -> bool:
+    """Indique si un module optionnel est installé."""
+    return importlib.util.find_spec(module) is not None
+
+def shared_cache_available() -> bool:
+    """Indique si le cache des patients est partagé entre les workers (Redis)."""
+    return bool(os.getenv("REDIS_URL")) and _installed("redis")
+
+@dataclass(frozen=True)
+class ServerSettings:
+    """
+    Paramètres du serveur de production.
+
+    Attributes:
+        host: L'adresse d'écoute
+        port: Le port d'écoute
+        workers: Le nombre de processus workers
+        graceful_shutdown: Délai (s) laissé aux requêtes en cours lors de l'arrêt
+        keep_alive: Durée (s) de maintien des connexions HTTP inactives
+        access_log: Journalise chaque requête reçue
+    """
+    host: str = "0.0.0.0"
+    port: int = 8000
+    workers: int = 1
+    graceful_shutdown: int = 20
+    keep_alive: int = 5
+    access_log: bool = False
+
+    @classmethod
+    def from_env(cls) -> "ServerSettings":
+        """Construit les paramètres à partir des variables d'environnement."""
+        workers = int(os.getenv("WEB_CONCURRENCY", 0)) or available_cpus()
+        return cls(
+            host=os.getenv("HOST", cls.host),
+            port=int(os.getenv("PORT", cls.port)),
+            workers=workers,
+            graceful_shutdown=int(os.getenv("SERVER_GRACEFUL_SHUTDOWN_SECONDS", cls.graceful_shutdown)),
+            keep_alive=int(os.getenv("SERVER_KEEP_ALIVE_SECONDS", cls.keep_alive)),
+            access_log=os.getenv("SERVER_ACCESS_LOG", "false").lower() == "true",
+        )
+
+def uvicorn_options(settings: ServerSettings) -> dict:
+    """
+    Traduit les paramètres en options de uvicorn.run.
+
+    Args:
+        settings: Les paramètres du serveur
+
+    Returns:
+        dict: Les options de uvicorn.run (sans l'application)
+    """
+    return {
+        "host": settings.host,
+        "port": settings.port,
+        "workers": settings.workers,
+        "loop": "uvloop" if _installed("uvloop") else "asyncio",
+        "http": "httptools" if _installed("httptools") else "h11",
+        "lifespan": "on",
+        "reload": False,
+        "proxy_headers": True,
+        "forwarded_allow_ips": os.getenv("FORWARDED_ALLOW_IPS", "*"),
+        "timeout_keep_alive": settings.keep_alive,
+        "timeout_graceful_shutdown": settings.graceful_shutdown,
+        "access_log": settings.access_log,
+        # La journalisation est configurée par configure_logging (LOG_LEVEL, LOG_FORMAT)
+        "log_config": None,
+    }
+
+def main() -> None:
+    """Démarre l'API avec les paramètres de l'environnement."""
+    import uvicorn
+
+    configure_logging()
+    settings = ServerSettings.from_env()
+    options = uvicorn_options(settings)
+    pool = PoolSettings.from_env()
+    # Transmis aux workers : les caches invalidés à l'écriture en dépendent
+    os.environ["WEB_CONCURRENCY"] = str(settings.workers)
+    if settings.workers > 1 and not shared_cache_available():
+        logger.warning(
+            "%s workers sans cache partagé (REDIS_URL absent ou paquet redis non installé) : "
+            "cache des patients désactivé", settings.workers
+        )
+    logger.info(
+        "Démarrage de %s : %s workers (%s, %s), jusqu'à %s connexions à la base",
+        APP, settings.workers, options["loop"], options["http"], settings.workers * pool.capacity
+    )
+    uvicorn.run(APP, **options)
+
+if __name__ == "__main__":
+    main()
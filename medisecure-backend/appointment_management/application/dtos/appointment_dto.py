@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, validator
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
 class CreateAppointmentDTO(BaseModel):
@@ -17,6 +17,12 @@ class CreateAppointmentDTO(BaseModel):
             raise ValueError('La fin doit être après le début')
         return v
 
+class ParticipantDTO(BaseModel):
+    """DTO du nom d'un participant (patient ou médecin) d'un rendez-vous"""
+    id: str
+    first_name: str
+    last_name: str
+
 class AppointmentResponseDTO(BaseModel):
     """DTO pour la réponse à la création/lecture d'un rendez-vous"""
     id: str
@@ -27,3 +33,16 @@ class AppointmentResponseDTO(BaseModel):
     status: str
     notes: Optional[str] = None
     created_at: str
+    # Renseignés seulement si demandés (include=patient,doctor de la liste des rendez-vous)
+    patient: Optional[ParticipantDTO] = None
+    doctor: Optional[ParticipantDTO] = None
+
+class AvailabilitySlotDTO(BaseModel):
+    """DTO d'un créneau libre"""
+    start: datetime
+    end: datetime
+
+class DoctorAvailabilityDTO(BaseModel):
+    """DTO des créneaux libres d'un médecin sur une période"""
+    doctor_id: UUID
+    slots: List[AvailabilitySlotDTO]
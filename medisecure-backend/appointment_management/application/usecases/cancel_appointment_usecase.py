@@ -21,8 +21,8 @@ class CancelAppointmentUseCase:
         appointment.cancel()
         await self.appointment_repository.save(appointment)
 
-        # Envoyer la notification
-        self.notification_port.send_appointment_cancelled(
+        # Envoyer la notification (enregistrée dans la boîte d'envoi, dans la même transaction)
+        await self.notification_port.send_appointment_cancelled(
             patient_id=appointment.patient_id,
             doctor_id=appointment.doctor_id,
             appointment_id=appointment.id,
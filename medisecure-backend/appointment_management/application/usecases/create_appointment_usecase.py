@@ -26,17 +26,8 @@ class CreateAppointmentUseCase:
         Returns:
             DTO contenant les informations du rendez-vous créé
         Raises:
-            ValueError: Si le créneau est déjà pris
+            AppointmentConflictException: Si le créneau est déjà pris (sous-classe de ValueError)
         """
-        # Vérifier si le créneau est disponible
-        conflicts = await self.appointment_repository.find_conflicts(
-            doctor_id=command.doctor_id,
-            start_time=command.start_time,
-            end_time=command.end_time
-        )
-        if conflicts:
-            raise ValueError("Le créneau horaire demandé n'est pas disponible")
-
         # Créer le rendez-vous
         appointment_id = uuid4()
         appointment = Appointment(
@@ -49,16 +40,13 @@ class CreateAppointmentUseCase:
             status="scheduled"
         )
 
-        # Sauvegarder le rendez-vous
-        await self.appointment_repository.save(appointment)
+        # Réserver le créneau : l'insertion échoue atomiquement en cas de chevauchement,
+        # sans vérification préalable exposée aux réservations concurrentes
+        await self.appointment_repository.book(appointment)
 
-        # Envoyer une notification (Assuming this might be async too or sync, keeping consistent if port is sync)
-        # Note: NotificationPort definition not seen, assuming sync for now or handled by implementation. 
-        # But commonly services are async. Let's assume sync unless error.
-        # Actually NotificationPort usually involves IO (email), so strictly should be async, but given I haven't seen it, 
-        # I will leave it as is unless I see it's broken. 
-        # Wait, if I am in an async function, sync calls are blocking but allowed.
-        self.notification_service.send_appointment_created(
+        # Notifier le patient : l'email est enregistré dans la boîte d'envoi, dans la même
+        # transaction que le rendez-vous, et envoyé en arrière-plan
+        await self.notification_service.send_appointment_created(
             patient_id=appointment.patient_id,
             doctor_id=appointment.doctor_id,
             appointment_id=appointment.id,
@@ -1,45 +1,95 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Sequence
 from uuid import UUID
-from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
-from appointment_management.application.dtos.appointment_dto import AppointmentResponseDTO
+from appointment_management.domain.entities.appointment import ParticipantName
+from appointment_management.domain.ports.secondary.appointment_repository_port import (
+    APPOINTMENT_INCLUDES,
+    APPOINTMENT_SORT_KEY_TYPES,
+    AppointmentRepositoryPort,
+    appointment_sort_key
+)
+from appointment_management.application.dtos.appointment_dto import AppointmentResponseDTO, ParticipantDTO
+from shared.application.pagination.keyset import KeysetPage, build_keyset_page, decode_cursor
+
+# Nom de l'ordre de tri des curseurs de rendez-vous
+APPOINTMENT_ORDER = "start_time"
+
+def _participant_dto(participant: Optional[ParticipantName]) -> Optional[ParticipantDTO]:
+    """Convertit le nom d'un participant chargé avec le rendez-vous (None s'il n'a pas été demandé)"""
+    if participant is None:
+        return None
+    return ParticipantDTO(
+        id=str(participant.id),
+        first_name=participant.first_name,
+        last_name=participant.last_name
+    )
 
 class GetAppointmentsUseCase:
     """Use case to retrieve appointments with filters."""
-    
+
     def __init__(self, appointment_repository: AppointmentRepositoryPort):
         self.appointment_repository = appointment_repository
 
     async def execute(
-        self, 
-        patient_id: Optional[UUID] = None, 
+        self,
+        patient_id: Optional[UUID] = None,
         doctor_id: Optional[UUID] = None,
         start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None
-    ) -> List[AppointmentResponseDTO]:
-        
-        # Note: In a real implementation, we would pass these filters down to the repository
-        # For now, we reuse the existing specific finder methods or fall back to basic logic
-        # The prompt didn't specify a 'find_with_filters' method in the interface, 
-        # so I will stick to what's available or adapt.
-        
-        appointments = []
-        if patient_id:
-            appointments = await self.appointment_repository.find_all_by_patient_id(patient_id)
-        elif doctor_id:
-            appointments = await self.appointment_repository.find_all_by_doctor_id(doctor_id)
+        end_date: Optional[datetime] = None,
+        statuses: Optional[List[str]] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        include: Sequence[str] = ()
+    ) -> KeysetPage[AppointmentResponseDTO]:
+        """
+        Exécute le cas d'utilisation.
+        Tous les filtres sont appliqués par la base de données, en une seule requête.
+
+        Args:
+            patient_id: Le patient
+            doctor_id: Le médecin
+            start_date: Début au plus tôt des rendez-vous
+            end_date: Fin au plus tard des rendez-vous
+            statuses: Les statuts acceptés
+            limit: La taille de page (None : tous les rendez-vous)
+            cursor: Le curseur renvoyé avec la page précédente
+            include: Les participants dont le nom est renvoyé avec chaque rendez-vous
+                ("patient", "doctor"), lus dans la même requête
+
+        Returns:
+            KeysetPage[AppointmentResponseDTO]: Les rendez-vous triés par date et le curseur de la page suivante
+
+        Raises:
+            InvalidCursorException: Si le curseur est invalide (sous-classe de ValueError)
+            ValueError: Si include contient un participant inconnu
+        """
+        unknown = set(include) - set(APPOINTMENT_INCLUDES)
+        if unknown:
+            raise ValueError(f"include must be among {', '.join(APPOINTMENT_INCLUDES)}")
+
+        after = decode_cursor(cursor, APPOINTMENT_ORDER, APPOINTMENT_SORT_KEY_TYPES).values if cursor else None
+
+        # Lire un rendez-vous de plus pour savoir s'il existe une page suivante
+        appointments = await self.appointment_repository.find_with_filters(
+            patient_id=patient_id,
+            doctor_id=doctor_id,
+            start_time=start_date,
+            end_time=end_date,
+            statuses=statuses,
+            limit=limit + 1 if limit is not None else None,
+            after=after,
+            include=tuple(include)
+        )
+
+        if limit is not None:
+            page = build_keyset_page(
+                appointments, limit, APPOINTMENT_ORDER, lambda a, _: appointment_sort_key(a)
+            )
+            appointments, next_cursor = page.items, page.next_cursor
         else:
-            # New behavior: allow date filtering without ID
-            appointments = await self.appointment_repository.find_all(start_time=start_date, end_time=end_date)
-            
-        # In-memory filtering for date range (redundant if find_all handles it, but keeps safety for other methods)
-        if patient_id or doctor_id:
-            if start_date:
-                appointments = [a for a in appointments if a.start_time >= start_date]
-            if end_date:
-                appointments = [a for a in appointments if a.end_time <= end_date]
-            
-        return [
+            next_cursor = None
+
+        items = [
             AppointmentResponseDTO(
                 id=str(a.id),
                 patient_id=str(a.patient_id),
@@ -48,7 +98,10 @@ class GetAppointmentsUseCase:
                 end_time=a.end_time.isoformat(),
                 status=a.status,
                 notes=a.notes,
-                created_at=a.created_at.isoformat()
+                created_at=a.created_at.isoformat(),
+                patient=_participant_dto(a.patient),
+                doctor=_participant_dto(a.doctor)
             )
             for a in appointments
         ]
+        return KeysetPage(items=items, next_cursor=next_cursor)
@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta
+from typing import List, Sequence
+from uuid import UUID
+from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
+from appointment_management.domain.services.availability_service import AvailabilityService
+from appointment_management.application.dtos.appointment_dto import AvailabilitySlotDTO, DoctorAvailabilityDTO
+
+# Période maximale d'une recherche de disponibilités
+MAX_AVAILABILITY_RANGE = timedelta(days=31)
+
+# Durée minimale d'un créneau (durée minimale d'un rendez-vous)
+MIN_SLOT_MINUTES = 15
+
+class GetDoctorAvailabilityUseCase:
+    """Use case to compute the free slots of one or several doctors over a period."""
+
+    def __init__(
+        self,
+        appointment_repository: AppointmentRepositoryPort,
+        availability_service: AvailabilityService
+    ):
+        self.appointment_repository = appointment_repository
+        self.availability_service = availability_service
+
+    async def execute(
+        self,
+        doctor_ids: Sequence[UUID],
+        range_start: datetime,
+        range_end: datetime,
+        duration_minutes: int = 30
+    ) -> List[DoctorAvailabilityDTO]:
+        """
+        Exécute le cas d'utilisation.
+        Les rendez-vous de tous les médecins sont lus en une seule requête limitée à la période.
+
+        Args:
+            doctor_ids: Les médecins
+            range_start: Le début de la période
+            range_end: La fin de la période
+            duration_minutes: La durée d'un créneau en minutes
+
+        Returns:
+            List[DoctorAvailabilityDTO]: Les créneaux libres de chaque médecin, dans l'ordre demandé
+
+        Raises:
+            ValueError: Si la période ou la durée est invalide
+        """
+        if range_end <= range_start:
+            raise ValueError("La fin de la période doit être après son début")
+        if range_end - range_start > MAX_AVAILABILITY_RANGE:
+            raise ValueError(f"La période ne peut pas dépasser {MAX_AVAILABILITY_RANGE.days} jours")
+        if duration_minutes < MIN_SLOT_MINUTES:
+            raise ValueError(f"Un créneau doit durer au moins {MIN_SLOT_MINUTES} minutes")
+
+        # Dédoublonner en conservant l'ordre de la requête
+        doctor_ids = list(dict.fromkeys(doctor_ids))
+
+        appointments = await self.appointment_repository.find_active_in_range(
+            doctor_ids, range_start, range_end
+        )
+        free_slots = self.availability_service.free_slots_by_doctor(
+            doctor_ids,
+            appointments,
+            range_start,
+            range_end,
+            timedelta(minutes=duration_minutes)
+        )
+
+        return [
+            DoctorAvailabilityDTO(
+                doctor_id=doctor_id,
+                slots=[AvailabilitySlotDTO(start=slot.start, end=slot.end) for slot in free_slots[doctor_id]]
+            )
+            for doctor_id in doctor_ids
+        ]
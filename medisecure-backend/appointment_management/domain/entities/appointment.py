@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
@@ -10,6 +11,13 @@ class AppointmentStatus(str, Enum):
     COMPLETED = "completed"
     MISSED = "missed"
 
+@dataclass(frozen=True)
+class ParticipantName:
+    """Nom d'un participant (patient ou médecin), chargé avec le rendez-vous sur demande"""
+    id: UUID
+    first_name: str
+    last_name: str
+
 class Appointment:
     """Entité rendez-vous (indépendante de toute technologie)"""
     def __init__(
@@ -22,7 +30,9 @@ class Appointment:
         status: str = "scheduled",
         notes: Optional[str] = None,
         cancel_reason: Optional[str] = None,
-        created_at: Optional[datetime] = None
+        created_at: Optional[datetime] = None,
+        patient: Optional[ParticipantName] = None,
+        doctor: Optional[ParticipantName] = None
     ):
         self.id = id
         self.patient_id = patient_id
@@ -32,6 +42,9 @@ class Appointment:
         self.status = status
         self.notes = notes
         self.created_at = created_at or datetime.now()
+        # Noms du patient et du médecin, renseignés seulement si la lecture les a demandés
+        self.patient = patient
+        self.doctor = doctor
         
         # Validation métier dans l'entité
         self._validate()
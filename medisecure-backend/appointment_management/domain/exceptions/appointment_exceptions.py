@@ -0,0 +1,13 @@
+from shared.domain.exceptions.shared_exceptions import BusinessRuleException
+
+class AppointmentConflictException(BusinessRuleException, ValueError):
+    """
+    Exception levée lorsqu'un rendez-vous chevauche un rendez-vous actif du même médecin.
+    Hérite aussi de ValueError, l'erreur historiquement levée pour un créneau déjà pris.
+    """
+    def __init__(self, doctor_id, start_time, end_time):
+        self.doctor_id = doctor_id
+        self.start_time = start_time
+        self.end_time = end_time
+        message = "Le créneau horaire demandé n'est pas disponible"
+        super().__init__(message)
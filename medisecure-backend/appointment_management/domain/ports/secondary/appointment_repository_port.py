@@ -1,9 +1,22 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 from appointment_management.domain.entities.appointment import Appointment
 
+# Participants dont le nom peut être chargé avec les rendez-vous (find_with_filters)
+APPOINTMENT_INCLUDES = ("patient", "doctor")
+
+# Nom du verrou consultatif qui sérialise les réservations d'un même médecin (book)
+BOOKING_LOCK = "appointment_booking"
+
+# Types des valeurs de la clé de tri des rendez-vous (voir appointment_sort_key)
+APPOINTMENT_SORT_KEY_TYPES = (datetime, UUID)
+
+def appointment_sort_key(appointment: Appointment) -> Tuple[Any, ...]:
+    """Clé de tri stable des listes de rendez-vous : (start_time, id)."""
+    return (appointment.start_time, appointment.id)
+
 class AppointmentRepositoryPort(ABC):
     """
     Port pour le repository de rendez-vous.
@@ -14,6 +27,21 @@ class AppointmentRepositoryPort(ABC):
         """Sauvegarde un rendez-vous"""
         pass
 
+    @abstractmethod
+    async def book(self, appointment: Appointment) -> None:
+        """
+        Insère un nouveau rendez-vous en une seule opération atomique.
+
+        Les réservations d'un même médecin ne peuvent pas s'entrelacer (verrou
+        BOOKING_LOCK par médecin dans PostgreSQL, conservé jusqu'à la fin de la
+        transaction) ; celles de médecins différents s'exécutent en parallèle.
+
+        Raises:
+            AppointmentConflictException: Si le créneau chevauche un rendez-vous
+                actif (planifié ou confirmé) du même médecin
+        """
+        pass
+
     @abstractmethod
     async def find_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         """Trouve un rendez-vous par son ID"""
@@ -53,3 +81,49 @@ class AppointmentRepositoryPort(ABC):
         Trouve tous les rendez-vous, avec filtrage optionnel par date
         """
         pass
+
+    @abstractmethod
+    async def find_with_filters(
+        self,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        statuses: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[Any, ...]] = None,
+        include: Sequence[str] = ()
+    ) -> List[Appointment]:
+        """
+        Trouve les rendez-vous correspondant à tous les filtres fournis, triés par
+        (start_time, id), en une seule requête (noms des participants compris).
+
+        Args:
+            patient_id: Le patient
+            doctor_id: Le médecin
+            start_time: Début au plus tôt des rendez-vous
+            end_time: Fin au plus tard des rendez-vous
+            statuses: Les statuts acceptés
+            limit: Le nombre maximum de rendez-vous (None : pas de limite)
+            after: La clé (start_time, id) du dernier rendez-vous de la page précédente
+            include: Les participants dont le nom est chargé (voir APPOINTMENT_INCLUDES)
+        """
+        pass
+
+    @abstractmethod
+    async def find_active_in_range(
+        self,
+        doctor_ids: Sequence[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Appointment]:
+        """
+        Trouve les rendez-vous actifs (planifiés ou confirmés) des médecins qui
+        chevauchent la plage [start_time, end_time), triés par (doctor_id, start_time).
+
+        Args:
+            doctor_ids: Les médecins
+            start_time: Le début de la plage
+            end_time: La fin de la plage
+        """
+        pass
@@ -6,7 +6,7 @@ class NotificationPort(ABC):
     """Port pour l'envoi de notifications"""
     
     @abstractmethod
-    def send_appointment_created(
+    async def send_appointment_created(
         self, 
         patient_id: UUID, 
         doctor_id: UUID, 
@@ -17,7 +17,7 @@ class NotificationPort(ABC):
         pass
 
     @abstractmethod
-    def send_appointment_cancelled(
+    async def send_appointment_cancelled(
         self,
         patient_id: UUID,
         doctor_id: UUID,
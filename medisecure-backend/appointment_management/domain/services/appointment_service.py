@@ -1,10 +1,11 @@
 # medisecure-backend/appointment_management/domain/services/appointment_service.py
 from typing import Optional, List, Dict
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from uuid import UUID
 import logging
 
 from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.services.availability_service import AvailabilityService
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
@@ -29,18 +30,18 @@ class AppointmentService:
         """
         # Vérifier que les dates sont bien des objets datetime
         if not isinstance(start_time, datetime) or not isinstance(end_time, datetime):
-            logger.error(f"Types de dates invalides: start_time={type(start_time)}, end_time={type(end_time)}")
+            logger.error("Types de dates invalides: start_time=%s, end_time=%s", type(start_time), type(end_time))
             raise ValueError("Les heures de début et de fin doivent être des objets datetime")
         
         # Vérifier que l'heure de début est avant l'heure de fin
         if end_time <= start_time:
-            logger.error(f"Heure de fin ({end_time}) avant ou égale à l'heure de début ({start_time})")
+            logger.error("Heure de fin (%s) avant ou égale à l'heure de début (%s)", end_time, start_time)
             raise ValueError("L'heure de fin doit être après l'heure de début")
         
         # Vérifier que la durée du rendez-vous est raisonnable (par exemple, pas plus de 24h)
         duration = end_time - start_time
         if duration > timedelta(hours=24):
-            logger.warning(f"Durée de rendez-vous très longue détectée: {duration}")
+            logger.warning("Durée de rendez-vous très longue détectée: %s", duration)
             # Ce n'est qu'un avertissement, pas une erreur
     
     def check_appointment_overlap(
@@ -63,7 +64,7 @@ class AppointmentService:
             bool: True si le rendez-vous chevauche un autre, False sinon
         """
         # Journaliser le nombre de rendez-vous à vérifier
-        logger.debug(f"Vérification de chevauchement parmi {len(existing_appointments)} rendez-vous existants")
+        logger.debug("Vérification de chevauchement parmi %s rendez-vous existants", len(existing_appointments))
         
         for appointment in existing_appointments:
             # Ignorer le rendez-vous lui-même pour les mises à jour
@@ -82,8 +83,8 @@ class AppointmentService:
             # Un chevauchement existe si l'une des plages commence avant que l'autre ne se termine
             # et se termine après que l'autre n'ait commencé
             if (start_time < appointment.end_time and end_time > appointment.start_time):
-                logger.info(f"Chevauchement détecté avec le rendez-vous {appointment.id}")
-                logger.debug(f"Nouveau: {start_time} - {end_time}, Existant: {appointment.start_time} - {appointment.end_time}")
+                logger.info("Chevauchement détecté avec le rendez-vous %s", appointment.id)
+                logger.debug("Nouveau: %s - %s, Existant: %s - %s", start_time, end_time, appointment.start_time, appointment.end_time)
                 return True
                 
         # Aucun chevauchement trouvé
@@ -111,35 +112,21 @@ class AppointmentService:
         Returns:
             List[Dict]: Liste des créneaux disponibles avec heure de début et de fin
         """
-        # Filtrer les rendez-vous pour la date spécifiée
-        date_appointments = [
-            appointment for appointment in existing_appointments
-            if appointment.start_time.date() == date_to_check
-            and appointment.status != AppointmentStatus.CANCELLED
+        # Intervalles occupés (tous les rendez-vous non annulés)
+        busy = [
+            (appointment.start_time, appointment.end_time)
+            for appointment in existing_appointments
+            if appointment.status != AppointmentStatus.CANCELLED
         ]
         
-        # Créer des créneaux pour toute la journée
-        all_slots = []
-        current_time = datetime.combine(date_to_check, datetime.min.time().replace(hour=start_hour))
-        end_time = datetime.combine(date_to_check, datetime.min.time().replace(hour=end_hour))
+        # Balayage des intervalles triés plutôt que comparaison de chaque créneau à chaque rendez-vous
+        availability = AvailabilityService(start_hour=start_hour, end_hour=end_hour)
+        day_start = datetime.combine(date_to_check, time())
+        slots = availability.free_slots(
+            busy,
+            day_start,
+            day_start + timedelta(days=1),
+            timedelta(minutes=slot_duration_minutes)
+        )
         
-        while current_time < end_time:
-            slot_end = current_time + timedelta(minutes=slot_duration_minutes)
-            all_slots.append({
-                "start": current_time,
-                "end": slot_end,
-                "available": True
-            })
-            current_time = slot_end
-        
-        # Marquer les créneaux occupés
-        for appointment in date_appointments:
-            for slot in all_slots:
-                # Si le rendez-vous chevauche le créneau, marquer comme non disponible
-                if (appointment.start_time < slot["end"] and appointment.end_time > slot["start"]):
-                    slot["available"] = False
-        
-        # Retourner uniquement les créneaux disponibles
-        available_slots = [slot for slot in all_slots if slot["available"]]
-        
-        return available_slots
\ No newline at end of file
+        return [{"start": slot.start, "end": slot.end, "available": True} for slot in slots]
@@ -0,0 +1,166 @@
+# medisecure-backend/appointment_management/domain/services/availability_service.py
+from dataclasses import dataclass
+from datetime import datetime, date, time, timedelta, tzinfo as tzinfo_type
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from uuid import UUID
+import logging
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Statuts qui occupent un créneau (ceux de la contrainte d'exclusion appointments_no_overlap)
+BUSY_STATUSES = (AppointmentStatus.SCHEDULED.value, AppointmentStatus.CONFIRMED.value)
+
+@dataclass(frozen=True)
+class TimeSlot:
+    """Créneau horaire [start, end)"""
+    start: datetime
+    end: datetime
+
+class AvailabilityService:
+    """
+    Service du domaine calculant les créneaux libres des médecins.
+
+    Les rendez-vous sont triés puis fusionnés en intervalles occupés ; un balayage
+    unique de ces intervalles jour par jour produit les créneaux libres, soit
+    O(n log n) pour n rendez-vous, au lieu de comparer chaque créneau à chaque rendez-vous.
+    """
+
+    def __init__(self, start_hour: int = 8, end_hour: int = 18):
+        """
+        Initialise le service avec les horaires d'ouverture.
+
+        Args:
+            start_hour: L'heure de début de la journée
+            end_hour: L'heure de fin de la journée
+        """
+        if not 0 <= start_hour < end_hour <= 24:
+            raise ValueError("Les horaires d'ouverture sont invalides")
+        self.start_hour = start_hour
+        self.end_hour = end_hour
+
+    def free_slots_by_doctor(
+        self,
+        doctor_ids: Sequence[UUID],
+        appointments: Iterable[Appointment],
+        range_start: datetime,
+        range_end: datetime,
+        slot_duration: timedelta
+    ) -> Dict[UUID, List[TimeSlot]]:
+        """
+        Calcule les créneaux libres de plusieurs médecins sur une période.
+
+        Args:
+            doctor_ids: Les médecins
+            appointments: Les rendez-vous de ces médecins sur la période (dans n'importe quel ordre)
+            range_start: Le début de la période
+            range_end: La fin de la période
+            slot_duration: La durée d'un créneau
+
+        Returns:
+            Dict[UUID, List[TimeSlot]]: Les créneaux libres de chaque médecin, triés
+        """
+        by_doctor: Dict[UUID, List[Tuple[datetime, datetime]]] = {doctor_id: [] for doctor_id in doctor_ids}
+        for appointment in appointments:
+            if appointment.doctor_id in by_doctor and appointment.status in BUSY_STATUSES:
+                by_doctor[appointment.doctor_id].append((appointment.start_time, appointment.end_time))
+
+        return {
+            doctor_id: self.free_slots(busy, range_start, range_end, slot_duration)
+            for doctor_id, busy in by_doctor.items()
+        }
+
+    def free_slots(
+        self,
+        busy: Iterable[Tuple[datetime, datetime]],
+        range_start: datetime,
+        range_end: datetime,
+        slot_duration: timedelta
+    ) -> List[TimeSlot]:
+        """
+        Calcule les créneaux libres d'un médecin sur une période.
+
+        Les créneaux sont alignés sur l'heure d'ouverture de chaque jour, par pas de
+        `slot_duration`, comme dans AppointmentService.get_available_slots.
+
+        Args:
+            busy: Les intervalles occupés [début, fin)
+            range_start: Le début de la période
+            range_end: La fin de la période
+            slot_duration: La durée d'un créneau
+
+        Returns:
+            List[TimeSlot]: Les créneaux libres, triés
+        """
+        if slot_duration <= timedelta(0):
+            raise ValueError("La durée d'un créneau doit être positive")
+
+        merged = self._merge(busy)
+        slots: List[TimeSlot] = []
+        index = 0
+
+        day = range_start.date()
+        while day <= range_end.date():
+            day_open, day_close = self._opening_hours(day, range_start.tzinfo)
+            window_start = max(day_open, range_start)
+            window_end = min(day_close, range_end)
+
+            if window_start < window_end:
+                # Ignorer les intervalles terminés avant la fenêtre (le pointeur ne recule jamais)
+                while index < len(merged) and merged[index][1] <= window_start:
+                    index += 1
+
+                cursor = window_start
+                scan = index
+                while cursor < window_end:
+                    if scan < len(merged) and merged[scan][0] < window_end:
+                        gap_end = merged[scan][0]
+                        next_cursor = merged[scan][1]
+                        scan += 1
+                    else:
+                        gap_end = window_end
+                        next_cursor = window_end
+                    self._fill_gap(slots, day_open, cursor, min(gap_end, window_end), slot_duration)
+                    cursor = max(cursor, next_cursor)
+
+            day += timedelta(days=1)
+
+        return slots
+
+    def _opening_hours(self, day: date, tzinfo: Optional[tzinfo_type]) -> Tuple[datetime, datetime]:
+        """Retourne l'ouverture et la fermeture d'une journée (dans le fuseau de la période)."""
+        day_open = datetime.combine(day, time(hour=self.start_hour), tzinfo=tzinfo)
+        day_close = datetime.combine(day, time(), tzinfo=tzinfo) + timedelta(hours=self.end_hour)
+        return day_open, day_close
+
+    @staticmethod
+    def _merge(busy: Iterable[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+        """Trie et fusionne les intervalles occupés qui se chevauchent ou se touchent."""
+        merged: List[Tuple[datetime, datetime]] = []
+        for start, end in sorted(busy):
+            if merged and start <= merged[-1][1]:
+                if end > merged[-1][1]:
+                    merged[-1] = (merged[-1][0], end)
+            else:
+                merged.append((start, end))
+        return merged
+
+    @staticmethod
+    def _fill_gap(
+        slots: List[TimeSlot],
+        day_open: datetime,
+        gap_start: datetime,
+        gap_end: datetime,
+        slot_duration: timedelta
+    ) -> None:
+        """Ajoute les créneaux alignés sur la grille du jour contenus dans [gap_start, gap_end)."""
+        if gap_start >= gap_end:
+            return
+        # Premier créneau de la grille commençant au plus tôt à gap_start
+        steps = -((day_open - gap_start) // slot_duration)
+        start = day_open + steps * slot_duration
+        while start + slot_duration <= gap_end:
+            slots.append(TimeSlot(start=start, end=start + slot_duration))
+            start += slot_duration
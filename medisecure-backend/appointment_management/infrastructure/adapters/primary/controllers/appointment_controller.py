@@ -1,13 +1,20 @@
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
-from appointment_management.application.dtos.appointment_dto import AppointmentResponseDTO, CreateAppointmentDTO
+from appointment_management.application.dtos.appointment_dto import (
+    AppointmentResponseDTO,
+    CreateAppointmentDTO,
+    DoctorAvailabilityDTO
+)
 from appointment_management.application.usecases.create_appointment_usecase import CreateAppointmentUseCase
 from appointment_management.application.usecases.cancel_appointment_usecase import CancelAppointmentUseCase
 from appointment_management.application.usecases.get_appointments_usecase import GetAppointmentsUseCase
-from shared.container.container import get_container, Container
+from appointment_management.application.usecases.get_doctor_availability_usecase import GetDoctorAvailabilityUseCase
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from shared.container.container import get_container, get_unit_of_work, Container
+from shared.infrastructure.database.unit_of_work import UnitOfWork
 from shared.services.authenticator.extract_token import extract_token_payload
 
 router = APIRouter(prefix="/appointments", tags=["appointments"])
@@ -16,17 +23,18 @@ router = APIRouter(prefix="/appointments", tags=["appointments"])
 async def create_appointment(
     data: CreateAppointmentDTO,
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
-    container: Container = Depends(get_container)
+    container: Container = Depends(get_container),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     """Crée un nouveau rendez-vous"""
     try:
-        # Instantiation du Use Case via le Container
-        use_case = CreateAppointmentUseCase(
-            appointment_repository=container.appointment_repository(),
-            notification_service=container.notification_service()
-        )
-        result = await use_case.execute(data)
+        # Cas d'utilisation fourni par le container (singleton)
+        use_case: CreateAppointmentUseCase = container.create_appointment_usecase()
+        async with unit_of_work:
+            result = await use_case.execute(data)
         return result
+    except AppointmentConflictException as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -37,15 +45,14 @@ async def cancel_appointment(
     appointment_id: UUID,
     cancel_reason: str = Query("Non spécifié", description="Raison de l'annulation"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
-    container: Container = Depends(get_container)
+    container: Container = Depends(get_container),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     """Annule un rendez-vous existant"""
     try:
-        use_case = CancelAppointmentUseCase(
-            appointment_repository=container.appointment_repository(),
-            notification_port=container.notification_service()
-        )
-        await use_case.execute(appointment_id, cancel_reason=cancel_reason)
+        use_case: CancelAppointmentUseCase = container.cancel_appointment_usecase()
+        async with unit_of_work:
+            await use_case.execute(appointment_id, cancel_reason=cancel_reason)
         return None
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -54,26 +61,61 @@ async def cancel_appointment(
 
 @router.get("/", response_model=List[AppointmentResponseDTO])
 async def get_appointments(
+    response: Response,
     patient_id: Optional[UUID] = Query(None),
     doctor_id: Optional[UUID] = Query(None),
     start_date: Optional[datetime] = Query(None),
     end_date: Optional[datetime] = Query(None),
+    status_filter: Optional[List[str]] = Query(None, alias="status", description="Accepted statuses (repeatable)"),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size (all appointments if omitted)"),
+    cursor: Optional[str] = Query(None, description="Cursor returned in X-Next-Cursor by the previous page"),
+    include: Optional[str] = Query(None, description="Names returned inline, comma-separated: patient,doctor"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Récupère une liste de rendez-vous avec possibilité de filtrage"""
+    """
+    Récupère une liste de rendez-vous avec possibilité de filtrage.
+    Les rendez-vous sont triés par date ; avec limit, le curseur de la page suivante
+    est renvoyé dans l'en-tête X-Next-Cursor. Avec include=patient,doctor, les noms
+    du patient et du médecin sont renvoyés avec chaque rendez-vous (même requête).
+    """
     try:
-        use_case = GetAppointmentsUseCase(
-            appointment_repository=container.appointment_repository()
-        )
-        result = await use_case.execute(
+        use_case: GetAppointmentsUseCase = container.get_appointments_usecase()
+        page = await use_case.execute(
             patient_id=patient_id,
             doctor_id=doctor_id,
             start_date=start_date,
-            end_date=end_date
+            end_date=end_date,
+            statuses=status_filter,
+            limit=limit,
+            cursor=cursor,
+            include=[part.strip() for part in include.split(",") if part.strip()] if include else ()
         )
-        return result
+        if page.next_cursor:
+            response.headers["X-Next-Cursor"] = page.next_cursor
+        return page.items
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Erreur interne: {str(e)}")
+
+@router.get("/availability", response_model=List[DoctorAvailabilityDTO])
+async def get_availability(
+    doctor_id: List[UUID] = Query(..., description="Doctor(s) to check (repeatable)"),
+    from_: datetime = Query(..., alias="from", description="Start of the period"),
+    to: datetime = Query(..., description="End of the period"),
+    duration: int = Query(30, ge=15, le=480, description="Slot duration in minutes"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Récupère les créneaux libres d'un ou plusieurs médecins sur une période
+    (au plus 31 jours), pendant les heures d'ouverture.
+    """
+    try:
+        use_case: GetDoctorAvailabilityUseCase = container.get_doctor_availability_usecase()
+        return await use_case.execute(doctor_id, from_, to, duration_minutes=duration)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Erreur interne: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Erreur interne: {str(e)}")
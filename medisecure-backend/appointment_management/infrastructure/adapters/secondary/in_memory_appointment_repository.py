@@ -4,8 +4,12 @@ from datetime import datetime, date
 from copy import deepcopy
 
 from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
 
+# Statuts des rendez-vous qui occupent un créneau
+ACTIVE_STATUSES = ("scheduled", "confirmed")
+
 class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des rendez-vous en mémoire (pour les tests).
@@ -46,6 +50,75 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         self.appointments[appointment.id] = deepcopy(appointment)
         return deepcopy(appointment)
     
+    async def book(self, appointment: Appointment) -> Appointment:
+        """
+        Crée un rendez-vous si le créneau du médecin est libre.
+
+        La vérification et l'insertion s'exécutent sans point de suspension (aucun
+        await entre les deux) : aucune autre réservation ne peut s'intercaler, ce qui
+        rend la réservation atomique sans verrou, comme la contrainte d'exclusion du
+        repository PostgreSQL.
+        
+        Args:
+            appointment: Le rendez-vous à créer
+            
+        Returns:
+            Appointment: Le rendez-vous créé
+            
+        Raises:
+            AppointmentConflictException: Si le créneau chevauche un rendez-vous
+                actif du même médecin
+        """
+        if self._conflicts(appointment.doctor_id, appointment.start_time, appointment.end_time):
+            raise AppointmentConflictException(
+                appointment.doctor_id,
+                appointment.start_time,
+                appointment.end_time
+            )
+        self.appointments[appointment.id] = deepcopy(appointment)
+        return deepcopy(appointment)
+    
+    async def find_conflicts(
+        self,
+        doctor_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_appointment_id: Optional[UUID] = None
+    ) -> List[Appointment]:
+        """
+        Trouve les rendez-vous actifs d'un médecin qui chevauchent [start_time, end_time).
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: Le début du créneau
+            end_time: La fin du créneau
+            exclude_appointment_id: Un rendez-vous à ignorer (ex: celui reprogrammé)
+            
+        Returns:
+            List[Appointment]: Les rendez-vous en conflit
+        """
+        return [
+            deepcopy(appointment)
+            for appointment in self._conflicts(doctor_id, start_time, end_time, exclude_appointment_id)
+        ]
+    
+    def _conflicts(
+        self,
+        doctor_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        exclude_appointment_id: Optional[UUID] = None
+    ) -> List[Appointment]:
+        """Rendez-vous actifs du médecin qui chevauchent le créneau (synchrone)."""
+        return [
+            appointment for appointment in self.appointments.values()
+            if appointment.doctor_id == doctor_id
+            and appointment.id != exclude_appointment_id
+            and appointment.status in ACTIVE_STATUSES
+            and appointment.start_time < end_time
+            and start_time < appointment.end_time
+        ]
+    
     async def update(self, appointment: Appointment) -> Appointment:
         """
         Met à jour un rendez-vous existant.
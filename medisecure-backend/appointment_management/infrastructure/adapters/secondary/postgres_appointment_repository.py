@@ -1,16 +1,56 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional, Sequence, Tuple
 from uuid import UUID
 from sqlalchemy.future import select
-from sqlalchemy import and_, or_
-from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
-from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
-from appointment_management.infrastructure.models.appointment_model import AppointmentModel
+from sqlalchemy import and_, bindparam, func, text, tuple_
+from sqlalchemy.dialects.postgresql import TSRANGE
+from sqlalchemy.exc import IntegrityError
+from appointment_management.domain.entities.appointment import Appointment, ParticipantName
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from appointment_management.domain.ports.secondary.appointment_repository_port import BOOKING_LOCK, AppointmentRepositoryPort
+from appointment_management.infrastructure.models.appointment_model import (
+    ACTIVE_STATUS_PREDICATE,
+    OVERLAP_CONSTRAINT_NAME,
+    AppointmentModel
+)
+from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.models.user_model import UserModel
+from shared.infrastructure.database.advisory_lock import advisory_xact_lock
+from shared.infrastructure.database.query_registry import QueryRegistry
+
+# SQLSTATE d'une violation de contrainte d'exclusion
+EXCLUSION_VIOLATION = "23P01"
+
+def is_overlap_violation(error: IntegrityError) -> bool:
+    """Indique si une erreur d'intégrité provient de la contrainte anti-chevauchement."""
+    orig = error.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == EXCLUSION_VIOLATION or OVERLAP_CONSTRAINT_NAME in str(orig)
+
+# Requêtes fréquentes, construites une seule fois (valeurs liées à l'exécution)
+QUERIES = QueryRegistry()
+QUERIES.register("find_by_id", select(AppointmentModel).where(AppointmentModel.id == bindparam("appointment_id")))
+QUERIES.register("find_all_by_patient_id", select(AppointmentModel).where(AppointmentModel.patient_id == bindparam("patient_id")))
+QUERIES.register("find_all_by_doctor_id", select(AppointmentModel).where(AppointmentModel.doctor_id == bindparam("doctor_id")))
+# Même prédicat que l'index partiel de la contrainte d'exclusion (une seule sonde de l'index GiST)
+_CONFLICTS = select(AppointmentModel).where(
+    AppointmentModel.doctor_id == bindparam("doctor_id"),
+    text(ACTIVE_STATUS_PREDICATE),
+    AppointmentModel.period.op("&&")(func.tsrange(
+        bindparam("start_time", type_=AppointmentModel.start_time.type),
+        bindparam("end_time", type_=AppointmentModel.end_time.type),
+        "[)",
+        type_=TSRANGE
+    ))
+)
+QUERIES.register("find_conflicts", _CONFLICTS)
+QUERIES.register("find_conflicts_excluding", _CONFLICTS.where(AppointmentModel.id != bindparam("exclude_appointment_id")))
 
 class PostgreSQLAppointmentRepository(AppointmentRepositoryPort):
     """
     Adaptateur de repository pour persister les rendez-vous dans PostgreSQL
-    Implémentation asynchrone utilisant session_factory.
+    Implémentation asynchrone utilisant session_factory (un SessionScope partageant
+    la session de l'unité de travail active).
     """
     def __init__(self, session_factory):
         self.session_factory = session_factory
@@ -46,13 +86,50 @@ class PostgreSQLAppointmentRepository(AppointmentRepositoryPort):
                 )
                 session.add(model)
             
-            await session.commit()
+            # La validation est faite par l'unité de travail (ou le scope autonome)
+            await self._flush(session, appointment)
+
+    async def book(self, appointment: Appointment) -> None:
+        """
+        Insère un nouveau rendez-vous sans vérification préalable : la contrainte
+        d'exclusion appointments_no_overlap refuse atomiquement tout chevauchement,
+        y compris entre deux réservations concurrentes.
+
+        Un verrou consultatif par médecin, pris dans la transaction, met en file les
+        réservations concurrentes du même médecin jusqu'à la validation de la
+        précédente (temps d'attente : medisecure_lock_wait_seconds).
+        """
+        async with self.session_factory() as session:
+            await advisory_xact_lock(session, BOOKING_LOCK, appointment.doctor_id)
+            session.add(AppointmentModel(
+                id=appointment.id,
+                patient_id=appointment.patient_id,
+                doctor_id=appointment.doctor_id,
+                start_time=appointment.start_time,
+                end_time=appointment.end_time,
+                status=appointment.status,
+                notes=appointment.notes,
+                created_at=appointment.created_at
+            ))
+            await self._flush(session, appointment)
+
+    async def _flush(self, session, appointment: Appointment) -> None:
+        """Envoie les écritures en traduisant une violation de la contrainte anti-chevauchement."""
+        try:
+            await session.flush()
+        except IntegrityError as e:
+            if is_overlap_violation(e):
+                raise AppointmentConflictException(
+                    appointment.doctor_id,
+                    appointment.start_time,
+                    appointment.end_time
+                ) from e
+            raise
 
     async def find_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         """Trouve un rendez-vous par son ID"""
         async with self.session_factory() as session:
-            query = select(AppointmentModel).where(AppointmentModel.id == appointment_id)
-            result = await session.execute(query)
+            result = await session.execute(QUERIES["find_by_id"], {"appointment_id": appointment_id})
             model = result.scalar_one_or_none()
             
             if not model:
@@ -62,16 +139,14 @@ class PostgreSQLAppointmentRepository(AppointmentRepositoryPort):
     async def find_all_by_patient_id(self, patient_id: UUID) -> List[Appointment]:
         """Trouve tous les rendez-vous d'un patient"""
         async with self.session_factory() as session:
-            query = select(AppointmentModel).where(AppointmentModel.patient_id == patient_id)
-            result = await session.execute(query)
+            result = await session.execute(QUERIES["find_all_by_patient_id"], {"patient_id": patient_id})
             models = result.scalars().all()
             return [self._model_to_entity(model) for model in models]
 
     async def find_all_by_doctor_id(self, doctor_id: UUID) -> List[Appointment]:
         """Trouve tous les rendez-vous d'un médecin"""
         async with self.session_factory() as session:
-            query = select(AppointmentModel).where(AppointmentModel.doctor_id == doctor_id)
-            result = await session.execute(query)
+            result = await session.execute(QUERIES["find_all_by_doctor_id"], {"doctor_id": doctor_id})
             models = result.scalars().all()
             return [self._model_to_entity(model) for model in models]
 
@@ -82,35 +157,14 @@ class PostgreSQLAppointmentRepository(AppointmentRepositoryPort):
         end_time: datetime,
         exclude_appointment_id: Optional[UUID] = None
     ) -> List[Appointment]:
-        """Trouve les rendez-vous en conflit pour un médecin"""
+        """Trouve les rendez-vous en conflit pour un médecin (une seule sonde de l'index GiST)"""
         async with self.session_factory() as session:
-            query = select(AppointmentModel).where(
-                AppointmentModel.doctor_id == doctor_id,
-                # Use .value to ensure we query with strings that match the Enum definition in the model
-                AppointmentModel.status.in_([s.value for s in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]]),
-                or_(
-                    # Commence pendant un autre rendez-vous
-                    and_(
-                        AppointmentModel.start_time <= start_time,
-                        AppointmentModel.end_time > start_time
-                    ),
-                    # Termine pendant un autre rendez-vous
-                    and_(
-                        AppointmentModel.start_time < end_time,
-                        AppointmentModel.end_time >= end_time
-                    ),
-                    # Englobe complètement un autre rendez-vous
-                    and_(
-                        AppointmentModel.start_time >= start_time,
-                        AppointmentModel.end_time <= end_time
-                    )
-                )
-            )
-            
+            params = {"doctor_id": doctor_id, "start_time": start_time, "end_time": end_time}
             if exclude_appointment_id:
-                query = query.where(AppointmentModel.id != exclude_appointment_id)
-                
-            result = await session.execute(query)
+                params["exclude_appointment_id"] = exclude_appointment_id
+                result = await session.execute(QUERIES["find_conflicts_excluding"], params)
+            else:
+                result = await session.execute(QUERIES["find_conflicts"], params)
             models = result.scalars().all()
             return [self._model_to_entity(model) for model in models]
 
@@ -136,6 +190,125 @@ class PostgreSQLAppointmentRepository(AppointmentRepositoryPort):
             models = result.scalars().all()
             return [self._model_to_entity(model) for model in models]
 
+    async def find_with_filters(
+        self,
+        patient_id: Optional[UUID] = None,
+        doctor_id: Optional[UUID] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        statuses: Optional[Sequence[str]] = None,
+        limit: Optional[int] = None,
+        after: Optional[Tuple[Any, ...]] = None,
+        include: Sequence[str] = ()
+    ) -> List[Appointment]:
+        """
+        Trouve les rendez-vous filtrés, triés par (start_time, id).
+        Avec doctor_id, la requête parcourt idx_appointment_doctor_timerange
+        (doctor_id, start_time, end_time) ; avec patient_id, idx_appointment_patient_start.
+        Les noms demandés dans include sont lus par jointure dans la même requête.
+        """
+        async with self.session_factory() as session:
+            query = self._filters_query(
+                patient_id, doctor_id, start_time, end_time, statuses, limit, after, include
+            )
+            result = await session.execute(query)
+            return [self._row_to_entity(row, include) for row in result.all()]
+
+    def _filters_query(
+        self,
+        patient_id: Optional[UUID],
+        doctor_id: Optional[UUID],
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        statuses: Optional[Sequence[str]],
+        limit: Optional[int],
+        after: Optional[Tuple[Any, ...]],
+        include: Sequence[str]
+    ):
+        """
+        Construit la requête de find_with_filters.
+
+        Seuls l'ID et le nom des participants sont lus (jointures sur les clés
+        étrangères, jamais vides) : pas de données médicales du patient.
+
+        Returns:
+            Select: La requête (rendez-vous, puis colonnes des noms demandés)
+        """
+        conditions = []
+        if patient_id:
+            conditions.append(AppointmentModel.patient_id == patient_id)
+        if doctor_id:
+            conditions.append(AppointmentModel.doctor_id == doctor_id)
+        if start_time:
+            conditions.append(AppointmentModel.start_time >= start_time)
+        if end_time:
+            conditions.append(AppointmentModel.end_time <= end_time)
+            # Redondant (end_time > start_time) mais borne le parcours de l'index sur start_time
+            conditions.append(AppointmentModel.start_time < end_time)
+        if statuses:
+            conditions.append(AppointmentModel.status.in_(list(statuses)))
+        if after is not None:
+            conditions.append(
+                tuple_(AppointmentModel.start_time, AppointmentModel.id) > tuple_(*after)
+            )
+
+        query = select(AppointmentModel)
+        if "patient" in include:
+            query = query.add_columns(
+                PatientModel.first_name.label("patient_first_name"),
+                PatientModel.last_name.label("patient_last_name")
+            ).join(AppointmentModel.patient)
+        if "doctor" in include:
+            query = query.add_columns(
+                UserModel.first_name.label("doctor_first_name"),
+                UserModel.last_name.label("doctor_last_name")
+            ).join(AppointmentModel.doctor)
+        if conditions:
+            query = query.where(and_(*conditions))
+        query = query.order_by(AppointmentModel.start_time, AppointmentModel.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
+
+    def _row_to_entity(self, row, include: Sequence[str]) -> Appointment:
+        """Convertit une ligne de _filters_query en entité, avec les noms demandés"""
+        model = row[0]
+        appointment = self._model_to_entity(model)
+        if "patient" in include:
+            appointment.patient = ParticipantName(
+                model.patient_id, row.patient_first_name, row.patient_last_name
+            )
+        if "doctor" in include:
+            appointment.doctor = ParticipantName(
+                model.doctor_id, row.doctor_first_name, row.doctor_last_name
+            )
+        return appointment
+
+    async def find_active_in_range(
+        self,
+        doctor_ids: Sequence[UUID],
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Appointment]:
+        """
+        Trouve les rendez-vous actifs chevauchant la plage, y compris ceux qui débutent
+        avant elle. Même prédicat que la contrainte d'exclusion : la requête est servie
+        par son index GiST (doctor_id, period).
+        """
+        if not doctor_ids:
+            return []
+        async with self.session_factory() as session:
+            requested_period = func.tsrange(start_time, end_time, "[)", type_=TSRANGE)
+            query = select(AppointmentModel).where(
+                AppointmentModel.doctor_id.in_(list(doctor_ids)),
+                text(ACTIVE_STATUS_PREDICATE),
+                AppointmentModel.period.op("&&")(requested_period)
+            ).order_by(AppointmentModel.doctor_id, AppointmentModel.start_time)
+            
+            result = await session.execute(query)
+            models = result.scalars().all()
+            return [self._model_to_entity(model) for model in models]
+
     def _model_to_entity(self, model: AppointmentModel) -> Appointment:
         """Convertit un modèle SQLAlchemy en entité du domaine"""
         return Appointment(
@@ -7,6 +7,7 @@ from appointment_management.domain.ports.secondary.notification_port import Noti
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
 from shared.ports.secondary.mailer_protocol import MailerProtocol
+from shared.application.concurrency.task_group import run_concurrently
 
 class SmtpNotificationAdapter(NotificationPort):
     """
@@ -25,6 +26,19 @@ class SmtpNotificationAdapter(NotificationPort):
         self.user_repository = user_repository
         self.frontend_url = os.getenv("FRONTEND_URL", "http://localhost:3000")
 
+    async def _load_participants(self, patient_id: UUID, doctor_id: UUID):
+        """
+        Charge le patient et le médecin.
+
+        Pendant la transaction du rendez-vous, les deux lectures se font l'une après
+        l'autre sur sa session : aucune autre connexion n'est demandée au pool alors
+        que la transaction détient la sienne et le verrou de réservation.
+        """
+        return await run_concurrently(
+            self.patient_repository.get_by_id(patient_id),
+            self.user_repository.get_by_id(doctor_id)
+        )
+
     async def send_appointment_created(
         self, 
         patient_id: UUID, 
@@ -34,8 +48,7 @@ class SmtpNotificationAdapter(NotificationPort):
     ) -> None:
         """Notifie de la création d'un rendez-vous"""
         # Récupération des informations
-        patient = await self.patient_repository.get_by_id(patient_id)
-        doctor = await self.user_repository.get_by_id(doctor_id)
+        patient, doctor = await self._load_participants(patient_id, doctor_id)
 
         if not patient or not patient.email:
             # Log warning: patient not found or no email
@@ -74,8 +87,7 @@ class SmtpNotificationAdapter(NotificationPort):
         cancel_reason: str
     ) -> None:
         """Notifie de l'annulation d'un rendez-vous"""
-        patient = await self.patient_repository.get_by_id(patient_id)
-        doctor = await self.user_repository.get_by_id(doctor_id)
+        patient, doctor = await self._load_participants(patient_id, doctor_id)
 
         if not patient or not patient.email:
             return
@@ -12,15 +12,20 @@ from sqlalchemy.ext.declarative import declarative_base
 # unless I find a better place. Ideally it should share the same metadata.
 # I will check `shared` later, but for now I follow the prompt snippet exactly.
 
-from sqlalchemy import Column, String, DateTime, Text, Index, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, DateTime, Text, Index, ForeignKey, Enum, Computed, text
+from sqlalchemy.orm import relationship, deferred
 from shared.infrastructure.database.connection import Base
 
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, TSRANGE, ExcludeConstraint
 from appointment_management.domain.entities.appointment import AppointmentStatus
 
 # ... existing imports ...
 
+# Statuts soumis à la contrainte d'exclusion. Les requêtes reprennent ce prédicat à
+# l'identique pour que PostgreSQL puisse utiliser l'index GiST partiel de la contrainte.
+ACTIVE_STATUS_PREDICATE = "status IN ('scheduled', 'confirmed')"
+OVERLAP_CONSTRAINT_NAME = "appointments_no_overlap"
+
 class AppointmentModel(Base):
     """Modèle SQLAlchemy pour les rendez-vous"""
     __tablename__ = "appointments"
@@ -36,11 +41,25 @@ class AppointmentModel(Base):
     status = Column(Enum("scheduled", "confirmed", "cancelled", "completed", "missed", name="appointmentstatus"), nullable=False, default="scheduled")
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime, nullable=False, default=datetime.now)
+    
+    # Plage horaire [start_time, end_time) calculée par PostgreSQL (colonne générée),
+    # utilisée dans les requêtes mais jamais chargée avec les rendez-vous
+    period = deferred(Column(TSRANGE, Computed("tsrange(start_time, end_time, '[)')", persisted=True)))
 
     # Indexation pour optimiser les requêtes fréquentes
     __table_args__ = (
+        # Aucun chevauchement entre rendez-vous actifs d'un même médecin (index GiST, extension btree_gist)
+        ExcludeConstraint(
+            (doctor_id, "="),
+            (period, "&&"),
+            name=OVERLAP_CONSTRAINT_NAME,
+            using="gist",
+            where=text(ACTIVE_STATUS_PREDICATE)
+        ),
         # Index pour la recherche des conflits (doctor + plage horaire)
         Index("idx_appointment_doctor_timerange", doctor_id, start_time, end_time),
+        # Index pour les rendez-vous d'un patient triés par date
+        Index("idx_appointment_patient_start", patient_id, start_time),
         # Index pour la recherche de rendez-vous par statut
         Index("idx_appointment_status", status),
     )
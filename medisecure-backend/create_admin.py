@@ -25,7 +25,7 @@ def create_admin_user():
         admin_id = uuid.uuid4()
         
         # Générer le hash du mot de passe
-        hashed_password = authenticator.get_password_hash(admin_password)
+        hashed_password = authenticator.password_hasher.hash_sync(admin_password)
         
         # Créer l'utilisateur admin
         admin_user = UserModel(
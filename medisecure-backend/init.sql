@@ -59,6 +59,9 @@ CREATE TABLE patients (
     is_active BOOLEAN DEFAULT TRUE
 );
 
+-- Égalité sur doctor_id (uuid) dans l'index GiST de la contrainte d'exclusion
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
 -- Création de la table appointments
 CREATE TABLE appointments (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid (),
@@ -72,7 +75,27 @@ CREATE TABLE appointments (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     is_active BOOLEAN DEFAULT TRUE,
-    CONSTRAINT check_appointment_times CHECK (end_time > start_time)
+    -- Plage horaire demi-ouverte [start_time, end_time)
+    period TSRANGE GENERATED ALWAYS AS (tsrange(start_time, end_time, '[)')) STORED,
+    CONSTRAINT check_appointment_times CHECK (end_time > start_time),
+    -- Aucun chevauchement entre rendez-vous actifs d'un même médecin
+    CONSTRAINT appointments_no_overlap EXCLUDE USING gist (doctor_id WITH =, period WITH &&)
+        WHERE (status IN ('scheduled', 'confirmed'))
+);
+
+-- Boîte d'envoi transactionnelle des emails (outbox), vidée par l'EmailOutboxWorker
+CREATE TABLE email_outbox (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid (),
+    sender VARCHAR NOT NULL,
+    recipients VARCHAR[] NOT NULL,
+    raw_message TEXT NOT NULL,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    created_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    sent_at TIMESTAMPTZ,
+    lease_expires_at TIMESTAMPTZ
 );
 
 -- Création des index pour améliorer les performances
@@ -82,14 +105,45 @@ CREATE INDEX idx_patients_email ON patients (email);
 
 CREATE INDEX idx_patients_user_id ON patients (user_id);
 
+-- Index composites pour la pagination par curseur des patients
+CREATE INDEX idx_patients_last_name_id ON patients (last_name, id);
+
+CREATE INDEX idx_patients_created_at_id ON patients (created_at, id);
+
+-- Recherche par nom sans accents (pg_trgm + unaccent)
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- unaccent() n'est pas IMMUTABLE : ce wrapper permet de l'utiliser dans un index
+CREATE OR REPLACE FUNCTION f_unaccent(text)
+RETURNS text
+LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT
+AS $$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+
+CREATE INDEX idx_patients_first_name_trgm ON patients USING gin (f_unaccent(lower(first_name)) gin_trgm_ops);
+
+CREATE INDEX idx_patients_last_name_trgm ON patients USING gin (f_unaccent(lower(last_name)) gin_trgm_ops);
+
+CREATE INDEX idx_patients_phone_number_trgm ON patients USING gin (phone_number gin_trgm_ops);
+
 CREATE INDEX idx_appointments_patient_id ON appointments (patient_id);
 
 CREATE INDEX idx_appointments_doctor_id ON appointments (doctor_id);
 
 CREATE INDEX idx_appointments_start_time ON appointments (start_time);
 
+-- Index composites pour les listes filtrées et paginées par (start_time, id)
+CREATE INDEX idx_appointment_doctor_timerange ON appointments (doctor_id, start_time, end_time);
+
+CREATE INDEX idx_appointment_patient_start ON appointments (patient_id, start_time);
+
 CREATE INDEX idx_appointments_status ON appointments (status);
 
+-- File d'attente du worker des emails : uniquement les messages en attente
+CREATE INDEX idx_email_outbox_pending ON email_outbox (next_attempt_at) WHERE status = 'pending';
+CREATE INDEX idx_email_outbox_leased ON email_outbox (lease_expires_at) WHERE status = 'sending';
+
 -- Création des triggers pour mettre à jour updated_at
 CREATE OR REPLACE FUNCTION update_updated_at()
 RETURNS TRIGGER AS $$
@@ -1,9 +1,11 @@
 # medisecure-backend/patient_management/application/dtos/patient_dtos.py
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Literal, Union
 from pydantic import BaseModel, EmailStr, Field, validator
 from datetime import date, datetime
 from uuid import UUID
 
+from shared.application.mapping.response_mapper import ResponseMapper
+
 # DTOs pour la création et la mise à jour de patients
 class PatientCreateDTO(BaseModel):
     """DTO pour la création d'un patient"""
@@ -120,12 +122,35 @@ class PatientResponseDTO(BaseModel):
     class Config:
         orm_mode = True
 
+# Conversion entité → réponse : le DTO est construit directement à partir des attributs
+to_patient_response = ResponseMapper(PatientResponseDTO)
+
+class PatientSummaryDTO(BaseModel):
+    """DTO pour la vue résumée d'un patient dans les listes (fields=summary)"""
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    email: Optional[str] = None
+    phone_number: Optional[str] = None
+    insurance_id: Optional[str] = None
+    created_at: datetime
+    is_active: bool
+    
+    class Config:
+        orm_mode = True
+
+to_patient_summary = ResponseMapper(PatientSummaryDTO)
+
 class PatientListResponseDTO(BaseModel):
     """DTO pour la réponse avec une liste de patients"""
-    patients: List[PatientResponseDTO]
-    total: int
+    patients: List[Union[PatientResponseDTO, PatientSummaryDTO]]  # Selon la projection demandée (fields)
+    total: Optional[int] = None  # None si le comptage n'a pas été demandé (count=none)
+    total_estimated: bool = False  # True si total est une estimation (count=estimated)
     skip: int
     limit: int
+    next_cursor: Optional[str] = None  # Curseur opaque de la page suivante (pagination par curseur)
 
 # DTOs pour la recherche
 class PatientSearchDTO(BaseModel):
@@ -135,4 +160,28 @@ class PatientSearchDTO(BaseModel):
     email: Optional[EmailStr] = None
     phone: Optional[str] = None
     skip: int = 0
-    limit: int = 100
\ No newline at end of file
+    limit: int = 100
+    
+    # Pagination par curseur (le mode décalage reste le mode par défaut)
+    pagination: Literal["offset", "cursor"] = "offset"
+    cursor: Optional[str] = None
+    order_by: Literal["name", "created_at"] = "name"
+    
+    # Projection : tous les champs (par défaut) ou vue résumée sans données médicales
+    fields: Literal["summary", "full"] = "full"
+    
+    # Comptage du total : exact par défaut en mode décalage, aucun en mode curseur
+    count: Optional[Literal["exact", "estimated", "none"]] = None
+
+# DTOs pour l'import en masse
+class PatientImportErrorDTO(BaseModel):
+    """DTO pour les erreurs d'une ligne de l'import en masse"""
+    row: int  # Numéro de l'enregistrement dans le fichier (à partir de 1, en-tête CSV exclu)
+    errors: List[str]
+
+class PatientImportReportDTO(BaseModel):
+    """DTO pour le rapport d'un import en masse"""
+    total_rows: int
+    imported: int
+    failed: int
+    errors: List[PatientImportErrorDTO] = []
@@ -7,7 +7,7 @@ from patient_management.domain.entities.patient import Patient
 from patient_management.domain.services.patient_service import PatientService
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientAlreadyExistsException
-from patient_management.application.dtos.patient_dtos import PatientCreateDTO, PatientResponseDTO
+from patient_management.application.dtos.patient_dtos import PatientCreateDTO, PatientResponseDTO, to_patient_response
 from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
 
 class CreatePatientFolderUseCase:
@@ -97,29 +97,4 @@ class CreatePatientFolderUseCase:
         created_patient = await self.patient_repository.create(patient)
         
         # Convertir l'entité en DTO de réponse
-        return PatientResponseDTO(
-            id=created_patient.id,
-            first_name=created_patient.first_name,
-            last_name=created_patient.last_name,
-            date_of_birth=created_patient.date_of_birth,
-            gender=created_patient.gender,
-            address=created_patient.address,
-            city=created_patient.city,
-            postal_code=created_patient.postal_code,
-            country=created_patient.country,
-            phone_number=created_patient.phone_number,
-            email=created_patient.email,
-            blood_type=created_patient.blood_type,
-            allergies=created_patient.allergies,
-            chronic_diseases=created_patient.chronic_diseases,
-            current_medications=created_patient.current_medications,
-            has_consent=created_patient.has_consent,
-            gdpr_consent=created_patient.gdpr_consent,
-            consent_date=created_patient.consent_date,
-            insurance_provider=created_patient.insurance_provider,
-            insurance_id=created_patient.insurance_id,
-            notes=created_patient.notes,
-            created_at=created_patient.created_at,
-            updated_at=created_patient.updated_at,
-            is_active=created_patient.is_active
-        )
\ No newline at end of file
+        return to_patient_response(created_patient)
\ No newline at end of file
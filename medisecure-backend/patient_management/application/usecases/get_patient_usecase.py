@@ -5,7 +5,7 @@ from patient_management.domain.entities.patient import Patient
 from patient_management.domain.services.patient_service import PatientService
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
-from patient_management.application.dtos.patient_dtos import PatientResponseDTO
+from patient_management.application.dtos.patient_dtos import PatientResponseDTO, to_patient_response
 
 class GetPatientUseCase:
     """
@@ -53,29 +53,4 @@ class GetPatientUseCase:
         self.patient_service.check_access_permission(patient, user_id)
         
         # Convertir l'entité en DTO de réponse
-        return PatientResponseDTO(
-            id=patient.id,
-            first_name=patient.first_name,
-            last_name=patient.last_name,
-            date_of_birth=patient.date_of_birth,
-            gender=patient.gender,
-            address=patient.address,
-            city=patient.city,
-            postal_code=patient.postal_code,
-            country=patient.country,
-            phone_number=patient.phone_number,
-            email=patient.email,
-            blood_type=patient.blood_type,
-            allergies=patient.allergies,
-            chronic_diseases=patient.chronic_diseases,
-            current_medications=patient.current_medications,
-            has_consent=patient.has_consent,
-            gdpr_consent=patient.gdpr_consent,
-            consent_date=patient.consent_date,
-            insurance_provider=patient.insurance_provider,
-            insurance_id=patient.insurance_id,
-            notes=patient.notes,
-            created_at=patient.created_at,
-            updated_at=patient.updated_at,
-            is_active=patient.is_active
-        )
\ No newline at end of file
+        return to_patient_response(patient)
\ No newline at end of file
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import Any, AsyncIterable, Dict, List, Optional, Set, Tuple
+import logging
+
+from pydantic import ValidationError
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.exceptions.patient_exceptions import (
+    MissingGuardianConsentException,
+    MissingRequiredFieldException,
+    PatientAlreadyExistsException
+)
+from patient_management.application.dtos.patient_dtos import (
+    PatientCreateDTO,
+    PatientImportErrorDTO,
+    PatientImportReportDTO
+)
+from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+@dataclass
+class PatientImportRow:
+    """
+    Enregistrement lu dans un fichier d'import.
+    error est renseigné lorsque l'enregistrement n'a pas pu être lu (data vaut alors None).
+    """
+    row: int
+    data: Optional[Dict[str, Any]]
+    error: Optional[str] = None
+
+class ImportPatientsUseCase:
+    """
+    Cas d'utilisation pour l'import en masse de patients.
+
+    Les enregistrements sont validés un par un (mêmes règles que la création d'un
+    dossier), puis écrits par lots : une seule requête de vérification des emails et
+    une seule écriture (COPY) par lot. Les lignes invalides sont écartées et décrites
+    dans le rapport, les autres sont importées.
+    """
+
+    def __init__(
+        self,
+        patient_repository: PatientRepositoryProtocol,
+        patient_service: PatientService,
+        id_generator: IdGeneratorProtocol,
+        batch_size: int = 1000
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+
+        Args:
+            patient_repository: Le repository des patients
+            patient_service: Le service du domaine pour les patients
+            id_generator: Le générateur d'identifiants
+            batch_size: Le nombre de patients écrits par lot
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.patient_repository = patient_repository
+        self.patient_service = patient_service
+        self.id_generator = id_generator
+        self.batch_size = batch_size
+
+    async def execute(self, rows: AsyncIterable[PatientImportRow]) -> PatientImportReportDTO:
+        """
+        Exécute le cas d'utilisation.
+
+        Args:
+            rows: Les enregistrements à importer, lus au fil de l'eau
+
+        Returns:
+            PatientImportReportDTO: Le rapport d'import (erreurs par ligne)
+        """
+        total_rows = 0
+        imported = 0
+        errors: List[PatientImportErrorDTO] = []
+        seen_emails: Set[str] = set()
+        batch: List[Tuple[int, Patient]] = []
+
+        async for import_row in rows:
+            total_rows += 1
+            patient, row_errors = self._validate(import_row)
+
+            # Doublon à l'intérieur du fichier : la première occurrence est conservée
+            if patient is not None and patient.email:
+                if patient.email in seen_emails:
+                    patient, row_errors = None, [f"Duplicate email {patient.email} in import"]
+                else:
+                    seen_emails.add(patient.email)
+
+            if patient is None:
+                errors.append(PatientImportErrorDTO(row=import_row.row, errors=row_errors))
+                continue
+
+            batch.append((import_row.row, patient))
+            if len(batch) >= self.batch_size:
+                imported += await self._write_batch(batch, errors)
+                batch = []
+
+        if batch:
+            imported += await self._write_batch(batch, errors)
+
+        errors.sort(key=lambda error: error.row)
+        logger.info("Import de patients terminé: %s importés, %s rejetés sur %s", imported, len(errors), total_rows)
+        return PatientImportReportDTO(
+            total_rows=total_rows,
+            imported=imported,
+            failed=len(errors),
+            errors=errors
+        )
+
+    async def _write_batch(
+        self,
+        batch: List[Tuple[int, Patient]],
+        errors: List[PatientImportErrorDTO]
+    ) -> int:
+        """
+        Écarte les patients dont l'email existe déjà, puis écrit le reste du lot.
+
+        Args:
+            batch: Les patients validés du lot, avec leur numéro de ligne
+            errors: Le rapport d'erreurs, complété pour les emails existants
+
+        Returns:
+            int: Le nombre de patients écrits
+        """
+        existing_emails = await self.patient_repository.find_existing_emails(
+            patient.email for _, patient in batch if patient.email
+        )
+
+        patients = []
+        for row, patient in batch:
+            if patient.email in existing_emails:
+                message = str(PatientAlreadyExistsException("email", patient.email))
+                errors.append(PatientImportErrorDTO(row=row, errors=[message]))
+            else:
+                patients.append(patient)
+
+        return await self.patient_repository.bulk_create(patients)
+
+    def _validate(self, import_row: PatientImportRow) -> Tuple[Optional[Patient], List[str]]:
+        """
+        Valide un enregistrement et construit l'entité correspondante.
+
+        Args:
+            import_row: L'enregistrement à valider
+
+        Returns:
+            Tuple[Optional[Patient], List[str]]: Le patient, ou None et les erreurs
+        """
+        if import_row.error is not None:
+            return None, [import_row.error]
+
+        try:
+            data = PatientCreateDTO(**import_row.data)
+        except ValidationError as e:
+            return None, [
+                f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+                for error in e.errors()
+            ]
+
+        try:
+            self.patient_service.validate_patient_data(
+                data.first_name,
+                data.last_name,
+                data.date_of_birth,
+                data.gender
+            )
+
+            patient = Patient(
+                id=self.id_generator.generate_id(),
+                first_name=data.first_name,
+                last_name=data.last_name,
+                date_of_birth=data.date_of_birth,
+                gender=data.gender,
+                address=data.address,
+                city=data.city,
+                postal_code=data.postal_code,
+                country=data.country,
+                phone_number=data.phone_number,
+                email=data.email,
+                blood_type=data.blood_type,
+                allergies=data.allergies or {},
+                chronic_diseases=data.chronic_diseases or {},
+                current_medications=data.current_medications or {},
+                has_consent=data.has_consent,
+                gdpr_consent=data.gdpr_consent,
+                insurance_provider=data.insurance_provider,
+                insurance_id=data.insurance_id,
+                notes=data.notes
+            )
+
+            self.patient_service.check_consent_for_minor(patient, data.has_guardian_consent)
+        except (MissingRequiredFieldException, MissingGuardianConsentException, ValueError) as e:
+            return None, [str(e)]
+
+        return patient, []
@@ -0,0 +1,44 @@
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Optional
+from uuid import UUID
+
+from patient_management.domain.entities.patient import Patient
+
+@dataclass(frozen=True)
+class PatientSummary:
+    """
+    Vue résumée d'un patient pour les listes et recherches.
+    Ne contient que l'identité et les coordonnées : ni données médicales, ni notes.
+    """
+    id: UUID
+    first_name: str
+    last_name: str
+    date_of_birth: date
+    gender: str
+    email: Optional[str]
+    phone_number: Optional[str]
+    insurance_id: Optional[str]
+    created_at: datetime
+    is_active: bool
+    
+    @property
+    def full_name(self) -> str:
+        """Retourne le nom complet du patient"""
+        return f"{self.first_name} {self.last_name}"
+    
+    @classmethod
+    def from_patient(cls, patient: Patient) -> "PatientSummary":
+        """Construit la vue résumée d'un patient complet"""
+        return cls(
+            id=patient.id,
+            first_name=patient.first_name,
+            last_name=patient.last_name,
+            date_of_birth=patient.date_of_birth,
+            gender=patient.gender,
+            email=patient.email,
+            phone_number=patient.phone_number,
+            insurance_id=patient.insurance_id,
+            created_at=patient.created_at,
+            is_active=patient.is_active
+        )
@@ -1,9 +1,41 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List 
+from typing import Optional, List, Dict, Tuple, Any, Iterable, Set, AsyncIterator, Union
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+
+# Ordres de tri stables utilisables pour la pagination par curseur.
+# L'id complète chaque clé pour la rendre unique (aucun patient sauté ni répété).
+PATIENT_SORT_ORDERS = ("name", "created_at")
+
+# Types des valeurs de la clé de tri de chaque ordre (voir patient_sort_key)
+PATIENT_SORT_KEY_TYPES = {
+    "name": (str, UUID),
+    "created_at": (datetime, UUID)
+}
+
+# Projections des listes et recherches : "full" (Patient) ou "summary" (PatientSummary,
+# sans les colonnes JSONB ni les notes)
+PATIENT_FIELDS = ("summary", "full")
+
+def patient_sort_key(patient: Union[Patient, PatientSummary], order_by: str) -> Tuple[Any, ...]:
+    """
+    Retourne la clé de tri d'un patient pour un ordre donné.
+    
+    Args:
+        patient: Le patient
+        order_by: L'ordre de tri ("name" ou "created_at")
+        
+    Returns:
+        Tuple[Any, ...]: (last_name, id) ou (created_at, id)
+    """
+    if order_by == "name":
+        return (patient.last_name, patient.id)
+    if order_by == "created_at":
+        return (patient.created_at, patient.id)
+    raise ValueError(f"Unknown sort order: {order_by}")
 
 class PatientRepositoryProtocol(ABC):
     """
@@ -24,6 +56,19 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_many(self, patient_ids: Iterable[UUID]) -> Dict[UUID, Patient]:
+        """
+        Récupère plusieurs patients par leurs IDs (une seule requête pour tout le lot).
+        
+        Args:
+            patient_ids: Les IDs des patients à récupérer
+            
+        Returns:
+            Dict[UUID, Patient]: Les patients trouvés, indexés par ID (les IDs inconnus sont absents)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[Patient]:
         """
@@ -50,6 +95,34 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients en une seule opération d'écriture.
+        Les patients doivent avoir été validés au préalable (aucune vérification ici).
+        
+        Args:
+            patients: Les patients à créer
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        pass
+    
+    @abstractmethod
+    async def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Retourne, parmi les emails donnés, ceux déjà utilisés par un patient
+        (une seule requête pour tout le lot).
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà existants
+        """
+        pass
+    
     @abstractmethod
     async def update(self, patient: Patient) -> Patient:
         """
@@ -77,16 +150,44 @@ class PatientRepositoryProtocol(ABC):
         pass
     
     @abstractmethod
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         """
         Liste tous les patients avec pagination.
         
+        Sans order_by, la pagination se fait par décalage (skip). Avec order_by,
+        elle se fait par curseur : les patients sont triés selon patient_sort_key
+        et seuls ceux dont la clé est strictement supérieure à `after` sont retournés.
+        
         Args:
-            skip: Le nombre de patients à sauter
+            skip: Le nombre de patients à sauter (pagination par décalage)
             limit: Le nombre maximum de patients à retourner
+            after: La clé de tri du dernier patient de la page précédente
+            order_by: L'ordre de tri stable (voir PATIENT_SORT_ORDERS)
+            fields: La projection (voir PATIENT_FIELDS)
+            
+        Returns:
+            List: La liste des patients (PatientSummary si fields="summary")
+        """
+        pass
+    
+    @abstractmethod
+    def stream_all(self, order_by: str = "name", batch_size: int = 1000) -> AsyncIterator[Patient]:
+        """
+        Parcourt tous les patients en flux (ex: export), sans les charger tous en mémoire.
+        
+        Args:
+            order_by: L'ordre de tri stable (voir PATIENT_SORT_ORDERS)
+            batch_size: Le nombre de patients lus à la fois
             
         Returns:
-            List[Patient]: La liste des patients
+            AsyncIterator[Patient]: Les patients, dans l'ordre demandé
         """
         pass
     
@@ -98,21 +199,54 @@ class PatientRepositoryProtocol(ABC):
         email: Optional[str] = None,
         phone: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Patient]:
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         """
         Recherche des patients selon différents critères.
         
+        La recherche par nom ignore la casse et les accents. En pagination par décalage,
+        les résultats d'une recherche par nom sont classés par pertinence.
+        
         Args:
             name: Le nom ou prénom du patient (recherche partielle)
             date_of_birth: La date de naissance du patient
             email: L'email du patient (recherche exacte)
             phone: Le numéro de téléphone du patient (recherche partielle)
-            skip: Le nombre de patients à sauter
+            skip: Le nombre de patients à sauter (pagination par décalage)
             limit: Le nombre maximum de patients à retourner
+            after: La clé de tri du dernier patient de la page précédente
+            order_by: L'ordre de tri stable pour la pagination par curseur
+            fields: La projection (voir PATIENT_FIELDS)
             
         Returns:
-            List[Patient]: La liste des patients correspondant aux critères
+            List: La liste des patients correspondant aux critères (PatientSummary si fields="summary")
+        """
+        pass
+    
+    @abstractmethod
+    async def search_with_total(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> Tuple[List[Union[Patient, PatientSummary]], int]:
+        """
+        Recherche des patients et compte exactement tous ceux qui correspondent aux critères.
+        
+        Args:
+            Les mêmes que search
+            
+        Returns:
+            Tuple[List, int]: La page de patients et le total (toutes pages confondues)
         """
         pass
     
@@ -124,4 +258,14 @@ class PatientRepositoryProtocol(ABC):
         Returns:
             int: Le nombre total de patients
         """
+        pass
+    
+    @abstractmethod
+    async def estimate_count(self) -> int:
+        """
+        Estime rapidement le nombre total de patients (sans parcourir la table).
+        
+        Returns:
+            int: Le nombre approximatif de patients
+        """
         pass
\ No newline at end of file
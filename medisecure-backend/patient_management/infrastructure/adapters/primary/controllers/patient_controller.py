@@ -1,22 +1,41 @@
 # medisecure-backend/patient_management/infrastructure/adapters/primary/controllers/patient_controller.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal, Tuple
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Request, status
+from fastapi.responses import StreamingResponse
 from datetime import date
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
-from shared.container.container import Container
+from shared.container.container import Container, get_container, get_unit_of_work
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+from shared.application.pagination.counting import CachedCounter, CountResult
+from shared.application.concurrency.task_group import run_concurrently
+from shared.application.pagination.keyset import (
+    InvalidCursorException,
+    build_keyset_page,
+    decode_cursor
+)
 from patient_management.application.dtos.patient_dtos import (
     PatientCreateDTO,
     PatientUpdateDTO,
     PatientResponseDTO,
     PatientListResponseDTO,
-    PatientSearchDTO
+    PatientSearchDTO,
+    PatientImportReportDTO,
+    to_patient_response,
+    to_patient_summary
 )
 from patient_management.application.usecases.create_patient_folder_usecase import CreatePatientFolderUseCase
 from patient_management.application.usecases.update_patient_usecase import UpdatePatientUseCase
 from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.infrastructure.adapters.primary.patient_import_parser import (
+    parse_patient_rows,
+    resolve_import_format
+)
+from patient_management.infrastructure.adapters.primary.patient_export_writer import MEDIA_TYPES, write_patients
+from patient_management.domain.ports.secondary.patient_repository_protocol import PATIENT_SORT_KEY_TYPES, patient_sort_key
 from patient_management.domain.exceptions.patient_exceptions import (
     PatientNotFoundException,
     PatientAlreadyExistsException,
@@ -53,17 +72,44 @@ def check_role_permission(role: str, allowed_roles: list) -> bool:
     return role_lower in allowed_roles_lower
 
 
-def get_container():
+def resolve_keyset(
+    pagination: str,
+    cursor: Optional[str],
+    order_by: str
+) -> Tuple[bool, Optional[Tuple[Any, ...]]]:
     """
-    Fournit le container d'injection de dépendances.
+    Détermine le mode de pagination demandé.
+    
+    Args:
+        pagination: Le mode demandé ("offset" ou "cursor")
+        cursor: Le curseur opaque reçu (implique le mode curseur)
+        order_by: L'ordre de tri de la pagination par curseur
+        
+    Returns:
+        Tuple[bool, Optional[Tuple]]: (mode curseur, clé de tri de départ)
+        
+    Raises:
+        HTTPException: Si le curseur est invalide
     """
-    return Container()
+    if pagination != "cursor" and not cursor:
+        return False, None
+    if not cursor:
+        return True, None
+    try:
+        return True, decode_cursor(cursor, order_by, PATIENT_SORT_KEY_TYPES[order_by]).values
+    except InvalidCursorException as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
 
 @router.post("/", response_model=PatientResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_patient(
     data: PatientCreateDTO,
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
-    container: Container = Depends(get_container)
+    container: Container = Depends(get_container),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Crée un nouveau dossier patient.
@@ -72,6 +118,7 @@ async def create_patient(
         data: Les données pour la création du patient
         token_payload: Les informations du token JWT
         container: Le container d'injection de dépendances
+        unit_of_work: L'unité de travail de la requête
         
     Returns:
         PatientResponseDTO: Le patient créé
@@ -91,59 +138,177 @@ async def create_patient(
             )
         
         # Log des données reçues
-        logger.info(f"Création d'un nouveau patient avec les données: {data}")
+        logger.debug("Création d'un nouveau patient avec les données: %s", data)
         
         # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = CreatePatientFolderUseCase(
-            patient_repository=container.patient_repository(),
-            patient_service=container.patient_service(),
-            id_generator=container.id_generator()
-        )
+        use_case: CreatePatientFolderUseCase = container.create_patient_folder_usecase()
         
-        # Exécuter le cas d'utilisation
+        # Exécuter le cas d'utilisation (une seule connexion et transaction)
         try:
-            result = await use_case.execute(data)
-            logger.info(f"Patient créé avec succès: {result.id}")
+            async with unit_of_work:
+                result = await use_case.execute(data)
+            logger.info("Patient créé avec succès: %s", result.id)
             return result
         except Exception as e:
-            logger.error(f"Erreur pendant l'exécution du cas d'utilisation: {str(e)}")
+            logger.error("Erreur pendant l'exécution du cas d'utilisation: %s", e)
             raise
     
     except PatientAlreadyExistsException as e:
-        logger.error(f"Patient déjà existant: {str(e)}")
+        logger.error("Patient déjà existant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     
     except MissingRequiredFieldException as e:
-        logger.error(f"Champ requis manquant: {str(e)}")
+        logger.error("Champ requis manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except MissingGuardianConsentException as e:
-        logger.error(f"Consentement du tuteur manquant: {str(e)}")
+        logger.error("Consentement du tuteur manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la création du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la création du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
+@router.post("/bulk", response_model=PatientImportReportDTO)
+async def import_patients(
+    request: Request,
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
+):
+    """
+    Importe des patients en masse.
+    
+    Le corps est un fichier NDJSON (Content-Type: application/x-ndjson, un objet par
+    ligne) ou CSV (Content-Type: text/csv, en-tête avec les noms des champs), avec les
+    mêmes champs que la création d'un patient. Il est lu en flux et écrit par lots.
+    Les lignes invalides sont rejetées et décrites dans le rapport, les autres sont
+    importées (une seule transaction pour tout l'import).
+    
+    Args:
+        request: La requête HTTP (corps lu en flux)
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+        unit_of_work: L'unité de travail de la requête
+        
+    Returns:
+        PatientImportReportDTO: Le rapport d'import
+        
+    Raises:
+        HTTPException: En cas d'erreur
+    """
+    try:
+        # Mêmes droits que la création d'un patient
+        user_role = token_payload.get("role", "").lower()
+        allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to create patient folders"
+            )
+        
+        import_format = resolve_import_format(request.headers.get("content-type"))
+        if import_format is None:
+            raise HTTPException(
+                status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+                detail="Supported content types: application/x-ndjson, text/csv"
+            )
+        
+        logger.info("Import en masse de patients (%s)", import_format)
+        
+        use_case: ImportPatientsUseCase = container.import_patients_usecase()
+        
+        async with unit_of_work:
+            report = await use_case.execute(parse_patient_rows(request.stream(), import_format))
+        
+        logger.info("Import terminé: %s patients importés, %s lignes rejetées", report.imported, report.failed)
+        return report
+    
+    except HTTPException:
+        raise
+    
+    except ValueError as e:
+        logger.error("Fichier d'import invalide: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.exception("Erreur inattendue lors de l'import des patients: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+# Déclaré avant /{patient_id} : "export" ne doit pas être lu comme un ID
+@router.get("/export")
+async def export_patients(
+    export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Export file format"),
+    order_by: Literal["name", "created_at"] = Query("name", description="Sort order of the exported patients"),
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Exporte tous les patients en NDJSON ou CSV.
+    
+    Les patients sont lus avec un curseur côté serveur et écrits au fil de l'eau :
+    la mémoire utilisée est constante quelle que soit la taille de la table.
+    
+    Args:
+        export_format: Le format du fichier ("ndjson" ou "csv")
+        order_by: L'ordre de tri des patients
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+        
+    Returns:
+        StreamingResponse: Le fichier exporté
+        
+    Raises:
+        HTTPException: Si l'utilisateur n'a pas le droit de lister les patients
+    """
+    # Mêmes droits que la liste des patients
+    user_role = token_payload.get("role", "").lower()
+    allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+    
+    if not check_role_permission(user_role, allowed_roles):
+        logger.warning("Unauthorized export attempt with role: %s", user_role)
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You don't have permission to export patients"
+        )
+    
+    logger.info("Export des patients (%s) demandé par %s", export_format, token_payload.get('sub'))
+    
+    # La lecture commence à l'envoi de la réponse, dans sa propre session
+    patient_repository = container.patient_repository()
+    filename = f"patients-{date.today():%Y%m%d}.{export_format}"
+    return StreamingResponse(
+        write_patients(patient_repository.stream_all(order_by=order_by), export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.get("/{patient_id}", response_model=PatientResponseDTO)
 async def get_patient(
     patient_id: UUID = Path(..., description="The ID of the patient to get"),
@@ -175,10 +340,7 @@ async def get_patient(
             raise HTTPException(status_code=401, detail="Token invalide - ID utilisateur mal formé")
         
         # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = GetPatientUseCase(
-            patient_repository=container.patient_repository(),
-            patient_service=container.patient_service()
-        )
+        use_case: GetPatientUseCase = container.get_patient_usecase()
         
         # Exécuter le cas d'utilisation
         result = await use_case.execute(patient_id, user_id)
@@ -186,21 +348,21 @@ async def get_patient(
         return result
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except MissingPatientConsentException as e:
-        logger.error(f"Consentement du patient manquant: {str(e)}")
+        logger.error("Consentement du patient manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la récupération du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la récupération du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -211,7 +373,8 @@ async def update_patient(
     patient_id: UUID = Path(..., description="The ID of the patient to update"),
     data: PatientUpdateDTO = None,
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
-    container: Container = Depends(get_container)
+    container: Container = Depends(get_container),
+    unit_of_work: UnitOfWork = Depends(get_unit_of_work)
 ):
     """
     Met à jour un patient existant.
@@ -221,6 +384,7 @@ async def update_patient(
         data: Les données pour la mise à jour du patient
         token_payload: Les informations du token JWT
         container: Le container d'injection de dépendances
+        unit_of_work: L'unité de travail de la requête
         
     Returns:
         PatientResponseDTO: Le patient mis à jour
@@ -240,43 +404,41 @@ async def update_patient(
             )
         
         # Log des données reçues
-        logger.info(f"Mise à jour du patient {patient_id} avec les données: {data}")
+        logger.debug("Mise à jour du patient %s avec les données: %s", patient_id, data)
         
         # Créer le cas d'utilisation avec les dépendances nécessaires
-        use_case = UpdatePatientUseCase(
-            patient_repository=container.patient_repository(),
-            patient_service=container.patient_service()
-        )
+        use_case: UpdatePatientUseCase = container.update_patient_usecase()
         
-        # Exécuter le cas d'utilisation
-        result = await use_case.execute(patient_id, data or PatientUpdateDTO())
+        # Exécuter le cas d'utilisation (une seule connexion et transaction)
+        async with unit_of_work:
+            result = await use_case.execute(patient_id, data or PatientUpdateDTO())
         
-        logger.info(f"Patient {patient_id} mis à jour avec succès")
+        logger.info("Patient %s mis à jour avec succès", patient_id)
         return result
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except MissingRequiredFieldException as e:
-        logger.error(f"Champ requis manquant: {str(e)}")
+        logger.error("Champ requis manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la mise à jour du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la mise à jour du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -312,7 +474,7 @@ async def delete_patient(
                 detail="Only administrators can delete patient folders"
             )
         
-        logger.info(f"Suppression du patient {patient_id}")
+        logger.info("Suppression du patient %s", patient_id)
         
         # Exécuter la suppression directement (pas besoin d'un cas d'utilisation dédié)
         patient_repository = container.patient_repository()
@@ -321,18 +483,18 @@ async def delete_patient(
         if not success:
             raise PatientNotFoundException(patient_id)
         
-        logger.info(f"Patient {patient_id} supprimé avec succès")
+        logger.info("Patient %s supprimé avec succès", patient_id)
         return None
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la suppression du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la suppression du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -342,77 +504,102 @@ async def delete_patient(
 async def list_patients(
     skip: int = Query(0, description="Number of patients to skip"),
     limit: int = Query(100, description="Maximum number of patients to return"),
+    pagination: Literal["offset", "cursor"] = Query("offset", description="Pagination mode"),
+    cursor: Optional[str] = Query(None, description="Opaque cursor returned as next_cursor by the previous page"),
+    order_by: Literal["name", "created_at"] = Query("name", description="Stable sort order used in cursor mode"),
+    fields: Literal["summary", "full"] = Query("full", description="Projection: full records or a summary without medical data"),
+    count: Optional[Literal["exact", "estimated", "none"]] = Query(
+        None,
+        description="Total computation: exact by default in offset mode, none in cursor mode"
+    ),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Liste tous les patients avec pagination."""
+    """
+    Liste tous les patients avec pagination.
+    
+    La pagination par décalage (skip/limit) reste le mode par défaut. En mode curseur
+    (pagination=cursor ou cursor fourni), les patients sont triés par (last_name, id)
+    ou (created_at, id) et la page suivante est obtenue avec next_cursor, sans OFFSET
+    ni comptage.
+    
+    Le total est exact par défaut en mode décalage ; count=estimated le remplace par une
+    estimation (statistiques PostgreSQL, mises en cache quelques secondes), count=none
+    le supprime.
+    
+    fields=summary ne lit et ne retourne que l'identité et les coordonnées des patients
+    (ni colonnes JSONB, ni notes).
+    """
     try:
         # Vérification des permissions
         user_role = token_payload.get("role", "").lower()  # Get role and convert to lowercase
         allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
         
-        logger.debug(f"User role: {user_role}")  # Add debug logging
+        logger.debug("User role: %s", user_role)  # Add debug logging
         
         if not check_role_permission(user_role, allowed_roles):
-            logger.warning(f"Unauthorized access attempt with role: {user_role}")
+            logger.warning("Unauthorized access attempt with role: %s", user_role)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to list patients"
             )
         
+        keyset_mode, after = resolve_keyset(pagination, cursor, order_by)
+        count_mode = count or ("none" if keyset_mode else "exact")
+        
         # Récupération des patients
         patient_repository = container.patient_repository()
+        
+        async def load_page():
+            if keyset_mode:
+                # Lire un patient de plus pour savoir s'il existe une page suivante
+                patients = await patient_repository.list_all(
+                    limit=limit + 1,
+                    after=after,
+                    order_by=order_by,
+                    fields=fields
+                )
+                page = build_keyset_page(patients, limit, order_by, patient_sort_key)
+                return page.items, page.next_cursor
+            return await patient_repository.list_all(skip, limit, fields=fields), None
+        
+        async def load_count() -> CountResult:
+            if count_mode == "exact":
+                return CountResult(total=await patient_repository.count())
+            if count_mode == "estimated":
+                counter: CachedCounter = container.counter()
+                return await counter.estimated(("patients", "all"), patient_repository.estimate_count)
+            return CountResult(total=None)
+        
         try:
-            patients = await patient_repository.list_all(skip, limit)
-            total = await patient_repository.count()
+            # La page et le total sont lus en parallèle, chacun sur sa propre connexion
+            (patients, next_cursor), count_result = await run_concurrently(load_page(), load_count())
         except Exception as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database error occurred"
             )
         
         # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
+        mapper = to_patient_summary if fields == "summary" else to_patient_response
+        patient_dtos = mapper.many(patients)
         
         # Construction de la réponse
         return PatientListResponseDTO(
             patients=patient_dtos,
-            total=total,
-            skip=skip,
-            limit=limit
+            total=count_result.total,
+            total_estimated=count_result.estimated,
+            skip=0 if keyset_mode else skip,
+            limit=limit,
+            next_cursor=next_cursor
         )
     
+    except HTTPException:
+        raise
+    
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la liste des patients: {str(e)}")
+        logger.exception("Erreur inattendue lors de la liste des patients: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -424,7 +611,14 @@ async def search_patients(
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
-    """Recherche des patients selon différents critères."""
+    """
+    Recherche des patients selon différents critères.
+    
+    Accepte les mêmes modes de pagination et projections que la liste (pagination,
+    cursor, order_by, fields).
+    Le total est exact par défaut (calculé dans la requête de recherche) ; count=estimated
+    réutilise un total mis en cache pour les mêmes critères, count=none le supprime.
+    """
     try:
         # Vérification des permissions
         user_role = token_payload.get("role", "").lower()
@@ -436,62 +630,77 @@ async def search_patients(
                 detail="You don't have permission to search patients"
             )
         
+        keyset_mode, after = resolve_keyset(
+            search_criteria.pagination,
+            search_criteria.cursor,
+            search_criteria.order_by
+        )
+        limit = search_criteria.limit
+        count_mode = search_criteria.count or ("none" if keyset_mode else "exact")
+        
         # Recherche des patients
         patient_repository = container.patient_repository()
-        patients = await patient_repository.search(
+        search_kwargs = dict(
             name=search_criteria.name,
             date_of_birth=search_criteria.date_of_birth,
             email=search_criteria.email,
             phone=search_criteria.phone,
-            skip=search_criteria.skip,
-            limit=search_criteria.limit
+            skip=0 if keyset_mode else search_criteria.skip,
+            limit=limit + 1 if keyset_mode else limit,
+            after=after,
+            order_by=search_criteria.order_by if keyset_mode else None,
+            fields=search_criteria.fields
         )
         
-        # Compte approximatif pour la pagination
-        total = len(patients)
+        count_result = CountResult(total=None)
+        if count_mode == "none":
+            patients = await patient_repository.search(**search_kwargs)
+        elif count_mode == "exact":
+            # Total calculé par la même requête (fonction de fenêtre)
+            patients, total = await patient_repository.search_with_total(**search_kwargs)
+            count_result = CountResult(total=total)
+        else:
+            # Total exact mis en cache par critères : réutilisé tant qu'il n'a pas expiré
+            counter: CachedCounter = container.counter()
+            count_key = (
+                "patients.search",
+                search_criteria.name,
+                search_criteria.date_of_birth,
+                search_criteria.email,
+                search_criteria.phone
+            )
+            count_result = counter.cached(count_key)
+            if count_result is None:
+                patients, total = await patient_repository.search_with_total(**search_kwargs)
+                count_result = counter.remember(count_key, total)
+            else:
+                patients = await patient_repository.search(**search_kwargs)
+        
+        next_cursor = None
+        if keyset_mode:
+            page = build_keyset_page(patients, limit, search_criteria.order_by, patient_sort_key)
+            patients, next_cursor = page.items, page.next_cursor
         
         # Conversion en DTOs
-        patient_dtos = [
-            PatientResponseDTO(
-                id=patient.id,
-                first_name=patient.first_name,
-                last_name=patient.last_name,
-                date_of_birth=patient.date_of_birth,
-                gender=patient.gender,
-                address=patient.address,
-                city=patient.city,
-                postal_code=patient.postal_code,
-                country=patient.country,
-                phone_number=patient.phone_number,
-                email=patient.email,
-                blood_type=patient.blood_type,
-                allergies=patient.allergies,
-                chronic_diseases=patient.chronic_diseases,
-                current_medications=patient.current_medications,
-                has_consent=patient.has_consent,
-                gdpr_consent=patient.gdpr_consent,
-                consent_date=patient.consent_date,
-                insurance_provider=patient.insurance_provider,
-                insurance_id=patient.insurance_id,
-                notes=patient.notes,
-                created_at=patient.created_at,
-                updated_at=patient.updated_at,
-                is_active=patient.is_active
-            )
-            for patient in patients
-        ]
+        mapper = to_patient_summary if search_criteria.fields == "summary" else to_patient_response
+        patient_dtos = mapper.many(patients)
         
         # Construction de la réponse
         return PatientListResponseDTO(
             patients=patient_dtos,
-            total=total,
-            skip=search_criteria.skip,
-            limit=search_criteria.limit
+            total=count_result.total,
+            total_estimated=count_result.estimated,
+            skip=0 if keyset_mode else search_criteria.skip,
+            limit=limit,
+            next_cursor=next_cursor
         )
     
+    except HTTPException:
+        raise
+    
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la recherche de patients: {str(e)}")
+        logger.exception("Erreur inattendue lors de la recherche de patients: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
-        )
\ No newline at end of file
+        )
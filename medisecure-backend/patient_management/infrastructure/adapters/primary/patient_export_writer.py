@@ -0,0 +1,86 @@
+# medisecure-backend/patient_management/infrastructure/adapters/primary/patient_export_writer.py
+"""
+Écriture en flux des exports de patients (NDJSON ou CSV).
+
+Les patients sont sérialisés au fur et à mesure de leur lecture et envoyés par
+morceaux de quelques centaines de lignes : la mémoire utilisée ne dépend pas de la
+taille de la table. Le CSV produit peut être réimporté tel quel (POST /patients/bulk).
+"""
+import csv
+import io
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterable, AsyncIterator, Dict
+from uuid import UUID
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.application.dtos.patient_dtos import to_patient_response
+from patient_management.infrastructure.adapters.primary.patient_import_parser import CSV, JSON_FIELDS, NDJSON
+
+# Champs exportés : ceux de PatientResponseDTO
+EXPORT_FIELDS = to_patient_response.fields
+
+MEDIA_TYPES = {
+    NDJSON: "application/x-ndjson",
+    CSV: "text/csv; charset=utf-8",
+}
+
+# Nombre de lignes par morceau envoyé au client
+ROWS_PER_CHUNK = 500
+
+def _json_default(value: Any) -> Any:
+    """Sérialise les types non gérés par json (dates, UUID)."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _csv_value(field: str, value: Any) -> str:
+    """Convertit une valeur en cellule CSV (vide pour None, JSON pour les colonnes JSONB)."""
+    if value is None:
+        return ""
+    if field in JSON_FIELDS:
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+def _row(patient: Patient) -> Dict[str, Any]:
+    """Retourne les champs exportés d'un patient."""
+    return {field: getattr(patient, field) for field in EXPORT_FIELDS}
+
+async def write_patients(patients: AsyncIterable[Patient], export_format: str) -> AsyncIterator[bytes]:
+    """
+    Sérialise les patients au fil de l'eau.
+
+    Args:
+        patients: Les patients à exporter (ex: PatientRepositoryProtocol.stream_all)
+        export_format: NDJSON ou CSV
+
+    Yields:
+        bytes: Le fichier exporté, morceau par morceau (UTF-8)
+    """
+    buffer = io.StringIO()
+    csv_writer = csv.writer(buffer, lineterminator="\n") if export_format == CSV else None
+    if csv_writer is not None:
+        csv_writer.writerow(EXPORT_FIELDS)
+
+    rows = 0
+    async for patient in patients:
+        if csv_writer is not None:
+            csv_writer.writerow([_csv_value(field, value) for field, value in _row(patient).items()])
+        else:
+            buffer.write(json.dumps(_row(patient), default=_json_default, ensure_ascii=False))
+            buffer.write("\n")
+
+        rows += 1
+        if rows % ROWS_PER_CHUNK == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
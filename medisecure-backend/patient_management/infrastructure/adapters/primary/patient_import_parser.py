@@ -0,0 +1,147 @@
+# medisecure-backend/patient_management/infrastructure/adapters/primary/patient_import_parser.py
+"""
+Lecture en flux des fichiers d'import de patients (NDJSON ou CSV).
+
+Le corps de la requête est lu morceau par morceau : seules la ligne en cours et le
+lot en cours de validation sont gardés en mémoire, quelle que soit la taille du fichier.
+Un enregistrement illisible produit une erreur sur sa ligne sans interrompre l'import.
+"""
+import codecs
+import csv
+import json
+from typing import AsyncIterable, AsyncIterator, Dict, Any, List, Optional
+
+from patient_management.application.usecases.import_patients_usecase import PatientImportRow
+
+NDJSON = "ndjson"
+CSV = "csv"
+
+CONTENT_TYPES = {
+    "application/x-ndjson": NDJSON,
+    "application/ndjson": NDJSON,
+    "application/jsonl": NDJSON,
+    "application/x-jsonlines": NDJSON,
+    "text/csv": CSV,
+    "application/csv": CSV,
+}
+
+# Colonnes JSONB : transmises en texte JSON dans une cellule CSV
+JSON_FIELDS = ("allergies", "chronic_diseases", "current_medications")
+
+# Au-delà, le fichier est rejeté (ligne non terminée ou guillemet non fermé)
+MAX_RECORD_LENGTH = 64 * 1024
+
+def resolve_import_format(content_type: Optional[str]) -> Optional[str]:
+    """
+    Détermine le format d'import à partir de l'en-tête Content-Type.
+
+    Args:
+        content_type: La valeur de l'en-tête (paramètres éventuels compris)
+
+    Returns:
+        Optional[str]: NDJSON, CSV, ou None si le format n'est pas supporté
+    """
+    if not content_type:
+        return None
+    return CONTENT_TYPES.get(content_type.split(";")[0].strip().lower())
+
+async def parse_patient_rows(chunks: AsyncIterable[bytes], import_format: str) -> AsyncIterator[PatientImportRow]:
+    """
+    Lit les enregistrements d'un fichier d'import.
+
+    Args:
+        chunks: Le corps de la requête, morceau par morceau
+        import_format: NDJSON ou CSV
+
+    Yields:
+        PatientImportRow: Les enregistrements, numérotés à partir de 1 (lignes vides
+            et en-tête CSV exclus)
+
+    Raises:
+        ValueError: Si le fichier n'est pas en UTF-8 ou contient un enregistrement trop long
+    """
+    parser = _parse_ndjson if import_format == NDJSON else _parse_csv
+    async for row in parser(_iter_lines(chunks)):
+        yield row
+
+async def _iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """Découpe le flux en lignes (UTF-8, BOM éventuel ignoré)."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+        if len(buffer) > MAX_RECORD_LENGTH:
+            raise ValueError(f"Import record exceeds {MAX_RECORD_LENGTH} characters")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+async def _parse_ndjson(lines: AsyncIterable[str]) -> AsyncIterator[PatientImportRow]:
+    """Un objet JSON par ligne."""
+    row = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield PatientImportRow(row=row, data=None, error=f"Invalid JSON: {e.msg}")
+            continue
+        if not isinstance(data, dict):
+            yield PatientImportRow(row=row, data=None, error="Expected a JSON object")
+            continue
+        yield PatientImportRow(row=row, data=data)
+
+async def _parse_csv(lines: AsyncIterable[str]) -> AsyncIterator[PatientImportRow]:
+    """
+    Première ligne : noms des colonnes. Un champ entre guillemets peut contenir des
+    retours à la ligne ; une cellule vide équivaut à une colonne absente.
+    """
+    header: Optional[List[str]] = None
+    row = 0
+    pending: List[str] = []
+
+    async for line in lines:
+        pending.append(line)
+        record = "\n".join(pending)
+        # Nombre impair de guillemets : le champ se poursuit sur la ligne suivante
+        if record.count('"') % 2:
+            if len(record) > MAX_RECORD_LENGTH:
+                raise ValueError(f"Import record exceeds {MAX_RECORD_LENGTH} characters")
+            continue
+        pending = []
+        if not record.strip():
+            continue
+
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+
+        row += 1
+        if len(values) != len(header):
+            yield PatientImportRow(
+                row=row,
+                data=None,
+                error=f"Expected {len(header)} columns, got {len(values)}"
+            )
+            continue
+        yield _csv_row(row, header, values)
+
+    if pending:
+        yield PatientImportRow(row=row + 1, data=None, error="Unterminated quoted field")
+
+def _csv_row(row: int, header: List[str], values: List[str]) -> PatientImportRow:
+    """Convertit une ligne CSV en enregistrement (cellules vides omises, colonnes JSON décodées)."""
+    data: Dict[str, Any] = {name: value for name, value in zip(header, values) if value != ""}
+    for field in JSON_FIELDS:
+        if field in data:
+            try:
+                data[field] = json.loads(data[field])
+            except json.JSONDecodeError as e:
+                return PatientImportRow(row=row, data=None, error=f"{field}: invalid JSON ({e.msg})")
+    return PatientImportRow(row=row, data=data)
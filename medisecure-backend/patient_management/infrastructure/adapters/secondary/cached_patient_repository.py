@@ -0,0 +1,221 @@
+# medisecure-backend/patient_management/infrastructure/adapters/secondary/cached_patient_repository.py
+from dataclasses import asdict
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Set, AsyncIterator, Union
+from uuid import UUID
+from datetime import date
+import logging
+import os
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.ports.secondary.cache_protocol import CacheProtocol
+from shared.infrastructure.cache import codec
+from shared.infrastructure.database.unit_of_work import after_transaction, get_current_session
+from shared.infrastructure.monitoring.prometheus_metrics import CACHE_ERRORS, CACHE_HITS, CACHE_MISSES
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "patients"
+
+# Marqueur écrit à la place d'un patient modifié. Les lectures le traitent comme une
+# absence et n'alimentent le cache que si la clé est absente (if_absent) : une lecture
+# commencée avant la modification ne peut pas y remettre l'ancienne version.
+INVALIDATED = "-"
+
+# Durée de vie du marqueur : plus longue qu'une requête de lecture (DB_COMMAND_TIMEOUT)
+INVALIDATION_TTL_SECONDS = float(os.getenv("DB_COMMAND_TIMEOUT", "60"))
+
+class CachedPatientRepository(PatientRepositoryProtocol):
+    """
+    Décorateur du repository des patients ajoutant un cache en lecture (read-through)
+    sur get_by_id et get_many. Implémente le port PatientRepositoryProtocol.
+
+    Les écritures (update, delete) remplacent l'entrée du patient par un marqueur
+    d'invalidation, puis à nouveau à la fin de la transaction. Le cache n'est
+    alimenté que si la clé est absente : une lecture concurrente de l'ancienne version
+    ne peut pas écraser le marqueur. Les listes et recherches ne sont pas mises en cache.
+    Une erreur du cache n'interrompt jamais la requête : elle est traitée comme une absence.
+
+    Les entrées sont les dossiers complets (données médicales comprises), sérialisés
+    en JSON non chiffré. Avec RedisCache, elles sont donc lisibles par quiconque accède
+    au serveur Redis pendant PATIENT_CACHE_TTL_SECONDS : celui-ci doit rester privé
+    (réseau interne, AUTH, TLS avec rediss://, sans persistance sur disque), ou le cache
+    doit être désactivé (PATIENT_CACHE_ENABLED=false).
+    """
+
+    def __init__(self, repository: PatientRepositoryProtocol, cache: CacheProtocol):
+        """
+        Initialise le décorateur.
+
+        Args:
+            repository: Le repository décoré
+            cache: Le cache des patients
+        """
+        self.repository = repository
+        self.cache = cache
+
+    async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        key = str(patient_id)
+        cached = await self._cache_get(key)
+        if cached is not None and cached != INVALIDATED:
+            CACHE_HITS.labels(cache=CACHE_NAME).inc()
+            return Patient(**codec.loads(cached))
+
+        CACHE_MISSES.labels(cache=CACHE_NAME).inc()
+        patient = await self.repository.get_by_id(patient_id)
+
+        # Dans une unité de travail, la lecture peut voir des écritures non validées :
+        # ne pas les publier dans le cache
+        if patient is not None and get_current_session() is None:
+            await self._cache_set(key, codec.dumps(asdict(patient)))
+        return patient
+
+    async def get_many(self, patient_ids: Iterable[UUID]) -> Dict[UUID, Patient]:
+        ids = {str(patient_id): patient_id for patient_id in patient_ids}
+        # Une lecture groupée du cache, puis une requête pour les patients absents
+        cached = {
+            key: value for key, value in (await self._cache_get_many(list(ids))).items()
+            if value != INVALIDATED
+        }
+        patients: Dict[UUID, Patient] = {
+            ids[key]: Patient(**codec.loads(value)) for key, value in cached.items()
+        }
+        missing = [patient_id for key, patient_id in ids.items() if key not in cached]
+
+        if patients:
+            CACHE_HITS.labels(cache=CACHE_NAME).inc(len(patients))
+        if not missing:
+            return patients
+
+        CACHE_MISSES.labels(cache=CACHE_NAME).inc(len(missing))
+        loaded = await self.repository.get_many(missing)
+        if loaded and get_current_session() is None:
+            await self._cache_set_many({
+                str(patient_id): codec.dumps(asdict(patient)) for patient_id, patient in loaded.items()
+            })
+        patients.update(loaded)
+        return patients
+
+    async def get_by_email(self, email: str) -> Optional[Patient]:
+        return await self.repository.get_by_email(email)
+
+    async def create(self, patient: Patient) -> Patient:
+        # Nouvel identifiant : aucune version antérieure à écarter (une absence n'est pas mise en cache)
+        return await self.repository.create(patient)
+
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        # Nouveaux identifiants : aucune entrée du cache à invalider
+        return await self.repository.bulk_create(patients)
+
+    async def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        return await self.repository.find_existing_emails(emails)
+
+    async def update(self, patient: Patient) -> Patient:
+        updated = await self.repository.update(patient)
+        await self._invalidate(patient.id)
+        return updated
+
+    async def delete(self, patient_id: UUID) -> bool:
+        deleted = await self.repository.delete(patient_id)
+        await self._invalidate(patient_id)
+        return deleted
+
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
+        return await self.repository.list_all(skip, limit, after, order_by, fields)
+
+    def stream_all(self, order_by: str = "name", batch_size: int = 1000) -> AsyncIterator[Patient]:
+        return self.repository.stream_all(order_by, batch_size)
+
+    async def search(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
+        return await self.repository.search(name, date_of_birth, email, phone, skip, limit, after, order_by, fields)
+
+    async def search_with_total(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> Tuple[List[Union[Patient, PatientSummary]], int]:
+        return await self.repository.search_with_total(
+            name, date_of_birth, email, phone, skip, limit, after, order_by, fields
+        )
+
+    async def count(self) -> int:
+        return await self.repository.count()
+
+    async def estimate_count(self) -> int:
+        return await self.repository.estimate_count()
+
+    async def _invalidate(self, patient_id: UUID) -> None:
+        """
+        Invalide l'entrée d'un patient maintenant et à la fin de la transaction.
+
+        Args:
+            patient_id: L'ID du patient modifié
+        """
+        key = str(patient_id)
+        await self._cache_invalidate(key)
+        if get_current_session() is not None:
+            await after_transaction(lambda: self._cache_invalidate(key))
+
+    async def _cache_get(self, key: str) -> Optional[str]:
+        try:
+            return await self.cache.get(key)
+        except Exception as e:
+            CACHE_ERRORS.labels(cache=CACHE_NAME).inc()
+            logger.warning("Lecture du cache des patients impossible: %s", e)
+            return None
+
+    async def _cache_set(self, key: str, value: str) -> None:
+        try:
+            await self.cache.set(key, value, if_absent=True)
+        except Exception as e:
+            CACHE_ERRORS.labels(cache=CACHE_NAME).inc()
+            logger.warning("Écriture dans le cache des patients impossible: %s", e)
+
+    async def _cache_get_many(self, keys: List[str]) -> Dict[str, str]:
+        try:
+            return await self.cache.get_many(keys)
+        except Exception as e:
+            CACHE_ERRORS.labels(cache=CACHE_NAME).inc()
+            logger.warning("Lecture du cache des patients impossible: %s", e)
+            return {}
+
+    async def _cache_set_many(self, items: Dict[str, str]) -> None:
+        try:
+            await self.cache.set_many(items, if_absent=True)
+        except Exception as e:
+            CACHE_ERRORS.labels(cache=CACHE_NAME).inc()
+            logger.warning("Écriture dans le cache des patients impossible: %s", e)
+
+    async def _cache_invalidate(self, key: str) -> None:
+        try:
+            await self.cache.set(key, INVALIDATED, ttl_seconds=INVALIDATION_TTL_SECONDS)
+        except Exception as e:
+            CACHE_ERRORS.labels(cache=CACHE_NAME).inc()
+            logger.error("Invalidation du cache des patients impossible: %s", e)
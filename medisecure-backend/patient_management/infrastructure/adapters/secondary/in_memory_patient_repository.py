@@ -1,10 +1,15 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Set, AsyncIterator, Union
 from uuid import UUID
 from datetime import date
 from copy import deepcopy
 
 from patient_management.domain.entities.patient import Patient
-from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.domain.ports.secondary.patient_repository_protocol import (
+    PatientRepositoryProtocol,
+    patient_sort_key
+)
+from shared.infrastructure.search.trigram_index import TrigramIndex
 
 class InMemoryPatientRepository(PatientRepositoryProtocol):
     """
@@ -18,6 +23,9 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         """
         self.patients: Dict[UUID, Patient] = {}
         self.email_index: Dict[str, UUID] = {}
+        # Index trigrammes (équivalents des index pg_trgm) pour la recherche par sous-chaîne
+        self.name_index: TrigramIndex[UUID] = TrigramIndex()
+        self.phone_index: TrigramIndex[UUID] = TrigramIndex()
     
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """
@@ -35,6 +43,22 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
             return deepcopy(patient)
         return None
     
+    async def get_many(self, patient_ids: Iterable[UUID]) -> Dict[UUID, Patient]:
+        """
+        Récupère plusieurs patients par leurs IDs.
+        
+        Args:
+            patient_ids: Les IDs des patients à récupérer
+            
+        Returns:
+            Dict[UUID, Patient]: Les patients trouvés, indexés par ID
+        """
+        return {
+            patient_id: deepcopy(self.patients[patient_id])
+            for patient_id in set(patient_ids)
+            if patient_id in self.patients
+        }
+    
     async def get_by_email(self, email: str) -> Optional[Patient]:
         """
         Récupère un patient par son email.
@@ -72,8 +96,36 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         if patient.email:
             self.email_index[patient.email] = patient.id
         
+        self._index_search_fields(patient)
+        
         return deepcopy(patient)
     
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients.
+        
+        Args:
+            patients: Les patients à créer
+            
+        Returns:
+            int: Le nombre de patients créés
+        """
+        for patient in patients:
+            await self.create(patient)
+        return len(patients)
+    
+    async def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        """
+        Retourne, parmi les emails donnés, ceux déjà utilisés par un patient.
+        
+        Args:
+            emails: Les emails à vérifier
+            
+        Returns:
+            Set[str]: Les emails déjà existants
+        """
+        return {email for email in emails if email in self.email_index}
+    
     async def update(self, patient: Patient) -> Patient:
         """
         Met à jour un patient existant.
@@ -98,6 +150,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         
         # Stocker une copie du patient pour éviter les modifications non contrôlées
         self.patients[patient.id] = deepcopy(patient)
+        self._index_search_fields(patient)
         
         return deepcopy(patient)
     
@@ -122,27 +175,53 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         
         # Supprimer le patient
         del self.patients[patient_id]
+        self.name_index.remove(patient_id)
+        self.phone_index.remove(patient_id)
         
         return True
     
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         """
         Liste tous les patients avec pagination.
         
         Args:
-            skip: Le nombre de patients à sauter
+            skip: Le nombre de patients à sauter (pagination par décalage)
             limit: Le nombre maximum de patients à retourner
+            after: La clé de tri du dernier patient de la page précédente
+            order_by: L'ordre de tri stable pour la pagination par curseur
+            fields: La projection ("full" ou "summary")
             
         Returns:
-            List[Patient]: La liste des patients
+            List: La liste des patients (PatientSummary si fields="summary")
         """
         patients = list(self.patients.values())
         
         # Appliquer la pagination
-        paginated_patients = patients[skip:skip + limit]
+        paginated_patients = self._paginate(patients, skip, limit, after, order_by)
         
         # Retourner des copies des patients pour éviter les modifications non contrôlées
-        return [deepcopy(patient) for patient in paginated_patients]
+        return self._project(paginated_patients, fields)
+    
+    async def stream_all(self, order_by: str = "name", batch_size: int = 1000) -> AsyncIterator[Patient]:
+        """
+        Parcourt tous les patients.
+        
+        Args:
+            order_by: L'ordre de tri stable
+            batch_size: Ignoré (tous les patients sont déjà en mémoire)
+            
+        Yields:
+            Patient: Une copie de chaque patient, dans l'ordre demandé
+        """
+        for patient in sorted(self.patients.values(), key=lambda p: patient_sort_key(p, order_by)):
+            yield deepcopy(patient)
     
     async def search(
         self,
@@ -151,30 +230,119 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         email: Optional[str] = None,
         phone: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Patient]:
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         """
         Recherche des patients selon différents critères.
         
+        La recherche par nom ignore la casse et les accents. En pagination par décalage,
+        les résultats d'une recherche par nom sont classés par pertinence.
+        
         Args:
             name: Le nom ou prénom du patient (recherche partielle)
             date_of_birth: La date de naissance du patient
             email: L'email du patient (recherche exacte)
             phone: Le numéro de téléphone du patient (recherche partielle)
-            skip: Le nombre de patients à sauter
+            skip: Le nombre de patients à sauter (pagination par décalage)
             limit: Le nombre maximum de patients à retourner
+            after: La clé de tri du dernier patient de la page précédente
+            order_by: L'ordre de tri stable pour la pagination par curseur
+            fields: La projection ("full" ou "summary")
+            
+        Returns:
+            List: La liste des patients correspondant aux critères
+        """
+        filtered_patients = self._filter(name, date_of_birth, email, phone, ranked=order_by is None)
+        
+        # Appliquer la pagination
+        paginated_patients = self._paginate(filtered_patients, skip, limit, after, order_by)
+        
+        # Retourner des copies des patients pour éviter les modifications non contrôlées
+        return self._project(paginated_patients, fields)
+    
+    async def search_with_total(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> Tuple[List[Union[Patient, PatientSummary]], int]:
+        """
+        Recherche des patients et compte exactement tous ceux qui correspondent aux critères.
+        
+        Args:
+            Les mêmes que search
             
         Returns:
-            List[Patient]: La liste des patients correspondant aux critères
+            Tuple[List, int]: La page de patients et le total (toutes pages confondues)
+        """
+        filtered_patients = self._filter(name, date_of_birth, email, phone, ranked=order_by is None)
+        paginated_patients = self._paginate(filtered_patients, skip, limit, after, order_by)
+        return self._project(paginated_patients, fields), len(filtered_patients)
+    
+    async def count(self) -> int:
         """
-        # Filtrer les patients selon les critères fournis
-        filtered_patients = list(self.patients.values())
+        Compte le nombre total de patients.
         
+        Returns:
+            int: Le nombre total de patients
+        """
+        return len(self.patients)
+    
+    async def estimate_count(self) -> int:
+        """
+        Estime le nombre total de patients (exact en mémoire).
+        
+        Returns:
+            int: Le nombre de patients
+        """
+        return len(self.patients)
+    
+    def _filter(
+        self,
+        name: Optional[str],
+        date_of_birth: Optional[date],
+        email: Optional[str],
+        phone: Optional[str],
+        ranked: bool
+    ) -> List[Patient]:
+        """
+        Sélectionne les patients correspondant aux critères.
+        
+        Args:
+            name: Le nom ou prénom recherché
+            date_of_birth: La date de naissance
+            email: L'email (recherche exacte)
+            phone: Le numéro de téléphone (recherche partielle)
+            ranked: Classer les résultats par pertinence (pagination par décalage)
+            
+        Returns:
+            List[Patient]: Les patients correspondants
+        """
+        # Restreindre d'abord les candidats grâce aux index, au lieu de parcourir tous les patients
+        candidate_ids = None
+        if email:
+            patient_id = self.email_index.get(email)
+            candidate_ids = {patient_id} if patient_id else set()
         if name:
-            filtered_patients = [
-                p for p in filtered_patients
-                if name.lower() in p.first_name.lower() or name.lower() in p.last_name.lower()
-            ]
+            name_ids = self.name_index.search(name)
+            candidate_ids = name_ids if candidate_ids is None else candidate_ids & name_ids
+        if phone:
+            phone_ids = self.phone_index.search(phone)
+            candidate_ids = phone_ids if candidate_ids is None else candidate_ids & phone_ids
+        
+        if candidate_ids is None:
+            filtered_patients = list(self.patients.values())
+        else:
+            filtered_patients = [self.patients[patient_id] for patient_id in candidate_ids]
         
         if date_of_birth:
             filtered_patients = [
@@ -182,29 +350,69 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
                 if p.date_of_birth == date_of_birth
             ]
         
-        if email:
-            filtered_patients = [
-                p for p in filtered_patients
-                if p.email == email
-            ]
+        if name and ranked:
+            # Classement par pertinence (similarité trigramme), puis ordre stable
+            filtered_patients.sort(
+                key=lambda p: (-self.name_index.rank(p.id, name), patient_sort_key(p, "name"))
+            )
+        elif candidate_ids is not None and ranked:
+            # Les candidats issus des index ne sont pas ordonnés : imposer un ordre stable
+            filtered_patients.sort(key=lambda p: patient_sort_key(p, "name"))
         
-        if phone:
-            filtered_patients = [
-                p for p in filtered_patients
-                if p.phone_number and phone.lower() in p.phone_number.lower()
-            ]
+        return filtered_patients
+    
+    def _project(self, patients: List[Patient], fields: str) -> List[Union[Patient, PatientSummary]]:
+        """
+        Applique une projection (copies complètes ou vues résumées).
         
-        # Appliquer la pagination
-        paginated_patients = filtered_patients[skip:skip + limit]
+        Args:
+            patients: Les patients à retourner
+            fields: La projection ("full" ou "summary")
+            
+        Returns:
+            List: Les copies des patients ou leurs vues résumées
+        """
+        if fields == "full":
+            return [deepcopy(patient) for patient in patients]
+        if fields == "summary":
+            return [PatientSummary.from_patient(patient) for patient in patients]
+        raise ValueError(f"Unknown projection: {fields}")
+    
+    def _index_search_fields(self, patient: Patient) -> None:
+        """
+        Met à jour les index de recherche d'un patient.
         
-        # Retourner des copies des patients pour éviter les modifications non contrôlées
-        return [deepcopy(patient) for patient in paginated_patients]
+        Args:
+            patient: Le patient à indexer
+        """
+        self.name_index.add(patient.id, [patient.first_name, patient.last_name])
+        self.phone_index.add(patient.id, [patient.phone_number])
     
-    async def count(self) -> int:
+    def _paginate(
+        self,
+        patients: List[Patient],
+        skip: int,
+        limit: int,
+        after: Optional[Tuple[Any, ...]],
+        order_by: Optional[str]
+    ) -> List[Patient]:
         """
-        Compte le nombre total de patients.
+        Applique la pagination par décalage ou, si order_by est fourni, par curseur.
         
+        Args:
+            patients: Les patients à paginer
+            skip: Le nombre de patients à sauter (pagination par décalage)
+            limit: Le nombre maximum de patients à retourner
+            after: La clé de tri du dernier patient de la page précédente
+            order_by: L'ordre de tri stable pour la pagination par curseur
+            
         Returns:
-            int: Le nombre total de patients
+            List[Patient]: Les patients de la page
         """
-        return len(self.patients)
\ No newline at end of file
+        if order_by is None:
+            return patients[skip:skip + limit]
+        
+        ordered = sorted(patients, key=lambda p: patient_sort_key(p, order_by))
+        if after is not None:
+            ordered = [p for p in ordered if patient_sort_key(p, order_by) > tuple(after)]
+        return ordered[:limit]
@@ -1,19 +1,81 @@
 # medisecure-backend/patient_management/infrastructure/adapters/secondary/postgres_patient_repository.py
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Iterable, Set, AsyncIterator, Union
 from uuid import UUID
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, or_, and_, func
+from sqlalchemy import update, delete, or_, and_, func, tuple_, literal, text, bindparam, any_
+from sqlalchemy.dialects.postgresql import ARRAY
+import json
 import logging
 
 from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
 from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.query_registry import QueryRegistry
+from shared.infrastructure.search.trigram_index import escape_like
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Colonnes de tri de la pagination par curseur (couvertes par les index
+# idx_patients_last_name_id et idx_patients_created_at_id)
+SORT_COLUMNS = {
+    "name": (PatientModel.last_name, PatientModel.id),
+    "created_at": (PatientModel.created_at, PatientModel.id),
+}
+
+# Colonnes de la projection "summary", dans l'ordre des champs de PatientSummary
+SUMMARY_COLUMNS = (
+    PatientModel.id,
+    PatientModel.first_name,
+    PatientModel.last_name,
+    PatientModel.date_of_birth,
+    PatientModel.gender,
+    PatientModel.email,
+    PatientModel.phone_number,
+    PatientModel.insurance_id,
+    PatientModel.created_at,
+    PatientModel.is_active,
+)
+
+# Expressions de recherche textuelle : elles doivent rester identiques aux expressions
+# des index GIN pg_trgm (idx_patients_*_trgm) pour que ceux-ci soient utilisés
+FIRST_NAME_SEARCH = func.f_unaccent(func.lower(PatientModel.first_name))
+LAST_NAME_SEARCH = func.f_unaccent(func.lower(PatientModel.last_name))
+
+def _search_term(value: str):
+    """Normalise un terme de recherche côté serveur (minuscules, sans accents)."""
+    return func.f_unaccent(func.lower(literal(value)))
+
+def _contains(value: str):
+    """Motif LIKE '%valeur%' normalisé, avec les caractères spéciaux échappés."""
+    return _search_term(f"%{escape_like(value)}%")
+
+# En dessous de ce nombre de lignes estimées, le comptage exact est peu coûteux et
+# reltuples peu fiable (-1 ou 0 tant que la table n'a pas été analysée)
+EXACT_COUNT_BELOW = 10000
+
+# Colonnes écrites par l'import en masse (COPY), dans l'ordre des enregistrements
+BULK_COLUMNS = (
+    "id", "first_name", "last_name", "date_of_birth", "gender", "address", "city",
+    "postal_code", "country", "phone_number", "email", "blood_type", "allergies",
+    "chronic_diseases", "current_medications", "has_consent", "consent_date",
+    "gdpr_consent", "insurance_provider", "insurance_id", "notes", "created_at",
+    "updated_at", "is_active"
+)
+
+# Requêtes fréquentes, construites une seule fois (valeurs liées à l'exécution)
+QUERIES = QueryRegistry()
+QUERIES.register("get_by_id", select(PatientModel).where(PatientModel.id == bindparam("patient_id")))
+# id = ANY($1) : un seul texte SQL (et une seule requête préparée) quelle que soit la taille du lot
+QUERIES.register("get_many", select(PatientModel).where(
+    PatientModel.id == any_(bindparam("patient_ids", type_=ARRAY(PatientModel.id.type)))
+))
+QUERIES.register("get_by_email", select(PatientModel).where(PatientModel.email == bindparam("email")))
+QUERIES.register("count", select(func.count()).select_from(PatientModel))
+
 class PostgresPatientRepository(PatientRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des patients avec PostgreSQL.
@@ -25,51 +87,63 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
         Initialise le repository avec une factory de session SQLAlchemy.
         
         Args:
-            session_factory: La factory de session SQLAlchemy à utiliser
+            session_factory: La factory de session à utiliser (en pratique un SessionScope,
+                qui partage la session de l'unité de travail active)
         """
         self.session_factory = session_factory
     
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """..."""
         try:
-            logger.debug(f"Récupération du patient avec ID: {patient_id}")
+            logger.debug("Récupération du patient avec ID: %s", patient_id)
             async with self.session_factory() as session:
-                query = select(PatientModel).where(PatientModel.id == patient_id)
-                result = await session.execute(query)
+                result = await session.execute(QUERIES["get_by_id"], {"patient_id": patient_id})
                 patient_model = result.scalar_one_or_none()
                 
                 if not patient_model:
-                    logger.debug(f"Patient avec ID {patient_id} non trouvé")
+                    logger.debug("Patient avec ID %s non trouvé", patient_id)
                     return None
                 
-                logger.debug(f"Patient trouvé: {patient_model.id}")
+                logger.debug("Patient trouvé: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération du patient {patient_id}: {str(e)}")
+            logger.exception("Erreur lors de la récupération du patient %s: %s", patient_id, e)
+            raise
+    
+    async def get_many(self, patient_ids: Iterable[UUID]) -> Dict[UUID, Patient]:
+        patient_ids = list(set(patient_ids))
+        if not patient_ids:
+            return {}
+        try:
+            logger.debug("Récupération de %s patients par ID", len(patient_ids))
+            async with self.session_factory() as session:
+                result = await session.execute(QUERIES["get_many"], {"patient_ids": patient_ids})
+                return {model.id: self._map_to_entity(model) for model in result.scalars()}
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération de %s patients: %s", len(patient_ids), e)
             raise
     
     async def get_by_email(self, email: str) -> Optional[Patient]:
         try:
-            logger.debug(f"Récupération du patient avec email: {email}")
+            logger.debug("Récupération du patient avec email: %s", email)
             async with self.session_factory() as session:
-                query = select(PatientModel).where(PatientModel.email == email)
-                result = await session.execute(query)
+                result = await session.execute(QUERIES["get_by_email"], {"email": email})
                 patient_model = result.scalar_one_or_none()
                 
                 if not patient_model:
-                    logger.debug(f"Patient avec email {email} non trouvé")
+                    logger.debug("Patient avec email %s non trouvé", email)
                     return None
                 
-                logger.debug(f"Patient trouvé: {patient_model.id}")
+                logger.debug("Patient trouvé: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération du patient par email {email}: {str(e)}")
+            logger.exception("Erreur lors de la récupération du patient par email %s: %s", email, e)
             raise
     
     async def create(self, patient: Patient) -> Patient:
         """..."""
         try:
-            logger.info(f"Création d'un nouveau patient: {patient.first_name} {patient.last_name}")
+            logger.debug("Création d'un nouveau patient: %s %s", patient.first_name, patient.last_name)
             
             async with self.session_factory() as session:
                 patient_model = PatientModel(
@@ -100,13 +174,55 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                 )
                 
                 session.add(patient_model)
-                await session.commit()
+                await session.flush()
                 await session.refresh(patient_model)
                 
-                logger.info(f"Patient créé avec succès: {patient_model.id}")
+                logger.info("Patient créé avec succès: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la création du patient: {str(e)}")
+            logger.exception("Erreur lors de la création du patient: %s", e)
+            raise
+    
+    async def bulk_create(self, patients: List[Patient]) -> int:
+        """
+        Crée plusieurs patients avec COPY (asyncpg copy_records_to_table), dans la
+        transaction de la session active : un seul aller-retour pour tout le lot.
+        """
+        if not patients:
+            return 0
+        try:
+            logger.info("Import en masse de %s patients", len(patients))
+            
+            async with self.session_factory() as session:
+                # Le dialecte asyncpg ouvre la transaction au premier ordre SQL : l'ouvrir
+                # avant d'utiliser la connexion du driver, pour que COPY y participe
+                await session.execute(text("SELECT 1"))
+                connection = await session.connection()
+                raw_connection = await connection.get_raw_connection()
+                
+                await raw_connection.driver_connection.copy_records_to_table(
+                    PatientModel.__tablename__,
+                    records=[self._to_record(patient) for patient in patients],
+                    columns=list(BULK_COLUMNS)
+                )
+            
+            logger.info("%s patients importés", len(patients))
+            return len(patients)
+        except Exception as e:
+            logger.exception("Erreur lors de l'import en masse des patients: %s", e)
+            raise
+    
+    async def find_existing_emails(self, emails: Iterable[str]) -> Set[str]:
+        emails = {email for email in emails if email}
+        if not emails:
+            return set()
+        try:
+            async with self.session_factory() as session:
+                query = select(PatientModel.email).where(PatientModel.email.in_(emails))
+                result = await session.execute(query)
+                return set(result.scalars().all())
+        except Exception as e:
+            logger.exception("Erreur lors de la vérification des emails des patients: %s", e)
             raise
     
     async def update(self, patient: Patient) -> Patient:
@@ -120,7 +236,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             Patient: Le patient mis à jour
         """
         try:
-            logger.info(f"Mise à jour du patient: {patient.id}")
+            logger.info("Mise à jour du patient: %s", patient.id)
             
             query = (
                 update(PatientModel)
@@ -151,16 +267,16 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                 )
             )
             
-            await self.session.execute(query)
-            await self.session.commit()
+            async with self.session_factory() as session:
+                await session.execute(query)
+                
+                # Récupérer le patient mis à jour pour le retourner (même session)
+                updated_patient = await self.get_by_id(patient.id)
             
-            # Récupérer le patient mis à jour pour le retourner
-            updated_patient = await self.get_by_id(patient.id)
-            logger.info(f"Patient {patient.id} mis à jour avec succès")
+            logger.info("Patient %s mis à jour avec succès", patient.id)
             return updated_patient
         except Exception as e:
-            logger.exception(f"Erreur lors de la mise à jour du patient {patient.id}: {str(e)}")
-            await self.session.rollback()
+            logger.exception("Erreur lors de la mise à jour du patient %s: %s", patient.id, e)
             raise
     
     async def delete(self, patient_id: UUID) -> bool:
@@ -174,43 +290,64 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             bool: True si le patient a été supprimé, False sinon
         """
         try:
-            logger.info(f"Suppression du patient {patient_id}")
+            logger.info("Suppression du patient %s", patient_id)
             
-            # Vérifier si le patient existe
-            patient = await self.get_by_id(patient_id)
-            if not patient:
-                logger.warning(f"Tentative de suppression d'un patient inexistant: {patient_id}")
-                return False
-            
-            # Supprimer le patient
-            query = delete(PatientModel).where(PatientModel.id == patient_id)
-            result = await self.session.execute(query)
+            # Supprimer le patient (rowcount indique s'il existait)
+            async with self.session_factory() as session:
+                query = delete(PatientModel).where(PatientModel.id == patient_id)
+                result = await session.execute(query)
             
             if result.rowcount == 0:
-                logger.warning(f"Aucune ligne affectée lors de la suppression du patient {patient_id}")
+                logger.warning("Tentative de suppression d'un patient inexistant: %s", patient_id)
                 return False
             
-            await self.session.commit()
-            logger.info(f"Patient {patient_id} supprimé avec succès")
+            logger.info("Patient %s supprimé avec succès", patient_id)
             return True
         except Exception as e:
-            logger.exception(f"Erreur lors de la suppression du patient {patient_id}: {str(e)}")
-            await self.session.rollback()
+            logger.exception("Erreur lors de la suppression du patient %s: %s", patient_id, e)
             raise
     
-    async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
+    async def list_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         """..."""
         try:
-            logger.debug(f"Récupération de la liste des patients (skip={skip}, limit={limit})")
+            logger.debug("Récupération de la liste des patients (skip=%s, limit=%s, order_by=%s, fields=%s)", skip, limit, order_by, fields)
             async with self.session_factory() as session:
-                query = select(PatientModel).offset(skip).limit(limit)
+                query = self._paginate(select(*self._projection(fields)), skip, limit, after, order_by)
                 result = await session.execute(query)
-                patient_models = result.scalars().all()
+                rows = result.all()
                 
-                logger.debug(f"Nombre de patients récupérés: {len(patient_models)}")
-                return [self._map_to_entity(patient_model) for patient_model in patient_models]
+                logger.debug("Nombre de patients récupérés: %s", len(rows))
+                return [self._map_row(row, fields) for row in rows]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération de la liste des patients: {str(e)}")
+            logger.exception("Erreur lors de la récupération de la liste des patients: %s", e)
+            raise
+    
+    async def stream_all(self, order_by: str = "name", batch_size: int = 1000) -> AsyncIterator[Patient]:
+        """
+        Parcourt les patients avec un curseur côté serveur (yield_per) : seuls
+        batch_size patients sont en mémoire à la fois. La session (et sa connexion)
+        reste ouverte jusqu'à la fin du parcours.
+        """
+        try:
+            logger.debug("Parcours en flux des patients (order_by=%s, batch_size=%s)", order_by, batch_size)
+            async with self.session_factory() as session:
+                query = (
+                    select(PatientModel)
+                    .order_by(*SORT_COLUMNS[order_by])
+                    .execution_options(yield_per=batch_size)
+                )
+                result = await session.stream_scalars(query)
+                async for patient_model in result:
+                    yield self._map_to_entity(patient_model)
+        except Exception as e:
+            logger.exception("Erreur lors du parcours en flux des patients: %s", e)
             raise
     
     async def search(
@@ -220,65 +357,270 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
         email: Optional[str] = None,
         phone: Optional[str] = None,
         skip: int = 0,
-        limit: int = 100
-    ) -> List[Patient]:
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> List[Union[Patient, PatientSummary]]:
         try:
-            logger.debug(f"Recherche de patients avec critères: name={name}, date_of_birth={date_of_birth}, email={email}, phone={phone}")
-            
-            # Construire la requête de base
-            query = select(PatientModel)
+            logger.debug("Recherche de patients avec critères: name=%s, date_of_birth=%s, email=%s, phone=%s", name, date_of_birth, email, phone)
             
-            # Ajouter les filtres si fournis
-            filters = []
-            
-            if name:
-                filters.append(
-                    or_(
-                        PatientModel.first_name.ilike(f"%{name}%"),
-                        PatientModel.last_name.ilike(f"%{name}%")
-                    )
-                )
-            
-            if date_of_birth:
-                filters.append(PatientModel.date_of_birth == date_of_birth)
-            
-            if email:
-                filters.append(PatientModel.email == email)
-            
-            if phone:
-                filters.append(PatientModel.phone_number.ilike(f"%{phone}%"))
-            
-            # Ajouter tous les filtres à la requête
-            if filters:
-                query = query.where(and_(*filters))
+            query = self._search_query(
+                select(*self._projection(fields)), name, date_of_birth, email, phone, ranked=order_by is None
+            )
             
             # Ajouter la pagination
-            query = query.offset(skip).limit(limit)
+            query = self._paginate(query, skip, limit, after, order_by)
             
             # Exécuter la requête
             async with self.session_factory() as session:
                 result = await session.execute(query)
-                patient_models = result.scalars().all()
+                rows = result.all()
             
-            logger.debug(f"Nombre de patients trouvés: {len(patient_models)}")
-            return [self._map_to_entity(patient_model) for patient_model in patient_models]
+            logger.debug("Nombre de patients trouvés: %s", len(rows))
+            return [self._map_row(row, fields) for row in rows]
         except Exception as e:
-            logger.exception(f"Erreur lors de la recherche de patients: {str(e)}")
+            logger.exception("Erreur lors de la recherche de patients: %s", e)
             raise
-        
+    
+    async def search_with_total(
+        self,
+        name: Optional[str] = None,
+        date_of_birth: Optional[date] = None,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[Tuple[Any, ...]] = None,
+        order_by: Optional[str] = None,
+        fields: str = "full"
+    ) -> Tuple[List[Union[Patient, PatientSummary]], int]:
+        try:
+            logger.debug("Recherche de patients avec total: name=%s, date_of_birth=%s, email=%s, phone=%s", name, date_of_birth, email, phone)
+            
+            async with self.session_factory() as session:
+                if after is None:
+                    # count(*) OVER () est évalué avant LIMIT/OFFSET : le total arrive avec la page
+                    query = self._search_query(
+                        select(*self._projection(fields), func.count().over().label("total")),
+                        name, date_of_birth, email, phone, ranked=order_by is None
+                    )
+                    result = await session.execute(self._paginate(query, skip, limit, after, order_by))
+                    rows = result.all()
+                    if rows or (skip == 0 and limit > 0):
+                        total = rows[0].total if rows else 0
+                        return [self._map_row(row, fields) for row in rows], total
+                    rows = []
+                else:
+                    # La condition du curseur réduirait le total : page et comptage séparés
+                    query = self._search_query(
+                        select(*self._projection(fields)), name, date_of_birth, email, phone, ranked=False
+                    )
+                    result = await session.execute(self._paginate(query, skip, limit, after, order_by))
+                    rows = result.all()
+                
+                # Page vide au-delà de la fin (ou pagination par curseur) : comptage dédié
+                count_query = self._search_query(
+                    select(func.count()).select_from(PatientModel),
+                    name, date_of_birth, email, phone, ranked=False
+                )
+                total = (await session.execute(count_query)).scalar_one()
+            
+            return [self._map_row(row, fields) for row in rows], total
+        except Exception as e:
+            logger.exception("Erreur lors de la recherche de patients: %s", e)
+            raise
+    
     async def count(self) -> int:
         try:
             logger.debug("Comptage du nombre total de patients")
             async with self.session_factory() as session:
-                query = select(func.count()).select_from(PatientModel)
-                result = await session.execute(query)
+                result = await session.execute(QUERIES["count"])
                 count = result.scalar_one()
-                logger.debug(f"Nombre total de patients: {count}")
+                logger.debug("Nombre total de patients: %s", count)
                 return count
         except Exception as e:
-            logger.exception(f"Erreur lors du comptage des patients: {str(e)}")
+            logger.exception("Erreur lors du comptage des patients: %s", e)
             raise
     
+    async def estimate_count(self) -> int:
+        try:
+            async with self.session_factory() as session:
+                # Estimation maintenue par VACUUM/ANALYZE : aucune lecture de la table
+                result = await session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE oid = CAST(:table AS regclass)"),
+                    {"table": PatientModel.__tablename__}
+                )
+                estimate = result.scalar_one_or_none()
+            
+            if estimate is None or estimate < EXACT_COUNT_BELOW:
+                return await self.count()
+            
+            logger.debug("Nombre estimé de patients: %s", estimate)
+            return estimate
+        except Exception as e:
+            logger.exception("Erreur lors de l'estimation du nombre de patients: %s", e)
+            raise
+    
+    def _search_query(
+        self,
+        query,
+        name: Optional[str],
+        date_of_birth: Optional[date],
+        email: Optional[str],
+        phone: Optional[str],
+        ranked: bool
+    ):
+        """
+        Ajoute les critères de recherche à une requête et, en pagination par décalage,
+        le classement par pertinence.
+        
+        Args:
+            query: La requête de base
+            name: Le nom ou prénom recherché
+            date_of_birth: La date de naissance
+            email: L'email (recherche exacte)
+            phone: Le numéro de téléphone (recherche partielle)
+            ranked: Classer les résultats par pertinence (pagination par décalage)
+            
+        Returns:
+            La requête filtrée
+        """
+        filters = []
+        
+        if name:
+            # Recherche sans accents ni casse, servie par les index trigrammes
+            pattern = _contains(name)
+            filters.append(
+                or_(
+                    FIRST_NAME_SEARCH.like(pattern, escape="\\"),
+                    LAST_NAME_SEARCH.like(pattern, escape="\\")
+                )
+            )
+        
+        if date_of_birth:
+            filters.append(PatientModel.date_of_birth == date_of_birth)
+        
+        if email:
+            filters.append(PatientModel.email == email)
+        
+        if phone:
+            filters.append(PatientModel.phone_number.like(f"%{escape_like(phone)}%", escape="\\"))
+        
+        # Ajouter tous les filtres à la requête
+        if filters:
+            query = query.where(and_(*filters))
+        
+        if name and ranked:
+            # Classement par pertinence (similarité trigramme), puis ordre stable
+            term = _search_term(name)
+            query = query.order_by(
+                func.greatest(
+                    func.similarity(FIRST_NAME_SEARCH, term),
+                    func.similarity(LAST_NAME_SEARCH, term)
+                ).desc(),
+                PatientModel.last_name,
+                PatientModel.id
+            )
+        
+        return query
+        
+    def _paginate(self, query, skip: int, limit: int, after: Optional[Tuple[Any, ...]], order_by: Optional[str]):
+        """
+        Applique la pagination par décalage ou, si order_by est fourni, par curseur.
+        
+        Args:
+            query: La requête à paginer
+            skip: Le nombre de lignes à sauter (pagination par décalage)
+            limit: Le nombre maximum de lignes
+            after: La clé de tri de la dernière ligne de la page précédente
+            order_by: L'ordre de tri stable de la pagination par curseur
+            
+        Returns:
+            La requête paginée
+        """
+        if order_by is None:
+            return query.offset(skip).limit(limit)
+        
+        columns = SORT_COLUMNS.get(order_by)
+        if columns is None:
+            raise ValueError(f"Unknown sort order: {order_by}")
+        
+        if after is not None:
+            # (last_name, id) > (:last_name, :id) : parcours direct de l'index composite
+            query = query.where(tuple_(*columns) > tuple_(*after))
+        return query.order_by(*columns).limit(limit)
+    
+    def _projection(self, fields: str) -> Tuple[Any, ...]:
+        """
+        Retourne les éléments à sélectionner pour une projection.
+        
+        Args:
+            fields: "full" (modèle complet) ou "summary" (colonnes de SUMMARY_COLUMNS)
+            
+        Returns:
+            Tuple: Les arguments de select()
+        """
+        if fields == "full":
+            return (PatientModel,)
+        if fields == "summary":
+            return SUMMARY_COLUMNS
+        raise ValueError(f"Unknown projection: {fields}")
+    
+    def _map_row(self, row, fields: str) -> Union[Patient, PatientSummary]:
+        """
+        Convertit une ligne de résultat selon la projection demandée.
+        
+        Args:
+            row: La ligne (modèle complet ou colonnes résumées, suivies d'éventuelles
+                colonnes calculées comme le total)
+            fields: La projection de la requête
+            
+        Returns:
+            Patient ou PatientSummary
+        """
+        if fields == "summary":
+            return PatientSummary(*row[:len(SUMMARY_COLUMNS)])
+        return self._map_to_entity(row[0])
+    
+    def _to_record(self, patient: Patient) -> Tuple[Any, ...]:
+        """
+        Convertit une entité en enregistrement COPY (ordre de BULK_COLUMNS).
+        Les colonnes JSONB sont transmises sous forme de texte JSON.
+        
+        Args:
+            patient: L'entité à convertir
+            
+        Returns:
+            Tuple: L'enregistrement correspondant
+        """
+        return (
+            patient.id,
+            patient.first_name,
+            patient.last_name,
+            patient.date_of_birth,
+            patient.gender,
+            patient.address,
+            patient.city,
+            patient.postal_code,
+            patient.country,
+            patient.phone_number,
+            patient.email,
+            patient.blood_type,
+            json.dumps(patient.allergies or {}),
+            json.dumps(patient.chronic_diseases or {}),
+            json.dumps(patient.current_medications or {}),
+            patient.has_consent,
+            patient.consent_date,
+            patient.gdpr_consent,
+            patient.insurance_provider,
+            patient.insurance_id,
+            patient.notes,
+            patient.created_at,
+            patient.updated_at,
+            patient.is_active
+        )
+    
     def _map_to_entity(self, patient_model: PatientModel) -> Patient:
         """
         Convertit un modèle SQLAlchemy en entité du domaine.
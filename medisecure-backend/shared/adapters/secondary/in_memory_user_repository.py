@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 from shared.domain.entities.user import User
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
@@ -28,6 +28,18 @@ class InMemoryUserRepository(UserRepositoryProtocol):
         """
         return self.users.get(user_id)
     
+    async def get_many(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Récupère plusieurs utilisateurs par leurs IDs.
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            Dict[UUID, User]: Les utilisateurs trouvés, indexés par ID
+        """
+        return {user_id: self.users[user_id] for user_id in set(user_ids) if user_id in self.users}
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Récupère un utilisateur par son email.
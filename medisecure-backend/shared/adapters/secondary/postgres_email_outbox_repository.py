@@ -0,0 +1,149 @@
+from datetime import timedelta
+from typing import List
+from uuid import UUID, uuid4
+from sqlalchemy.future import select
+from sqlalchemy import and_, delete, func, or_, update
+
+from shared.domain.entities.outbox_message import OutboxMessage
+from shared.infrastructure.database.models.email_outbox_model import (
+    OUTBOX_FAILED,
+    OUTBOX_PENDING,
+    OUTBOX_SENDING,
+    OUTBOX_SENT,
+    EmailOutboxModel
+)
+from shared.ports.secondary.email_outbox_protocol import EmailOutboxProtocol
+
+class PostgresEmailOutboxRepository(EmailOutboxProtocol):
+    """
+    Adaptateur secondaire pour la boîte d'envoi des emails avec PostgreSQL.
+    Implémente le port EmailOutboxProtocol.
+
+    Avec un SessionScope, enqueue rejoint la transaction de l'unité de travail active :
+    l'email n'existe que si l'opération métier est validée.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialise le repository avec une factory de session SQLAlchemy.
+
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+
+    async def enqueue(self, sender: str, recipients: List[str], raw_message: str) -> UUID:
+        message_id = uuid4()
+        async with self.session_factory() as session:
+            session.add(EmailOutboxModel(
+                id=message_id,
+                sender=sender,
+                recipients=list(recipients),
+                raw_message=raw_message
+            ))
+            await session.flush()
+        return message_id
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> List[OutboxMessage]:
+        async with self.session_factory() as session:
+            # SKIP LOCKED : plusieurs workers se partagent la file sans s'attendre ;
+            # les verrous de ligne ne durent que le temps de cette mise à jour
+            claimable = (
+                select(EmailOutboxModel.id)
+                .where(or_(
+                    and_(
+                        EmailOutboxModel.status == OUTBOX_PENDING,
+                        EmailOutboxModel.next_attempt_at <= func.now()
+                    ),
+                    and_(
+                        EmailOutboxModel.status == OUTBOX_SENDING,
+                        EmailOutboxModel.lease_expires_at <= func.now()
+                    )
+                ))
+                .order_by(EmailOutboxModel.next_attempt_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            query = (
+                update(EmailOutboxModel)
+                .where(EmailOutboxModel.id.in_(claimable))
+                .values(
+                    status=OUTBOX_SENDING,
+                    lease_expires_at=func.now() + timedelta(seconds=lease_seconds)
+                )
+                .returning(EmailOutboxModel)
+                .execution_options(synchronize_session=False)
+            )
+            result = await session.execute(query)
+            models = sorted(result.scalars().all(), key=lambda model: model.next_attempt_at)
+            return [self._map_to_entity(model) for model in models]
+
+    async def mark_sent(self, message_id: UUID) -> None:
+        await self._update(
+            message_id,
+            status=OUTBOX_SENT,
+            sent_at=func.now(),
+            last_error=None,
+            lease_expires_at=None,
+            # Le contenu (noms, rendez-vous) n'est plus nécessaire une fois l'email envoyé
+            raw_message=""
+        )
+
+    async def mark_retry(self, message_id: UUID, error: str, delay_seconds: float) -> None:
+        await self._update(
+            message_id,
+            status=OUTBOX_PENDING,
+            attempts=EmailOutboxModel.attempts + 1,
+            last_error=error,
+            next_attempt_at=func.now() + timedelta(seconds=delay_seconds),
+            lease_expires_at=None
+        )
+
+    async def mark_failed(self, message_id: UUID, error: str) -> None:
+        await self._update(
+            message_id,
+            status=OUTBOX_FAILED,
+            attempts=EmailOutboxModel.attempts + 1,
+            last_error=error,
+            lease_expires_at=None
+        )
+
+    async def purge(self, retention_seconds: float) -> int:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                delete(EmailOutboxModel)
+                .where(
+                    EmailOutboxModel.status.in_((OUTBOX_SENT, OUTBOX_FAILED)),
+                    EmailOutboxModel.created_at < func.now() - timedelta(seconds=retention_seconds)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount
+
+    async def pending_count(self) -> int:
+        async with self.session_factory() as session:
+            query = select(func.count()).select_from(EmailOutboxModel).where(
+                EmailOutboxModel.status == OUTBOX_PENDING
+            )
+            result = await session.execute(query)
+            return result.scalar_one()
+
+    async def _update(self, message_id: UUID, **values) -> None:
+        """Met à jour un message de la boîte d'envoi."""
+        async with self.session_factory() as session:
+            await session.execute(
+                update(EmailOutboxModel)
+                .where(EmailOutboxModel.id == message_id)
+                .values(**values)
+            )
+
+    def _map_to_entity(self, model: EmailOutboxModel) -> OutboxMessage:
+        """Convertit un modèle SQLAlchemy en entité du domaine"""
+        return OutboxMessage(
+            id=model.id,
+            sender=model.sender,
+            recipients=list(model.recipients),
+            raw_message=model.raw_message,
+            attempts=model.attempts,
+            created_at=model.created_at
+        )
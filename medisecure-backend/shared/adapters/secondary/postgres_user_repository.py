@@ -1,14 +1,18 @@
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete
+from sqlalchemy import update, delete, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from shared.domain.entities.user import User
 from shared.domain.enums.roles import UserRole
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
 
+# Un seul texte SQL quelle que soit la taille du lot (requête préparée réutilisée)
+GET_MANY_QUERY = select(UserModel).where(UserModel.id == any_(bindparam("user_ids", type_=ARRAY(UserModel.id.type))))
+
 class PostgresUserRepository(UserRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des utilisateurs avec PostgreSQL.
@@ -35,6 +39,23 @@ class PostgresUserRepository(UserRepositoryProtocol):
             
             return self._map_to_entity(user_model)
     
+    async def get_many(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Récupère plusieurs utilisateurs par leurs IDs (WHERE id = ANY(:user_ids)).
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            Dict[UUID, User]: Les utilisateurs trouvés, indexés par ID
+        """
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return {}
+        async with self.session_factory() as session:
+            result = await session.execute(GET_MANY_QUERY, {"user_ids": user_ids})
+            return {model.id: self._map_to_entity(model) for model in result.scalars()}
+    
     async def get_by_email(self, email: str) -> Optional[User]:
         """
         Récupère un utilisateur par son email.
@@ -78,7 +99,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
             
             session.add(user_model)
-            await session.commit()
+            await session.flush()
             await session.refresh(user_model)
             
             return self._map_to_entity(user_model)
@@ -106,8 +127,8 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
         )
         
-        await self.session.execute(query)
-        await self.session.commit()
+        async with self.session_factory() as session:
+            await session.execute(query)
         
         return user
     
@@ -122,13 +143,10 @@ class PostgresUserRepository(UserRepositoryProtocol):
             bool: True si l'utilisateur a été supprimé, False sinon
         """
         query = delete(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(query)
-        
-        if result.rowcount == 0:
-            return False
+        async with self.session_factory() as session:
+            result = await session.execute(query)
         
-        await self.session.commit()
-        return True
+        return result.rowcount > 0
     
     async def list_all(self) -> List[User]:
         """
@@ -138,8 +156,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste de tous les utilisateurs
         """
         query = select(UserModel)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -154,8 +173,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste des utilisateurs ayant le rôle spécifié
         """
         query = select(UserModel).where(UserModel.role == role)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -191,31 +211,8 @@ class PostgresUserRepository(UserRepositoryProtocol):
             str: Le mot de passe hashé de l'utilisateur
         """
         query = select(UserModel.hashed_password).where(UserModel.id == user.id)
-        result = await self.session.execute(query)
-        hashed_password = result.scalar_one_or_none()
-        
-        return hashed_password
-    
-    def get_hashed_password(self, user):
-        """
-        Récupère le mot de passe hashé d'un utilisateur.
-        
-        Args:
-            user: L'utilisateur dont on veut récupérer le mot de passe hashé
-            
-        Returns:
-            str: Le mot de passe hashé de l'utilisateur
-        """
-        # Exécuter une requête pour récupérer le mot de passe hashé
-        async def get_password():
-            query = select(UserModel.hashed_password).where(UserModel.id == user.id)
-            result = await self.session.execute(query)
+        async with self.session_factory() as session:
+            result = await session.execute(query)
             hashed_password = result.scalar_one_or_none()
-            return hashed_password
         
-        # Exécuter la tâche asynchrone de manière synchrone pour simplifier l'interface
-        import asyncio
-        loop = asyncio.get_event_loop()
-        hashed_password = loop.run_until_complete(get_password())
-        
-        return hashed_password
\ No newline at end of file
+        return hashed_password
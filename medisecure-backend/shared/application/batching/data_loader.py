@@ -0,0 +1,144 @@
+# medisecure-backend/shared/application/batching/data_loader.py
+"""
+Regroupement des lectures par identifiant (motif DataLoader).
+
+Les appels à load() faits pendant un même tour de la boucle d'événements (par
+exemple plusieurs get_by_id lancés avec asyncio.gather) sont regroupés en un seul
+appel de la fonction de lot, typiquement repository.get_many(ids) : une requête
+WHERE id = ANY(...) au lieu d'une requête par identifiant.
+
+Un DataLoader mémorise les valeurs chargées : il est propre à une requête (une
+instance par requête HTTP, voir Container.patient_loader) et ne doit pas être
+partagé entre utilisateurs. Les lots de deux loaders différents peuvent s'exécuter
+en même temps : dans une unité de travail (session partagée), attendre un loader
+avant d'en solliciter un autre.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Generic, Hashable, Iterable, List, Mapping, Optional, Set, TypeVar
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchLoadFunction = Callable[[List[K]], Awaitable[Mapping[K, V]]]
+
+class DataLoader(Generic[K, V]):
+    """Regroupe et mémorise les lectures par clé d'une requête."""
+
+    def __init__(self, batch_load: BatchLoadFunction, max_batch_size: Optional[int] = None):
+        """
+        Initialise le loader.
+
+        Args:
+            batch_load: La fonction de lot : reçoit des clés distinctes, retourne les
+                valeurs trouvées indexées par clé (les clés absentes valent None)
+            max_batch_size: Le nombre maximal de clés par appel de la fonction de lot
+
+        Raises:
+            ValueError: Si max_batch_size est inférieur à 1
+        """
+        if max_batch_size is not None and max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self._futures: Dict[K, "asyncio.Future[Optional[V]]"] = {}
+        self._queue: List[K] = []
+        self._dispatch_scheduled = False
+        self._batches: Set["asyncio.Task[None]"] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Charge une valeur, avec les autres clés demandées pendant le même tour de boucle.
+
+        Args:
+            key: La clé à charger
+
+        Returns:
+            Optional[V]: La valeur, ou None si la clé est inconnue
+
+        Raises:
+            Exception: L'erreur levée par la fonction de lot
+        """
+        future = self._futures.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._futures[key] = future
+            self._queue.append(key)
+            if not self._dispatch_scheduled:
+                self._dispatch_scheduled = True
+                loop.call_soon(self._dispatch)
+        # shield : l'annulation d'un appelant n'annule pas la lecture partagée
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> List[Optional[V]]:
+        """
+        Charge plusieurs valeurs (un seul lot pour les clés non encore chargées).
+
+        Args:
+            keys: Les clés à charger
+
+        Returns:
+            List[Optional[V]]: Les valeurs, dans l'ordre des clés
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: K, value: V) -> None:
+        """
+        Enregistre une valeur déjà connue (ex : entité lue par une autre requête).
+
+        Args:
+            key: La clé
+            value: La valeur
+        """
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: K) -> None:
+        """
+        Oublie une valeur mémorisée (après une écriture).
+
+        Args:
+            key: La clé à oublier
+        """
+        future = self._futures.get(key)
+        if future is not None and future.done():
+            del self._futures[key]
+
+    def _dispatch(self) -> None:
+        """Lance le chargement des clés accumulées pendant le tour de boucle."""
+        keys, self._queue = self._queue, []
+        self._dispatch_scheduled = False
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            task = asyncio.ensure_future(self._load_batch(keys[start:start + size]))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+
+    async def _load_batch(self, keys: List[K]) -> None:
+        """
+        Exécute la fonction de lot et résout les attentes correspondantes.
+
+        Args:
+            keys: Les clés du lot
+        """
+        try:
+            values = await self.batch_load(keys)
+        except Exception as e:
+            logger.warning("Échec du chargement groupé de %s clés: %s", len(keys), e)
+            for key in keys:
+                # Une erreur n'est pas mémorisée : un nouvel appel relance la lecture
+                future = self._futures.pop(key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for key in keys:
+            future = self._futures[key]
+            if not future.done():
+                future.set_result(values.get(key))
@@ -0,0 +1,145 @@
+# medisecure-backend/shared/application/concurrency/task_group.py
+"""
+Exécution concurrente d'entrées/sorties indépendantes (concurrence structurée).
+
+Un TaskGroup lance des tâches et ne se termine qu'une fois toutes terminées. Si
+l'une échoue, ou si le délai est dépassé, les autres sont annulées avant que
+l'erreur ne soit propagée : aucune tâche ne survit au bloc.
+
+    async with TaskGroup(timeout=5) as group:
+        patients = group.spawn(patient_repository.list_all(skip, limit))
+        total = group.spawn(patient_repository.count())
+    patients.result(), total.result()
+
+run_concurrently(...) couvre le cas courant (des lectures indépendantes dont on veut
+les résultats) en tenant compte de l'unité de travail : une AsyncSession ne supporte
+pas plusieurs requêtes simultanées, donc les lectures qui rejoindraient la session
+partagée sont exécutées l'une après l'autre. Elles ne sont jamais détachées sur
+d'autres connexions : une requête qui détient déjà une connexion (et parfois un
+verrou) n'attend pas d'autres connexions du pool, et ses lectures restent dans sa
+transaction.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, List, Optional, TypeVar
+
+from shared.infrastructure.database.unit_of_work import get_current_session
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+class TaskGroup:
+    """Groupe de tâches annulées ensemble à la première erreur ou à l'expiration du délai."""
+
+    def __init__(self, timeout: Optional[float] = None):
+        """
+        Initialise le groupe.
+
+        Args:
+            timeout: Le délai maximal (s) d'attente des tâches, compté à la sortie du bloc
+        """
+        self.timeout = timeout
+        self._tasks: List[asyncio.Task] = []
+
+    def spawn(self, awaitable: Awaitable[T]) -> "asyncio.Future[T]":
+        """
+        Lance une tâche dans le groupe.
+
+        Args:
+            awaitable: La coroutine à exécuter
+
+        Returns:
+            asyncio.Future: La tâche, dont le résultat est disponible à la sortie du bloc
+        """
+        task = asyncio.ensure_future(awaitable)
+        self._tasks.append(task)
+        return task
+
+    async def __aenter__(self) -> "TaskGroup":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            await self._cancel_all()
+            return False
+
+        try:
+            await self._wait()
+        except BaseException:
+            # Erreur d'une tâche, délai dépassé ou annulation de la tâche appelante
+            await self._cancel_all()
+            raise
+        return False
+
+    async def _wait(self) -> None:
+        """
+        Attend toutes les tâches.
+
+        Raises:
+            asyncio.TimeoutError: Si le délai est dépassé
+            Exception: La première erreur levée par une tâche
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if self.timeout is None else loop.time() + self.timeout
+        pending = set(self._tasks)
+
+        while pending:
+            remaining = None if deadline is None else max(deadline - loop.time(), 0)
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_EXCEPTION)
+            if not done:
+                logger.warning("Délai de %ss dépassé, annulation de %s tâche(s)", self.timeout, len(pending))
+                raise asyncio.TimeoutError(f"Tasks did not complete within {self.timeout}s")
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    raise task.exception()
+
+    async def _cancel_all(self) -> None:
+        """Annule les tâches encore en cours et attend leur fin."""
+        for task in self._tasks:
+            if not task.done():
+                task.cancel()
+        # Récupère aussi les exceptions des tâches annulées ou en échec (pas d'avertissement "never retrieved")
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+async def _sequentially(awaitables: List[Awaitable[Any]]) -> List[Any]:
+    """Exécute les coroutines l'une après l'autre."""
+    results = []
+    try:
+        for awaitable in awaitables:
+            results.append(await awaitable)
+    finally:
+        # Les coroutines non démarrées après une erreur sont fermées
+        for awaitable in awaitables[len(results) + 1:]:
+            close = getattr(awaitable, "close", None)
+            if close is not None:
+                close()
+    return results
+
+async def run_concurrently(*awaitables: Awaitable[Any], timeout: Optional[float] = None) -> List[Any]:
+    """
+    Exécute des lectures indépendantes en parallèle et retourne leurs résultats.
+
+    Hors unité de travail, chaque lecture ouvre sa propre session, donc sa propre
+    connexion du pool. Dans une unité de travail, les lectures partageraient la même
+    session : elles sont exécutées l'une après l'autre.
+
+    Args:
+        *awaitables: Les coroutines à exécuter
+        timeout: Le délai maximal (s) pour l'ensemble des lectures
+
+    Returns:
+        List[Any]: Les résultats, dans l'ordre des coroutines
+
+    Raises:
+        asyncio.TimeoutError: Si le délai est dépassé (les lectures en cours sont annulées)
+        Exception: La première erreur levée par une lecture (les autres sont annulées)
+    """
+    pending = list(awaitables)
+    if get_current_session() is not None:
+        return await asyncio.wait_for(_sequentially(pending), timeout)
+
+    async with TaskGroup(timeout) as group:
+        tasks = [group.spawn(awaitable) for awaitable in pending]
+    return [task.result() for task in tasks]
@@ -0,0 +1,73 @@
+# medisecure-backend/shared/application/mapping/response_mapper.py
+"""
+Conversion des entités du domaine en DTOs de réponse.
+
+Le DTO est construit directement à partir des attributs de l'objet source
+(from_orm / from_attributes) : pas de copie champ par champ ni de dictionnaire
+intermédiaire. Avec pydantic 2, la lecture des attributs et la validation sont faites
+en une passe par pydantic-core, plus rapidement qu'un model_construct (sans
+validation, mais exécuté en Python).
+"""
+from functools import partial
+from typing import Any, Generic, Iterable, List, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+DTO = TypeVar("DTO", bound=BaseModel)
+
+
+def _model_fields(dto_class: Type[BaseModel]) -> Sequence[str]:
+    """Noms des champs d'un modèle pydantic (v2 : model_fields, v1 : __fields__)."""
+    fields = getattr(dto_class, "model_fields", None)
+    if fields is None:
+        fields = dto_class.__fields__
+    return tuple(fields)
+
+
+class ResponseMapper(Generic[DTO]):
+    """
+    Convertit un objet (entité, modèle ORM) en DTO de réponse.
+
+    Chaque champ du DTO est lu sur l'objet source sous le même nom. Sous pydantic 1,
+    le DTO doit déclarer orm_mode = True.
+    """
+
+    def __init__(self, dto_class: Type[DTO]):
+        """
+        Prépare la conversion.
+
+        Args:
+            dto_class: La classe du DTO de réponse
+        """
+        self.dto_class = dto_class
+        self.fields = _model_fields(dto_class)
+        model_validate = getattr(dto_class, "model_validate", None)
+        if model_validate is not None:
+            self._convert = partial(model_validate, from_attributes=True)
+        else:
+            self._convert = dto_class.from_orm
+
+    def __call__(self, source: Any) -> DTO:
+        """
+        Convertit un objet.
+
+        Args:
+            source: L'objet à convertir
+
+        Returns:
+            DTO: Le DTO de réponse
+        """
+        return self._convert(source)
+
+    def many(self, sources: Iterable[Any]) -> List[DTO]:
+        """
+        Convertit une liste d'objets.
+
+        Args:
+            sources: Les objets à convertir
+
+        Returns:
+            List[DTO]: Les DTOs de réponse, dans le même ordre
+        """
+        convert = self._convert
+        return [convert(source) for source in sources]
@@ -0,0 +1,100 @@
+# medisecure-backend/shared/application/pagination/counting.py
+"""
+Comptage du total des listes paginées.
+
+Le mode est choisi par requête :
+- "exact" : comptage exact (fonction de fenêtre dans la requête de la page si possible)
+- "estimated" : valeur rapide, éventuellement approchée ou en retard d'au plus le TTL du cache
+- "none" : pas de total (le client suit next_cursor ou s'arrête sur une page incomplète)
+"""
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Hashable, Optional
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+COUNT_MODES = ("exact", "estimated", "none")
+
+
+@dataclass(frozen=True)
+class CountResult:
+    """
+    Total d'une liste.
+
+    Attributes:
+        total: Le total, ou None si non demandé
+        estimated: True si le total est une estimation
+    """
+    total: Optional[int]
+    estimated: bool = False
+
+
+class CachedCounter:
+    """
+    Fournit les totaux estimés en les gardant en cache pendant un TTL.
+
+    Le cache est partagé par toutes les requêtes du processus : une page listée
+    plusieurs fois par seconde ne déclenche qu'un comptage par TTL.
+    """
+
+    def __init__(self, cache: TTLCache):
+        """
+        Initialise le compteur.
+
+        Args:
+            cache: Le cache TTL des totaux
+        """
+        self.cache = cache
+
+    async def estimated(self, key: Hashable, loader: Callable[[], Awaitable[int]]) -> CountResult:
+        """
+        Retourne un total estimé, depuis le cache ou en appelant `loader`.
+
+        Args:
+            key: La clé du total (ex: table et critères de recherche)
+            loader: Fonction asynchrone calculant le total
+
+        Returns:
+            CountResult: Le total estimé
+        """
+        cached = self.cached(key)
+        if cached is not None:
+            return cached
+        return self.remember(key, await loader())
+
+    def cached(self, key: Hashable) -> Optional[CountResult]:
+        """
+        Retourne le total en cache pour une clé, s'il n'a pas expiré.
+
+        Args:
+            key: La clé du total
+
+        Returns:
+            Optional[CountResult]: Le total estimé, ou None
+        """
+        total = self.cache.get(key)
+        if total is None:
+            return None
+        return CountResult(total=total, estimated=True)
+
+    def remember(self, key: Hashable, total: int) -> CountResult:
+        """
+        Met en cache un total calculé par ailleurs (ex: avec la page de résultats).
+
+        Args:
+            key: La clé du total
+            total: Le total calculé
+
+        Returns:
+            CountResult: Le total, marqué comme estimation pour les lectures suivantes
+        """
+        self.cache.set(key, total)
+        logger.debug("Total mis en cache pour %s: %s", key, total)
+        return CountResult(total=total, estimated=True)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Oublie un total en cache (ex: après une insertion en masse)."""
+        self.cache.invalidate(key)
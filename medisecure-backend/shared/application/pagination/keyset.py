@@ -0,0 +1,149 @@
+# medisecure-backend/shared/application/pagination/keyset.py
+"""
+Pagination par curseur (keyset pagination).
+
+Au lieu de sauter N lignes (OFFSET), on reprend après la clé de tri du dernier
+élément renvoyé : le coût d'une page ne dépend plus de sa position. La clé est
+transmise au client sous forme d'un curseur opaque (JSON encodé en base64 url).
+"""
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+
+class InvalidCursorException(ValueError):
+    """Exception levée lorsqu'un curseur de pagination est invalide"""
+    pass
+
+
+@dataclass(frozen=True)
+class KeysetCursor:
+    """
+    Position dans une liste triée.
+
+    Attributes:
+        order_by: Le nom de l'ordre de tri pour lequel le curseur a été émis
+        values: Les valeurs de la clé de tri du dernier élément vu
+    """
+    order_by: str
+    values: Tuple[Any, ...]
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """Une page de résultats et le curseur de la page suivante (None si dernière page)"""
+    items: List[T]
+    next_cursor: Optional[str]
+
+
+def _encode_value(value: Any) -> Any:
+    """Encode une valeur de clé en conservant son type."""
+    if isinstance(value, UUID):
+        return {"u": str(value)}
+    if isinstance(value, datetime):
+        return {"t": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    """Décode une valeur de clé encodée par _encode_value."""
+    if isinstance(value, dict) and len(value) == 1:
+        (tag, raw), = value.items()
+        if tag == "u":
+            return UUID(raw)
+        if tag == "t":
+            return datetime.fromisoformat(raw)
+        if tag == "d":
+            return date.fromisoformat(raw)
+    return value
+
+
+def encode_cursor(order_by: str, values: Sequence[Any]) -> str:
+    """
+    Encode une clé de tri en curseur opaque.
+
+    Args:
+        order_by: Le nom de l'ordre de tri
+        values: Les valeurs de la clé de tri
+
+    Returns:
+        str: Le curseur opaque
+    """
+    payload = {"o": order_by, "k": [_encode_value(v) for v in values]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, expected_order_by: str, key_types: Sequence[type]) -> KeysetCursor:
+    """
+    Décode un curseur opaque.
+
+    Le curseur vient du client : sa clé est vérifiée (nombre et type des valeurs)
+    avant d'être comparée aux colonnes de tri.
+
+    Args:
+        cursor: Le curseur reçu du client
+        expected_order_by: L'ordre de tri de la requête courante
+        key_types: Le type de chaque valeur de la clé de tri, dans l'ordre
+
+    Returns:
+        KeysetCursor: La position décodée
+
+    Raises:
+        InvalidCursorException: Si le curseur est mal formé, émis pour un autre tri ou
+            si sa clé ne correspond pas aux colonnes de tri
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        order_by = payload["o"]
+        values = tuple(_decode_value(v) for v in payload["k"])
+    except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError) as e:
+        raise InvalidCursorException("Invalid pagination cursor") from e
+
+    if order_by != expected_order_by:
+        raise InvalidCursorException(
+            f"Pagination cursor was issued for order '{order_by}', not '{expected_order_by}'"
+        )
+    if len(values) != len(key_types) or not all(
+        isinstance(value, key_type) for value, key_type in zip(values, key_types)
+    ):
+        raise InvalidCursorException(f"Pagination cursor key does not match order '{order_by}'")
+    return KeysetCursor(order_by=order_by, values=values)
+
+
+def build_keyset_page(
+    items: List[T],
+    limit: int,
+    order_by: str,
+    sort_key: Callable[[T, str], Tuple[Any, ...]]
+) -> KeysetPage[T]:
+    """
+    Construit une page à partir de `limit + 1` éléments lus.
+
+    Lire un élément de plus que demandé indique s'il existe une page suivante
+    sans requête de comptage.
+
+    Args:
+        items: Les éléments lus (au plus limit + 1)
+        limit: La taille de page demandée
+        order_by: Le nom de l'ordre de tri
+        sort_key: Fonction retournant la clé de tri d'un élément
+
+    Returns:
+        KeysetPage: La page et le curseur de la page suivante
+    """
+    if limit <= 0 or len(items) <= limit:
+        return KeysetPage(items=items[:max(limit, 0)], next_cursor=None)
+
+    page_items = items[:limit]
+    next_cursor = encode_cursor(order_by, sort_key(page_items[-1], order_by))
+    return KeysetPage(items=page_items, next_cursor=next_cursor)
@@ -0,0 +1,17 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+@dataclass
+class OutboxMessage:
+    """
+    Entité email en attente d'envoi dans la boîte d'envoi transactionnelle (outbox).
+    Le message est conservé au format MIME, prêt à être transmis au serveur SMTP.
+    """
+    id: UUID
+    sender: str
+    recipients: List[str] = field(default_factory=list)
+    raw_message: str = ""
+    attempts: int = 0
+    created_at: Optional[datetime] = None
@@ -0,0 +1,63 @@
+# medisecure-backend/shared/infrastructure/cache/codec.py
+"""
+Sérialisation JSON des valeurs mises en cache.
+
+Les UUID, dates et dates-heures sont balisés pour être restitués avec leur type.
+JSON plutôt que pickle : un cache distant compromis ne doit pas permettre
+d'exécuter du code dans l'application.
+"""
+import json
+from datetime import date, datetime
+from typing import Any, Dict
+from uuid import UUID
+
+_UUID_TAG = "__uuid__"
+_DATETIME_TAG = "__datetime__"
+_DATE_TAG = "__date__"
+
+
+def _default(value: Any) -> Dict[str, str]:
+    if isinstance(value, UUID):
+        return {_UUID_TAG: str(value)}
+    if isinstance(value, datetime):
+        return {_DATETIME_TAG: value.isoformat()}
+    if isinstance(value, date):
+        return {_DATE_TAG: value.isoformat()}
+    raise TypeError(f"Object of type {type(value).__name__} is not cache-serializable")
+
+
+def _object_hook(value: Dict[str, Any]) -> Any:
+    if len(value) == 1:
+        if _UUID_TAG in value:
+            return UUID(value[_UUID_TAG])
+        if _DATETIME_TAG in value:
+            return datetime.fromisoformat(value[_DATETIME_TAG])
+        if _DATE_TAG in value:
+            return date.fromisoformat(value[_DATE_TAG])
+    return value
+
+
+def dumps(value: Any) -> str:
+    """
+    Sérialise une valeur pour le cache.
+
+    Args:
+        value: La valeur (types JSON, UUID, date, datetime)
+
+    Returns:
+        str: La valeur sérialisée
+    """
+    return json.dumps(value, default=_default, separators=(",", ":"))
+
+
+def loads(data: str) -> Any:
+    """
+    Désérialise une valeur lue dans le cache.
+
+    Args:
+        data: La valeur sérialisée par dumps
+
+    Returns:
+        Any: La valeur restituée
+    """
+    return json.loads(data, object_hook=_object_hook)
@@ -0,0 +1,55 @@
+# medisecure-backend/shared/infrastructure/cache/factory.py
+import os
+import logging
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+from shared.infrastructure.cache.memory_cache import InMemoryCache
+from shared.infrastructure.cache.null_cache import NullCache
+from shared.infrastructure.cache.redis_cache import RedisCache
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+def worker_count() -> int:
+    """
+    Nombre de processus qui servent l'API (WEB_CONCURRENCY, transmis aux workers
+    par api.server).
+    
+    Returns:
+        int: Le nombre de workers, au moins 1
+    """
+    return max(int(os.getenv("WEB_CONCURRENCY") or 1), 1)
+
+def create_cache(name: str, ttl_seconds: float, max_size: int, invalidated: bool = False) -> CacheProtocol:
+    """
+    Crée le cache à utiliser : Redis si REDIS_URL est défini, sinon un cache en mémoire.
+    
+    Un cache invalidé à l'écriture ne peut pas rester en mémoire lorsque plusieurs
+    workers servent l'API : l'invalidation n'atteindrait que le cache du worker qui
+    a traité l'écriture. Sans Redis, un tel cache est alors désactivé.
+    
+    Args:
+        name: Le nom du cache (préfixe des clés, label des métriques)
+        ttl_seconds: La durée de vie des entrées
+        max_size: Le nombre maximal d'entrées du cache en mémoire
+        invalidated: Les entrées sont invalidées à chaque modification de la donnée
+        
+    Returns:
+        CacheProtocol: Le cache
+    """
+    redis_url = os.getenv("REDIS_URL")
+    if redis_url:
+        try:
+            logger.info("Cache '%s' stocké dans Redis", name)
+            return RedisCache(name, redis_url, ttl_seconds)
+        except RuntimeError as e:
+            logger.warning("Cache '%s' en mémoire, Redis indisponible: %s", name, e)
+    
+    workers = worker_count()
+    if invalidated and workers > 1:
+        logger.warning(
+            "Cache '%s' désactivé : %s workers sans cache partagé (REDIS_URL), "
+            "une invalidation n'atteindrait qu'un seul worker", name, workers
+        )
+        return NullCache(name)
+    return InMemoryCache(name, ttl_seconds, max_size)
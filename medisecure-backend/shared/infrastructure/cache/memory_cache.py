@@ -0,0 +1,45 @@
+# medisecure-backend/shared/infrastructure/cache/memory_cache.py
+from typing import Dict, Mapping, Optional, Sequence
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.monitoring.prometheus_metrics import CACHE_EVICTIONS
+
+class InMemoryCache(CacheProtocol):
+    """
+    Adaptateur secondaire pour un cache en mémoire du processus (LRU avec TTL).
+    Implémente le port CacheProtocol.
+    """
+    
+    def __init__(self, name: str, ttl_seconds: float, max_size: int):
+        """
+        Initialise le cache.
+        
+        Args:
+            name: Le nom du cache (label des métriques)
+            ttl_seconds: La durée de vie des entrées
+            max_size: Le nombre maximal d'entrées
+        """
+        self.name = name
+        self._entries: TTLCache[str, str] = TTLCache(ttl_seconds=ttl_seconds, max_size=max_size)
+    
+    async def get(self, key: str) -> Optional[str]:
+        return self._entries.get(key)
+    
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        # Sans await entre la lecture et l'écriture : atomique dans la boucle d'événements
+        if if_absent and self._entries.get(key) is not None:
+            return
+        if self._entries.set(key, value, ttl_seconds) is not None:
+            CACHE_EVICTIONS.labels(cache=self.name).inc()
+    
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        values = {key: self._entries.get(key) for key in keys}
+        return {key: value for key, value in values.items() if value is not None}
+    
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        for key, value in items.items():
+            await self.set(key, value, ttl_seconds, if_absent)
+    
+    async def delete(self, key: str) -> None:
+        self._entries.invalidate(key)
@@ -0,0 +1,34 @@
+# medisecure-backend/shared/infrastructure/cache/null_cache.py
+from typing import Dict, Mapping, Optional, Sequence
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+
+class NullCache(CacheProtocol):
+    """
+    Adaptateur secondaire pour un cache désactivé : aucune valeur n'est conservée,
+    chaque lecture est une absence. Implémente le port CacheProtocol.
+    """
+    
+    def __init__(self, name: str):
+        """
+        Initialise le cache.
+        
+        Args:
+            name: Le nom du cache
+        """
+        self.name = name
+    
+    async def get(self, key: str) -> Optional[str]:
+        return None
+    
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        return None
+    
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        return {}
+    
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        return None
+    
+    async def delete(self, key: str) -> None:
+        return None
@@ -0,0 +1,64 @@
+# medisecure-backend/shared/infrastructure/cache/redis_cache.py
+from typing import Dict, Mapping, Optional, Sequence
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    redis_asyncio = None
+
+class RedisCache(CacheProtocol):
+    """
+    Adaptateur secondaire pour un cache Redis (ou compatible), partagé entre les
+    processus et les pods. Implémente le port CacheProtocol.
+    
+    Nécessite le paquet optionnel `redis`. Les entrées expirent côté serveur (PX) ;
+    if_absent correspond à SET NX.
+    """
+    
+    def __init__(self, name: str, url: str, ttl_seconds: float):
+        """
+        Initialise le cache.
+        
+        Args:
+            name: Le nom du cache (préfixe des clés)
+            url: L'URL du serveur (ex: redis://medisecure-redis:6379/0)
+            ttl_seconds: La durée de vie des entrées
+            
+        Raises:
+            RuntimeError: Si le paquet redis n'est pas installé
+        """
+        if redis_asyncio is None:
+            raise RuntimeError("The 'redis' package is required to use RedisCache")
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self._prefix = f"medisecure:{name}:"
+        self._client = redis_asyncio.from_url(url, decode_responses=True)
+    
+    async def get(self, key: str) -> Optional[str]:
+        return await self._client.get(self._prefix + key)
+    
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        await self._client.set(self._prefix + key, value, px=max(int(ttl * 1000), 1), nx=if_absent)
+    
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        if not keys:
+            return {}
+        # MGET : une seule requête pour toutes les clés
+        values = await self._client.mget([self._prefix + key for key in keys])
+        return {key: value for key, value in zip(keys, values) if value is not None}
+    
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        if not items:
+            return
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        # Pipeline sans transaction : les SET (avec expiration) partent en un seul envoi
+        pipeline = self._client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipeline.set(self._prefix + key, value, px=max(int(ttl * 1000), 1), nx=if_absent)
+        await pipeline.execute()
+    
+    async def delete(self, key: str) -> None:
+        await self._client.delete(self._prefix + key)
@@ -0,0 +1,91 @@
+# medisecure-backend/shared/infrastructure/cache/ttl_cache.py
+"""
+Cache mémoire à durée de vie limitée (TTL), borné en taille (LRU).
+
+Prévu pour l'usage depuis la boucle asyncio : il n'est pas protégé contre les
+accès concurrents depuis plusieurs threads.
+"""
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Cache clé → valeur dont les entrées expirent après `ttl_seconds`.
+
+    Lorsque `max_size` est atteint, l'entrée la moins récemment utilisée est évincée.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_size: int = 1024,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            ttl_seconds: La durée de vie d'une entrée, en secondes
+            max_size: Le nombre maximal d'entrées conservées
+            clock: L'horloge utilisée (monotone, injectable pour les tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: K) -> Optional[V]:
+        """
+        Retourne la valeur associée à une clé, ou None si absente ou expirée.
+
+        Args:
+            key: La clé recherchée
+
+        Returns:
+            Optional[V]: La valeur en cache
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> Optional[K]:
+        """
+        Enregistre une valeur.
+
+        Args:
+            key: La clé
+            value: La valeur
+            ttl_seconds: Une durée de vie spécifique (sinon celle du cache)
+
+        Returns:
+            Optional[K]: La clé évincée pour faire de la place, le cas échéant
+        """
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            evicted_key, _ = self._entries.popitem(last=False)
+            return evicted_key
+        return None
+
+    def invalidate(self, key: K) -> None:
+        """Supprime une entrée."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,60 @@
+# medisecure-backend/shared/infrastructure/database/advisory_lock.py
+"""
+Verrous consultatifs PostgreSQL de transaction (pg_advisory_xact_lock).
+
+Le verrou est pris dans la transaction de la session et libéré automatiquement à sa
+validation ou à son annulation : les transactions qui demandent la même clé
+s'exécutent l'une après l'autre à partir de ce point.
+
+La clé (bigint) est dérivée de l'espace de noms et de l'identifiant par un condensé
+stable : contrairement à hash(), elle est identique dans tous les workers et entre
+deux démarrages.
+"""
+import hashlib
+import logging
+import time
+from uuid import UUID
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.types import BigInteger
+
+from shared.infrastructure.monitoring.prometheus_metrics import LOCK_WAIT_SECONDS
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+ADVISORY_XACT_LOCK = text("SELECT pg_advisory_xact_lock(:lock_key)").bindparams(
+    bindparam("lock_key", type_=BigInteger)
+)
+
+def advisory_lock_key(namespace: str, key: UUID) -> int:
+    """
+    Calcule la clé d'un verrou consultatif.
+
+    Args:
+        namespace: L'espace de noms du verrou (ex: "appointment_booking")
+        key: L'identifiant verrouillé (ex: l'ID du médecin)
+
+    Returns:
+        int: La clé, un entier signé sur 64 bits
+    """
+    digest = hashlib.blake2b(namespace.encode() + key.bytes, digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+async def advisory_xact_lock(session, namespace: str, key: UUID) -> None:
+    """
+    Prend un verrou consultatif jusqu'à la fin de la transaction de la session.
+
+    Le temps d'attente (aller-retour compris) est mesuré par la métrique
+    medisecure_lock_wait_seconds{lock=namespace}.
+
+    Args:
+        session: La session dont la transaction porte le verrou
+        namespace: L'espace de noms du verrou
+        key: L'identifiant verrouillé
+    """
+    started = time.perf_counter()
+    await session.execute(ADVISORY_XACT_LOCK, {"lock_key": advisory_lock_key(namespace, key)})
+    waited = time.perf_counter() - started
+    LOCK_WAIT_SECONDS.labels(lock=namespace).observe(waited)
+    logger.debug("Verrou %s pris pour %s après %.1f ms", namespace, key, waited * 1000)
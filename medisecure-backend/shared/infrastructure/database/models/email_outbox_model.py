@@ -0,0 +1,47 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, Index, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+from sqlalchemy.sql import func
+import uuid
+
+from shared.infrastructure.database.connection import Base
+
+# Statuts d'un message de la boîte d'envoi
+OUTBOX_PENDING = "pending"
+OUTBOX_SENDING = "sending"
+OUTBOX_SENT = "sent"
+OUTBOX_FAILED = "failed"
+
+class EmailOutboxModel(Base):
+    """Modèle SQLAlchemy pour la boîte d'envoi transactionnelle des emails"""
+    __tablename__ = "email_outbox"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    sender = Column(String, nullable=False)
+    recipients = Column(ARRAY(String), nullable=False)
+    raw_message = Column(Text, nullable=False)
+    status = Column(String(16), nullable=False, default=OUTBOX_PENDING, server_default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    last_error = Column(Text, nullable=True)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    created_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+    # Fin du bail d'un message en cours d'envoi (status = sending)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    
+    __table_args__ = (
+        # File d'attente du worker : uniquement les messages en attente
+        Index(
+            "idx_email_outbox_pending",
+            "next_attempt_at",
+            postgresql_where=text(f"status = '{OUTBOX_PENDING}'")
+        ),
+        # Baux expirés (worker arrêté pendant un envoi) : messages à réserver de nouveau
+        Index(
+            "idx_email_outbox_leased",
+            "lease_expires_at",
+            postgresql_where=text(f"status = '{OUTBOX_SENDING}'")
+        ),
+    )
+    
+    def __repr__(self):
+        return f"<EmailOutbox {self.id} {self.status}>"
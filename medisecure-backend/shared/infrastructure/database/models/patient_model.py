@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text
+from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
@@ -46,6 +46,12 @@ class PatientModel(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
     
+    # Index composites pour la pagination par curseur (ordre stable et unique)
+    __table_args__ = (
+        Index("idx_patients_last_name_id", last_name, id),
+        Index("idx_patients_created_at_id", created_at, id),
+    )
+    
     # Relations
     user = relationship("UserModel", foreign_keys=[user_id])
     # Utiliser une chaîne simple pour éviter les imports circulaires
@@ -0,0 +1,51 @@
+# medisecure-backend/shared/infrastructure/database/query_registry.py
+"""
+Registre des requêtes fréquentes des repositories.
+
+Chaque requête est construite une seule fois, avec des paramètres liés (bindparam)
+dont les valeurs sont passées à l'exécution :
+
+    result = await session.execute(QUERIES["get_by_id"], {"patient_id": patient_id})
+
+Réutiliser le même objet évite de reconstruire le select(...) et de recalculer sa clé
+de cache à chaque appel : SQLAlchemy retrouve directement la forme compilée dans son
+cache de compilation, puis le même texte SQL est servi par le cache de requêtes
+préparées asyncpg de la connexion (conservée par le pool).
+"""
+from typing import Dict, Iterator
+
+from sqlalchemy.sql import Executable
+
+class QueryRegistry:
+    """Requêtes nommées, construites une fois pour toutes."""
+
+    def __init__(self):
+        self._statements: Dict[str, Executable] = {}
+
+    def register(self, name: str, statement: Executable) -> Executable:
+        """
+        Enregistre une requête.
+
+        Args:
+            name: Le nom de la requête
+            statement: La requête, dont les valeurs variables sont des bindparam
+
+        Returns:
+            Executable: La requête enregistrée
+
+        Raises:
+            ValueError: Si une requête porte déjà ce nom
+        """
+        if name in self._statements:
+            raise ValueError(f"Query {name} is already registered")
+        self._statements[name] = statement
+        return statement
+
+    def __getitem__(self, name: str) -> Executable:
+        return self._statements[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._statements
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._statements)
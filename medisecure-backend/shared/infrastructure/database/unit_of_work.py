@@ -0,0 +1,152 @@
+# medisecure-backend/shared/infrastructure/database/unit_of_work.py
+"""
+Unité de travail (unit of work) partagée par les repositories.
+
+Pendant une unité de travail, tous les repositories utilisent la même session,
+donc la même connexion et la même transaction. La session active est portée par
+une ContextVar : elle est propre à la requête (tâche asyncio) en cours.
+"""
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Optional
+import logging
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Session de l'unité de travail active pour le contexte courant
+_current_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+    "medisecure_current_session", default=None
+)
+
+
+# Clé de session.info où sont conservés les callbacks de fin de transaction
+_AFTER_TRANSACTION_KEY = "medisecure_after_transaction"
+
+
+def get_current_session() -> Optional[AsyncSession]:
+    """Retourne la session de l'unité de travail active, s'il y en a une."""
+    return _current_session.get()
+
+
+async def after_transaction(callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Exécute un callback à la fin de la transaction active (validation ou annulation),
+    ou immédiatement s'il n'y en a pas.
+
+    Utilisé par exemple pour invalider un cache une fois l'écriture visible des autres
+    requêtes.
+
+    Args:
+        callback: La fonction asynchrone à exécuter
+    """
+    session = _current_session.get()
+    if session is None:
+        await callback()
+        return
+    session.info.setdefault(_AFTER_TRANSACTION_KEY, []).append(callback)
+
+
+async def _run_after_transaction(session: AsyncSession) -> None:
+    """Exécute les callbacks enregistrés pour la transaction de la session."""
+    for callback in session.info.pop(_AFTER_TRANSACTION_KEY, []):
+        try:
+            await callback()
+        except Exception as e:
+            logger.exception("Erreur dans un callback de fin de transaction: %s", e)
+
+
+class SessionScope:
+    """
+    Fournit une session aux repositories.
+
+    Utilisé à la place d'une simple factory de session : `async with scope() as session`
+    rejoint la session de l'unité de travail active si elle existe, sinon ouvre une
+    session autonome dans sa propre transaction (validée à la sortie du bloc).
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialise le scope avec une factory de session SQLAlchemy.
+
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+
+    @asynccontextmanager
+    async def __call__(self) -> AsyncIterator[AsyncSession]:
+        active_session = _current_session.get()
+        if active_session is not None:
+            yield active_session
+            return
+
+        async with self.session_factory() as session:
+            try:
+                async with session.begin():
+                    # Les appels imbriqués (ex: update puis get_by_id) réutilisent cette session
+                    token = _current_session.set(session)
+                    try:
+                        yield session
+                    finally:
+                        _current_session.reset(token)
+            finally:
+                await _run_after_transaction(session)
+
+
+class UnitOfWork:
+    """
+    Unité de travail : une session et une transaction pour tout un cas d'utilisation.
+
+    Usage:
+        async with unit_of_work:
+            await use_case.execute(...)
+
+    La transaction est validée à la sortie du bloc, ou annulée si une exception est
+    levée. Une unité de travail ouverte alors qu'une autre est active la rejoint.
+    """
+
+    def __init__(self, session_factory):
+        """
+        Initialise l'unité de travail avec une factory de session SQLAlchemy.
+
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+        self._token = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        active_session = _current_session.get()
+        if active_session is not None:
+            # Rejoindre l'unité de travail englobante
+            self.session = active_session
+            return self
+
+        self.session = self.session_factory()
+        await self.session.begin()
+        self._token = _current_session.set(self.session)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        if self._token is None:
+            # Unité de travail imbriquée : l'unité englobante valide la transaction
+            self.session = None
+            return False
+
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                logger.debug("Annulation de l'unité de travail suite à une erreur: %s", exc_type.__name__)
+                await self.session.rollback()
+        finally:
+            _current_session.reset(self._token)
+            self._token = None
+            await _run_after_transaction(self.session)
+            await self.session.close()
+            self.session = None
+        return False
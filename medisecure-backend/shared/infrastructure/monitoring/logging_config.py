@@ -0,0 +1,141 @@
+# medisecure-backend/shared/infrastructure/monitoring/logging_config.py
+"""
+Configuration de la journalisation applicative.
+
+- Niveau global (LOG_LEVEL, INFO par défaut) : les appels logger.debug(...) sont
+  écartés avant tout formatage, les arguments %s n'étant formatés qu'à l'émission.
+- Format texte ou JSON structuré (LOG_FORMAT=text|json) : en JSON, les champs passés
+  via extra={...} sont ajoutés à l'enregistrement.
+- Échantillonnage des messages INFO à fort volume (LOG_INFO_SAMPLE_RATE, entre 0 et 1) :
+  les avertissements et erreurs sont toujours conservés.
+- Les requêtes SQL ne sont journalisées que si DB_ECHO=true (voir PoolSettings).
+"""
+import json
+import logging
+import os
+import random
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+LOG_FORMATS = ("text", "json")
+
+# Attributs standards d'un LogRecord : tout le reste provient de extra={...}
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+class SamplingFilter(logging.Filter):
+    """
+    Ne conserve qu'une fraction des enregistrements de niveau inférieur ou égal à
+    `level`. Les enregistrements de niveau supérieur (WARNING, ERROR...) passent toujours.
+    """
+
+    def __init__(self, rate: float, level: int = logging.INFO, random_func: Callable[[], float] = random.random):
+        """
+        Initialise le filtre.
+
+        Args:
+            rate: La fraction des enregistrements conservés (entre 0 et 1)
+            level: Le niveau maximal concerné par l'échantillonnage
+            random_func: Le générateur de nombres aléatoires dans [0, 1)
+
+        Raises:
+            ValueError: Si rate n'est pas compris entre 0 et 1
+        """
+        super().__init__()
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError("rate must be between 0 and 1")
+        self.rate = rate
+        self.level = level
+        self._random = random_func
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.level or self.rate >= 1.0:
+            return True
+        return self._random() < self.rate
+
+class JsonFormatter(logging.Formatter):
+    """Formate chaque enregistrement en un objet JSON sur une ligne."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload: Dict[str, Any] = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            payload["exception"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+@dataclass(frozen=True)
+class LoggingSettings:
+    """
+    Paramètres de journalisation.
+
+    Attributes:
+        level: Le niveau minimal journalisé (DEBUG, INFO, WARNING...)
+        format: Le format de sortie ("text" ou "json")
+        info_sample_rate: La fraction des messages INFO conservés
+    """
+    level: str = "INFO"
+    format: str = "text"
+    info_sample_rate: float = 1.0
+
+    @classmethod
+    def from_env(cls) -> "LoggingSettings":
+        """Construit les paramètres à partir des variables d'environnement LOG_*."""
+        return cls(
+            level=os.getenv("LOG_LEVEL", cls.level).upper(),
+            format=os.getenv("LOG_FORMAT", cls.format).lower(),
+            info_sample_rate=float(os.getenv("LOG_INFO_SAMPLE_RATE", cls.info_sample_rate)),
+        )
+
+def create_handler(settings: LoggingSettings, stream: Any = None) -> logging.Handler:
+    """
+    Crée le handler de sortie correspondant aux paramètres.
+
+    Args:
+        settings: Les paramètres de journalisation
+        stream: Le flux de sortie (stderr par défaut)
+
+    Returns:
+        logging.Handler: Le handler configuré (format et échantillonnage)
+
+    Raises:
+        ValueError: Si le format n'est pas supporté
+    """
+    if settings.format not in LOG_FORMATS:
+        raise ValueError(f"format must be one of {', '.join(LOG_FORMATS)}")
+
+    handler = logging.StreamHandler(stream or sys.stderr)
+    if settings.format == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    if settings.info_sample_rate < 1.0:
+        handler.addFilter(SamplingFilter(settings.info_sample_rate))
+    return handler
+
+def configure_logging(settings: Optional[LoggingSettings] = None) -> None:
+    """
+    Configure le logger racine. Peut être appelée plusieurs fois : le handler installé
+    lors d'un appel précédent est remplacé.
+
+    Args:
+        settings: Les paramètres de journalisation (variables d'environnement par défaut)
+    """
+    settings = settings or LoggingSettings.from_env()
+    root = logging.getLogger()
+
+    for handler in list(root.handlers):
+        if getattr(handler, "_medisecure", False):
+            root.removeHandler(handler)
+
+    handler = create_handler(settings)
+    handler._medisecure = True
+    root.addHandler(handler)
+    root.setLevel(settings.level)
@@ -0,0 +1,108 @@
+# medisecure-backend/shared/infrastructure/monitoring/prometheus_metrics.py
+"""
+Métriques Prometheus applicatives.
+
+Toutes les métriques sont enregistrées dans le registre par défaut de
+prometheus_client, déjà exposé sur /metrics par l'Instrumentator de api/main.py.
+Elles sont déclarées ici une seule fois pour éviter les doubles enregistrements.
+"""
+from prometheus_client import Counter, Gauge, Histogram
+
+# Pool de connexions à la base de données
+DB_POOL_CHECKOUT_WAIT_SECONDS = Histogram(
+    "medisecure_db_pool_checkout_wait_seconds",
+    "Temps d'attente pour obtenir une connexion du pool",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+DB_POOL_CONNECTIONS_IN_USE = Gauge(
+    "medisecure_db_pool_connections_in_use",
+    "Nombre de connexions actuellement empruntées au pool",
+)
+
+DB_POOL_CAPACITY = Gauge(
+    "medisecure_db_pool_capacity",
+    "Nombre maximal de connexions du pool (pool_size + max_overflow)",
+)
+
+DB_POOL_SATURATION = Gauge(
+    "medisecure_db_pool_saturation_ratio",
+    "Ratio connexions empruntées / capacité maximale du pool",
+)
+
+# Caches applicatifs (label cache : nom du cache, ex: "patients")
+CACHE_HITS = Counter(
+    "medisecure_cache_hits_total",
+    "Lectures servies par le cache",
+    ["cache"],
+)
+
+CACHE_MISSES = Counter(
+    "medisecure_cache_misses_total",
+    "Lectures absentes du cache (lues dans la base de données)",
+    ["cache"],
+)
+
+CACHE_EVICTIONS = Counter(
+    "medisecure_cache_evictions_total",
+    "Entrées évincées du cache en mémoire faute de place",
+    ["cache"],
+)
+
+CACHE_ERRORS = Counter(
+    "medisecure_cache_errors_total",
+    "Erreurs d'accès au cache (traitées comme des absences)",
+    ["cache"],
+)
+
+# Boîte d'envoi des emails (outbox)
+EMAIL_OUTBOX_PENDING = Gauge(
+    "medisecure_email_outbox_pending",
+    "Nombre d'emails en attente d'envoi dans la boîte d'envoi",
+)
+
+EMAIL_OUTBOX_DELIVERIES = Counter(
+    "medisecure_email_outbox_deliveries_total",
+    "Tentatives d'envoi des emails de la boîte d'envoi (outcome : sent, retry, failed)",
+    ["outcome"],
+)
+
+EMAIL_OUTBOX_DELIVERY_LATENCY_SECONDS = Histogram(
+    "medisecure_email_outbox_delivery_latency_seconds",
+    "Délai entre l'enregistrement d'un email et son envoi",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0, 3600.0),
+)
+
+EMAIL_SMTP_SEND_SECONDS = Histogram(
+    "medisecure_email_smtp_send_seconds",
+    "Durée de transmission d'un email au serveur SMTP",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+# Hachage des mots de passe (label operation : hash ou verify)
+PASSWORD_HASH_QUEUE_SECONDS = Histogram(
+    "medisecure_password_hash_queue_seconds",
+    "Attente d'une place dans le pool de hachage des mots de passe",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+PASSWORD_HASH_SECONDS = Histogram(
+    "medisecure_password_hash_seconds",
+    "Durée d'un calcul bcrypt dans le pool de hachage",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "medisecure_password_hash_in_flight",
+    "Nombre de calculs bcrypt en cours",
+)
+
+# Verrous de sérialisation (label lock : nom du verrou, ex: "appointment_booking")
+LOCK_WAIT_SECONDS = Histogram(
+    "medisecure_lock_wait_seconds",
+    "Temps d'attente pour obtenir un verrou consultatif PostgreSQL (aller-retour compris)",
+    ["lock"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
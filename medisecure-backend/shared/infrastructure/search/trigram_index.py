@@ -0,0 +1,184 @@
+# medisecure-backend/shared/infrastructure/search/trigram_index.py
+"""
+Recherche textuelle par trigrammes.
+
+Reproduit en mémoire le comportement de l'extension PostgreSQL pg_trgm combinée à
+unaccent : les textes sont normalisés (minuscules, sans accents) puis découpés en
+n-grammes. L'index inversé permet de trouver les candidats d'une recherche par
+sous-chaîne sans parcourir toutes les entrées, et `similarity` classe les résultats
+comme la fonction similarity() de pg_trgm.
+"""
+import unicodedata
+from typing import Dict, Generic, Hashable, Iterable, List, Optional, Set, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+# Taille maximale des n-grammes indexés (trigrammes)
+GRAM_SIZE = 3
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    Normalise un texte pour la recherche (équivalent de lower(unaccent(text))).
+
+    Args:
+        text: Le texte à normaliser
+
+    Returns:
+        str: Le texte en minuscules, sans accents
+    """
+    if not text:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.lower()
+
+
+def escape_like(term: str) -> str:
+    """Échappe les caractères spéciaux d'un motif LIKE (%, _ et \\)."""
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def word_trigrams(text: str) -> Set[str]:
+    """
+    Découpe un texte en trigrammes de mots, comme pg_trgm.
+
+    Chaque mot est préfixé de deux espaces et suffixé d'un espace avant découpage.
+
+    Args:
+        text: Le texte à découper
+
+    Returns:
+        Set[str]: Les trigrammes du texte normalisé
+    """
+    grams: Set[str] = set()
+    for word in "".join(c if c.isalnum() else " " for c in normalize_text(text)).split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + GRAM_SIZE] for i in range(len(padded) - GRAM_SIZE + 1))
+    return grams
+
+
+def similarity(left: str, right: str) -> float:
+    """
+    Similarité par trigrammes entre deux textes (entre 0 et 1), comme pg_trgm.
+
+    Args:
+        left: Le premier texte
+        right: Le second texte
+
+    Returns:
+        float: Le nombre de trigrammes communs rapporté au nombre de trigrammes distincts
+    """
+    left_grams = word_trigrams(left)
+    right_grams = word_trigrams(right)
+    union = left_grams | right_grams
+    if not union:
+        return 0.0
+    return len(left_grams & right_grams) / len(union)
+
+
+def _grams(text: str, size: int) -> Set[str]:
+    """Retourne les n-grammes de taille `size` d'un texte déjà normalisé."""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class TrigramIndex(Generic[K]):
+    """
+    Index inversé n-gramme → clés, pour la recherche par sous-chaîne.
+
+    Les textes sont indexés par leurs uni-, bi- et trigrammes : une recherche d'un ou
+    deux caractères (ex: name="a") utilise aussi l'index au lieu d'un parcours complet.
+    Les candidats sont ensuite vérifiés, l'intersection des listes pouvant contenir
+    des faux positifs.
+    """
+
+    def __init__(self):
+        """Initialise un index vide."""
+        self._postings: Dict[str, Set[K]] = {}
+        self._texts: Dict[K, List[str]] = {}
+
+    def add(self, key: K, texts: Iterable[Optional[str]]) -> None:
+        """
+        Indexe (ou réindexe) les textes associés à une clé.
+
+        Args:
+            key: La clé de l'entrée (ex: l'ID du patient)
+            texts: Les textes de l'entrée (ex: prénom et nom)
+        """
+        self.remove(key)
+        normalized = [normalize_text(text) for text in texts if text]
+        self._texts[key] = normalized
+        for text in normalized:
+            for size in range(1, GRAM_SIZE + 1):
+                for gram in _grams(text, size):
+                    self._postings.setdefault(gram, set()).add(key)
+
+    def remove(self, key: K) -> None:
+        """
+        Retire une clé de l'index.
+
+        Args:
+            key: La clé à retirer
+        """
+        texts = self._texts.pop(key, None)
+        if texts is None:
+            return
+        for text in texts:
+            for size in range(1, GRAM_SIZE + 1):
+                for gram in _grams(text, size):
+                    keys = self._postings.get(gram)
+                    if keys is None:
+                        continue
+                    keys.discard(key)
+                    if not keys:
+                        del self._postings[gram]
+
+    def search(self, term: str) -> Set[K]:
+        """
+        Retourne les clés dont l'un des textes contient le terme (sans tenir compte
+        de la casse ni des accents).
+
+        Args:
+            term: Le terme recherché
+
+        Returns:
+            Set[K]: Les clés correspondantes
+        """
+        needle = normalize_text(term)
+        if not needle:
+            return set(self._texts)
+
+        size = min(len(needle), GRAM_SIZE)
+        # Commencer par la liste la plus courte pour réduire les intersections
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in _grams(needle, size)),
+            key=len
+        )
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                return candidates
+
+        if len(needle) <= GRAM_SIZE:
+            return candidates
+        return {
+            key for key in candidates
+            if any(needle in text for text in self._texts[key])
+        }
+
+    def rank(self, key: K, term: str) -> float:
+        """
+        Score de pertinence d'une entrée pour un terme (meilleure similarité de ses textes).
+
+        Args:
+            key: La clé de l'entrée
+            term: Le terme recherché
+
+        Returns:
+            float: Le score, entre 0 et 1
+        """
+        return max((similarity(text, term) for text in self._texts.get(key, [])), default=0.0)
+
+    def __len__(self) -> int:
+        return len(self._texts)
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import AsyncContextManager, Callable, Optional
+
+from shared.domain.entities.outbox_message import OutboxMessage
+from shared.infrastructure.monitoring.prometheus_metrics import (
+    EMAIL_OUTBOX_DELIVERIES,
+    EMAIL_OUTBOX_DELIVERY_LATENCY_SECONDS,
+    EMAIL_OUTBOX_PENDING
+)
+from shared.infrastructure.services.smtp_client import AsyncSmtpClient
+from shared.ports.secondary.email_outbox_protocol import EmailOutboxProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class EmailOutboxWorker:
+    """
+    Tâche de fond qui envoie les emails de la boîte d'envoi (outbox).
+
+    Chaque lot est réservé dans une transaction courte (SELECT ... FOR UPDATE SKIP
+    LOCKED puis statut sending avec un bail) : plusieurs workers peuvent tourner en
+    parallèle sans envoyer deux fois le même message. Les messages sont ensuite
+    envoyés sur la connexion SMTP persistante du client, hors de toute transaction
+    (aucune connexion à la base ni verrou de ligne n'est conservé pendant les échanges
+    SMTP), et le résultat de chaque envoi est enregistré dans sa propre transaction.
+
+    Un message en échec est retenté avec un délai exponentiel, puis abandonné après
+    `max_attempts` tentatives. La livraison est « au moins une fois » : si le worker
+    s'arrête pendant un lot, les messages non enregistrés redeviennent réservables à
+    l'expiration de leur bail.
+
+    Les messages envoyés ou abandonnés sont supprimés après `retention_seconds`
+    (au plus une purge par `purge_interval_seconds`).
+    """
+
+    def __init__(
+        self,
+        outbox: EmailOutboxProtocol,
+        client: AsyncSmtpClient,
+        unit_of_work_factory: Callable[[], AsyncContextManager],
+        batch_size: int = 50,
+        poll_interval_seconds: float = 2.0,
+        max_attempts: int = 8,
+        base_backoff_seconds: float = 30.0,
+        max_backoff_seconds: float = 3600.0,
+        lease_seconds: float = 300.0,
+        send_timeout_seconds: float = 30.0,
+        retention_seconds: float = 7 * 24 * 3600.0,
+        purge_interval_seconds: float = 3600.0
+    ):
+        """
+        Initialise le worker.
+
+        Args:
+            outbox: La boîte d'envoi des emails
+            client: Le client SMTP (connexion réutilisée entre les messages et les lots)
+            unit_of_work_factory: Crée l'unité de travail (transaction) d'un lot
+            batch_size: Le nombre maximum de messages par lot
+            poll_interval_seconds: L'attente quand la boîte d'envoi est vide
+            max_attempts: Le nombre de tentatives avant abandon d'un message
+            base_backoff_seconds: Le délai avant la première nouvelle tentative
+            max_backoff_seconds: Le délai maximal entre deux tentatives
+            lease_seconds: La durée du bail des messages réservés
+            send_timeout_seconds: La durée maximale d'un envoi SMTP : un envoi n'est
+                commencé que s'il peut se terminer avant la fin du bail
+            retention_seconds: La durée de conservation des messages traités
+            purge_interval_seconds: L'intervalle entre deux purges des messages traités
+        """
+        self.outbox = outbox
+        self.client = client
+        self.unit_of_work_factory = unit_of_work_factory
+        self.batch_size = batch_size
+        self.poll_interval_seconds = poll_interval_seconds
+        self.max_attempts = max_attempts
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.lease_seconds = lease_seconds
+        self.send_timeout_seconds = send_timeout_seconds
+        self.retention_seconds = retention_seconds
+        self.purge_interval_seconds = purge_interval_seconds
+        self._last_purge: Optional[float] = None
+        self._stopping = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Démarre le worker dans la boucle d'événements courante."""
+        if self._task is None or self._task.done():
+            self._stopping.clear()
+            self._task = asyncio.create_task(self.run(), name="email-outbox-worker")
+            logger.info("Worker de la boîte d'envoi des emails démarré")
+
+    async def stop(self) -> None:
+        """Arrête le worker à la fin du lot en cours et ferme la connexion SMTP."""
+        self._stopping.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+        await self.client.close()
+        logger.info("Worker de la boîte d'envoi des emails arrêté")
+
+    async def run(self) -> None:
+        """Envoie les lots en boucle jusqu'à l'arrêt du worker."""
+        while not self._stopping.is_set():
+            try:
+                processed = await self.run_once()
+                await self.purge_if_due()
+            except Exception as e:
+                logger.exception("Erreur du worker de la boîte d'envoi: %s", e)
+                processed = 0
+
+            # Lot incomplet : la file est vide, attendre avant de l'interroger à nouveau
+            if processed < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval_seconds)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def run_once(self) -> int:
+        """
+        Envoie un lot de messages.
+
+        Returns:
+            int: Le nombre de messages traités (envoyés, reprogrammés ou abandonnés),
+                sans les messages reportés faute de temps avant la fin du bail
+        """
+        # Réservation dans une transaction courte : les verrous de ligne sont libérés aussitôt
+        async with self.unit_of_work_factory():
+            messages = await self.outbox.claim_batch(self.batch_size, self.lease_seconds)
+
+        # Envoi hors transaction, tant que le bail laisse le temps d'un envoi complet ;
+        # les messages restants seront réservés de nouveau à l'expiration du bail
+        send_deadline = time.monotonic() + self.lease_seconds - self.send_timeout_seconds
+        processed = 0
+        for message in messages:
+            if time.monotonic() >= send_deadline:
+                logger.warning(
+                    "Bail de %ss bientôt expiré, %s email(s) reportés",
+                    self.lease_seconds, len(messages) - processed
+                )
+                break
+            await self._deliver(message)
+            processed += 1
+
+        EMAIL_OUTBOX_PENDING.set(await self.outbox.pending_count())
+        return processed
+
+    async def purge_if_due(self) -> int:
+        """
+        Supprime les messages traités au-delà de la durée de conservation, si la
+        dernière purge date de plus de `purge_interval_seconds`.
+
+        Returns:
+            int: Le nombre de messages supprimés
+        """
+        now = time.monotonic()
+        if self._last_purge is not None and now - self._last_purge < self.purge_interval_seconds:
+            return 0
+        self._last_purge = now
+
+        async with self.unit_of_work_factory():
+            purged = await self.outbox.purge(self.retention_seconds)
+        if purged:
+            logger.info("%s email(s) traités supprimés de la boîte d'envoi", purged)
+        return purged
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """
+        Délai avant la prochaine tentative.
+
+        Args:
+            attempts: Le nombre de tentatives déjà effectuées (au moins 1)
+
+        Returns:
+            float: Le délai, doublé à chaque échec et plafonné
+        """
+        return min(self.base_backoff_seconds * 2 ** (attempts - 1), self.max_backoff_seconds)
+
+    async def _deliver(self, message: OutboxMessage) -> None:
+        """Envoie un message, puis enregistre le résultat dans sa propre transaction."""
+        try:
+            await self.client.send(message.sender, message.recipients, message.raw_message)
+        except Exception as e:
+            attempts = message.attempts + 1
+            if attempts >= self.max_attempts:
+                async with self.unit_of_work_factory():
+                    await self.outbox.mark_failed(message.id, str(e))
+                EMAIL_OUTBOX_DELIVERIES.labels(outcome="failed").inc()
+                logger.error("Email %s abandonné après %s tentatives: %s", message.id, attempts, e)
+            else:
+                delay = self.backoff_seconds(attempts)
+                async with self.unit_of_work_factory():
+                    await self.outbox.mark_retry(message.id, str(e), delay)
+                EMAIL_OUTBOX_DELIVERIES.labels(outcome="retry").inc()
+                logger.warning("Échec de l'envoi de l'email %s, nouvel essai dans %.0fs: %s", message.id, delay, e)
+            return
+
+        async with self.unit_of_work_factory():
+            await self.outbox.mark_sent(message.id)
+        EMAIL_OUTBOX_DELIVERIES.labels(outcome="sent").inc()
+        if message.created_at is not None:
+            created_at = message.created_at
+            if created_at.tzinfo is None:
+                created_at = created_at.replace(tzinfo=timezone.utc)
+            EMAIL_OUTBOX_DELIVERY_LATENCY_SECONDS.observe(
+                (datetime.now(timezone.utc) - created_at).total_seconds()
+            )
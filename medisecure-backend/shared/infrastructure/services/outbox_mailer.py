@@ -0,0 +1,70 @@
+from typing import List, Optional
+
+from shared.infrastructure.services.smtp_mailer import SmtpMailer
+from shared.ports.secondary.email_outbox_protocol import EmailOutboxProtocol
+
+class OutboxMailer(SmtpMailer):
+    """
+    Adaptateur secondaire pour l'envoi différé d'emails.
+    Implémente le port MailerProtocol.
+    
+    Les messages sont composés comme par SmtpMailer mais enregistrés dans la boîte
+    d'envoi (outbox), dans la transaction en cours, au lieu d'être transmis au serveur
+    SMTP pendant la requête. L'EmailOutboxWorker les envoie en arrière-plan.
+    
+    Contrairement à SmtpMailer, une erreur d'enregistrement n'est pas convertie en
+    False : elle est propagée pour que l'unité de travail soit annulée, plutôt que
+    validée sans son email.
+    """
+    
+    def __init__(self, outbox: EmailOutboxProtocol):
+        """
+        Initialise le mailer avec la boîte d'envoi.
+        
+        Args:
+            outbox: La boîte d'envoi des emails
+        """
+        super().__init__()
+        self.outbox = outbox
+    
+    async def send_email(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        html_body: Optional[str] = None,
+        attachments: Optional[List[str]] = None
+    ) -> bool:
+        """
+        Enregistre un email dans la boîte d'envoi, dans la transaction en cours.
+        
+        Args:
+            to_email: L'adresse email du destinataire
+            subject: Le sujet de l'email
+            body: Le corps de l'email en texte brut
+            cc: Les adresses email en copie (optionnel)
+            bcc: Les adresses email en copie cachée (optionnel)
+            html_body: Le corps de l'email en HTML (optionnel)
+            attachments: Les pièces jointes (optionnel)
+            
+        Returns:
+            bool: True une fois l'email enregistré
+            
+        Raises:
+            Exception: Toute erreur d'enregistrement, pour annuler la transaction
+        """
+        recipients, raw_message = self._compose(to_email, subject, body, cc, bcc, html_body)
+        await self._deliver(recipients, raw_message)
+        return True
+    
+    async def _deliver(self, recipients: List[str], raw_message: str) -> None:
+        """
+        Enregistre un message dans la boîte d'envoi.
+        
+        Args:
+            recipients: Les adresses des destinataires (y compris copies)
+            raw_message: Le message au format MIME
+        """
+        await self.outbox.enqueue(self.email_from, recipients, raw_message)
@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import os
+import time
+from typing import List, Optional
+
+from shared.infrastructure.monitoring.prometheus_metrics import EMAIL_SMTP_SEND_SECONDS
+
+try:
+    import aiosmtplib
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    aiosmtplib = None
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class AsyncSmtpClient:
+    """
+    Client SMTP asynchrone avec connexion persistante.
+
+    La connexion (STARTTLS et authentification compris) est ouverte au premier envoi
+    puis réutilisée pour les suivants. Si le serveur l'a fermée entre-temps, elle est
+    rouverte et l'envoi retenté une fois.
+
+    Nécessite le paquet `aiosmtplib`.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        start_tls: bool = True,
+        timeout: float = 30.0
+    ):
+        """
+        Initialise le client (sans ouvrir de connexion).
+
+        Args:
+            host: L'hôte du serveur SMTP
+            port: Le port du serveur SMTP
+            username: L'identifiant de connexion (optionnel)
+            password: Le mot de passe (optionnel)
+            start_tls: Passer en TLS avec STARTTLS après la connexion
+            timeout: Le délai maximal des opérations réseau, en secondes
+
+        Raises:
+            RuntimeError: Si le paquet aiosmtplib n'est pas installé
+        """
+        if aiosmtplib is None:
+            raise RuntimeError("The 'aiosmtplib' package is required to use AsyncSmtpClient")
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.timeout = timeout
+        self._smtp = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def from_env(cls) -> "AsyncSmtpClient":
+        """Crée un client à partir des variables d'environnement SMTP_*."""
+        return cls(
+            host=os.getenv("SMTP_HOST", "smtp.example.com"),
+            port=int(os.getenv("SMTP_PORT", "587")),
+            username=os.getenv("SMTP_USER", "user@example.com"),
+            password=os.getenv("SMTP_PASSWORD", "your_password_here"),
+            start_tls=os.getenv("SMTP_START_TLS", "true").lower() == "true",
+            timeout=float(os.getenv("SMTP_TIMEOUT_SECONDS", "30"))
+        )
+
+    async def send(self, sender: str, recipients: List[str], raw_message: str) -> None:
+        """
+        Envoie un message MIME.
+
+        Args:
+            sender: L'adresse de l'expéditeur
+            recipients: Les adresses des destinataires
+            raw_message: Le message au format MIME
+
+        Raises:
+            Exception: Si le serveur refuse le message ou reste injoignable
+        """
+        async with self._lock:
+            started = time.perf_counter()
+            try:
+                smtp = await self._connection()
+                await smtp.sendmail(sender, recipients, raw_message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Connexion fermée par le serveur (inactivité) : la rouvrir une fois
+                logger.info("Connexion SMTP fermée par le serveur, reconnexion")
+                await self._disconnect()
+                smtp = await self._connection()
+                await smtp.sendmail(sender, recipients, raw_message)
+            except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPDataError):
+                # Refus du message : la connexion reste utilisable
+                raise
+            except Exception:
+                await self._disconnect()
+                raise
+            finally:
+                EMAIL_SMTP_SEND_SECONDS.observe(time.perf_counter() - started)
+
+    async def close(self) -> None:
+        """Ferme la connexion persistante."""
+        async with self._lock:
+            await self._disconnect()
+
+    async def _connection(self):
+        """Retourne la connexion ouverte, en l'établissant si nécessaire."""
+        if self._smtp is not None and self._smtp.is_connected:
+            return self._smtp
+
+        smtp = aiosmtplib.SMTP(
+            hostname=self.host,
+            port=self.port,
+            start_tls=self.start_tls,
+            timeout=self.timeout
+        )
+        await smtp.connect()
+        if self.username and self.password:
+            await smtp.login(self.username, self.password)
+        self._smtp = smtp
+        logger.info("Connexion SMTP ouverte vers %s:%s", self.host, self.port)
+        return smtp
+
+    async def _disconnect(self) -> None:
+        """Ferme la connexion, en ignorant les erreurs d'une connexion déjà perdue."""
+        smtp, self._smtp = self._smtp, None
+        if smtp is None or not smtp.is_connected:
+            return
+        try:
+            await smtp.quit()
+        except Exception:
+            smtp.close()
@@ -1,30 +1,37 @@
+import logging
 import os
-import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 from shared.ports.secondary.mailer_protocol import MailerProtocol
+from shared.infrastructure.services.smtp_client import AsyncSmtpClient
 
 # Charger les variables d'environnement
 load_dotenv()
 
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
 class SmtpMailer(MailerProtocol):
     """
     Adaptateur secondaire pour l'envoi d'emails via SMTP.
     Implémente le port MailerProtocol.
+    
+    Les messages sont transmis par un client SMTP asynchrone dont la connexion est
+    réutilisée d'un envoi à l'autre.
     """
     
-    def __init__(self):
+    def __init__(self, client: Optional[AsyncSmtpClient] = None):
         """
         Initialise le mailer avec les paramètres SMTP depuis les variables d'environnement.
+        
+        Args:
+            client: Le client SMTP à utiliser (créé au premier envoi si absent)
         """
-        self.smtp_host = os.getenv("SMTP_HOST", "smtp.example.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        self.smtp_user = os.getenv("SMTP_USER", "user@example.com")
-        self.smtp_password = os.getenv("SMTP_PASSWORD", "your_password_here")
         self.email_from = os.getenv("EMAIL_FROM", "noreply@medisecure.com")
+        self.client = client
     
     async def send_email(
         self,
@@ -52,48 +59,76 @@ class SmtpMailer(MailerProtocol):
             bool: True si l'email a été envoyé avec succès, False sinon
         """
         try:
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = self.email_from
-            message["To"] = to_email
-            
-            # Ajouter les destinataires en copie
-            if cc:
-                message["Cc"] = ", ".join(cc)
-            
-            # Ajouter le corps en texte brut
-            part1 = MIMEText(body, "plain")
-            message.attach(part1)
-            
-            # Ajouter le corps en HTML s'il est fourni
-            if html_body:
-                part2 = MIMEText(html_body, "html")
-                message.attach(part2)
-            
-            # Établir la connexion SMTP et envoyer l'email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                # Démarrer le chiffrement TLS
-                server.starttls()
-                
-                # Connexion au serveur SMTP
-                server.login(self.smtp_user, self.smtp_password)
-                
-                # Préparer la liste complète des destinataires
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-                
-                # Envoyer l'email
-                server.sendmail(self.email_from, recipients, message.as_string())
-            
+            recipients, raw_message = self._compose(to_email, subject, body, cc, bcc, html_body)
+            await self._deliver(recipients, raw_message)
             return True
         
         except Exception as e:
-            print(f"Erreur lors de l'envoi de l'email: {str(e)}")
+            logger.exception("Erreur lors de l'envoi de l'email: %s", e)
             return False
     
+    def _compose(
+        self,
+        to_email: str,
+        subject: str,
+        body: str,
+        cc: Optional[List[str]] = None,
+        bcc: Optional[List[str]] = None,
+        html_body: Optional[str] = None
+    ) -> Tuple[List[str], str]:
+        """
+        Compose un email au format MIME.
+        
+        Args:
+            to_email: L'adresse email du destinataire
+            subject: Le sujet de l'email
+            body: Le corps de l'email en texte brut
+            cc: Les adresses email en copie (optionnel)
+            bcc: Les adresses email en copie cachée (optionnel)
+            html_body: Le corps de l'email en HTML (optionnel)
+            
+        Returns:
+            Tuple[List[str], str]: Les destinataires (y compris copies) et le message MIME
+        """
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = self.email_from
+        message["To"] = to_email
+        
+        # Ajouter les destinataires en copie
+        if cc:
+            message["Cc"] = ", ".join(cc)
+        
+        # Ajouter le corps en texte brut
+        part1 = MIMEText(body, "plain")
+        message.attach(part1)
+        
+        # Ajouter le corps en HTML s'il est fourni
+        if html_body:
+            part2 = MIMEText(html_body, "html")
+            message.attach(part2)
+        
+        # Préparer la liste complète des destinataires
+        recipients = [to_email]
+        if cc:
+            recipients.extend(cc)
+        if bcc:
+            recipients.extend(bcc)
+        
+        return recipients, message.as_string()
+    
+    async def _deliver(self, recipients: List[str], raw_message: str) -> None:
+        """
+        Transmet un message au serveur SMTP.
+        
+        Args:
+            recipients: Les adresses des destinataires (y compris copies)
+            raw_message: Le message au format MIME
+        """
+        if self.client is None:
+            self.client = AsyncSmtpClient.from_env()
+        await self.client.send(self.email_from, recipients, raw_message)
+    
     async def send_password_reset(self, to_email: str, reset_token: str) -> bool:
         """
         Envoie un email de réinitialisation de mot de passe.
@@ -23,7 +23,7 @@ class AuthenticatorProtocol(ABC):
         pass
     
     @abstractmethod
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Vérifie si un mot de passe en clair correspond au hash stocké.
         
@@ -37,7 +37,7 @@ class AuthenticatorProtocol(ABC):
         pass
     
     @abstractmethod
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """
         Génère un hash à partir d'un mot de passe en clair.
         
@@ -0,0 +1,70 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Mapping, Optional, Sequence
+
+class CacheProtocol(ABC):
+    """
+    Port secondaire pour un cache clé-valeur.
+    Les valeurs sont des chaînes déjà sérialisées, pour que les implémentations
+    en mémoire et distantes (Redis) soient interchangeables.
+    """
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """
+        Récupère une valeur.
+        
+        Args:
+            key: La clé recherchée
+            
+        Returns:
+            Optional[str]: La valeur, ou None si absente ou expirée
+        """
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        """
+        Enregistre une valeur.
+        
+        Args:
+            key: La clé
+            value: La valeur sérialisée
+            ttl_seconds: La durée de vie (sinon celle configurée pour le cache)
+            if_absent: N'écrit la valeur que si la clé est absente (opération atomique)
+        """
+        pass
+    
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> Dict[str, str]:
+        """
+        Récupère plusieurs valeurs en un seul échange avec le cache.
+        
+        Args:
+            keys: Les clés recherchées
+            
+        Returns:
+            Dict[str, str]: Les valeurs trouvées, indexées par clé (clés absentes ou expirées omises)
+        """
+        pass
+    
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, str], ttl_seconds: Optional[float] = None, if_absent: bool = False) -> None:
+        """
+        Enregistre plusieurs valeurs en un seul échange avec le cache.
+        
+        Args:
+            items: Les valeurs sérialisées, indexées par clé
+            ttl_seconds: La durée de vie (sinon celle configurée pour le cache)
+            if_absent: N'écrit chaque valeur que si sa clé est absente
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """
+        Supprime une valeur.
+        
+        Args:
+            key: La clé à supprimer
+        """
+        pass
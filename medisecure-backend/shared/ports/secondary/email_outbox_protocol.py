@@ -0,0 +1,103 @@
+from abc import ABC, abstractmethod
+from typing import List
+from uuid import UUID
+
+from shared.domain.entities.outbox_message import OutboxMessage
+
+class EmailOutboxProtocol(ABC):
+    """
+    Port secondaire pour la boîte d'envoi transactionnelle des emails (outbox).
+    Les emails sont enregistrés dans la transaction de l'opération métier, puis
+    envoyés en arrière-plan.
+    """
+    
+    @abstractmethod
+    async def enqueue(self, sender: str, recipients: List[str], raw_message: str) -> UUID:
+        """
+        Enregistre un email à envoyer, dans la transaction en cours.
+        
+        Args:
+            sender: L'adresse de l'expéditeur
+            recipients: Les adresses des destinataires (y compris copies)
+            raw_message: Le message au format MIME
+            
+        Returns:
+            UUID: L'ID du message enregistré
+        """
+        pass
+    
+    @abstractmethod
+    async def claim_batch(self, limit: int, lease_seconds: float) -> List[OutboxMessage]:
+        """
+        Réserve jusqu'à `limit` messages à envoyer en leur attribuant un bail de
+        `lease_seconds` (statut sending). La réservation est validée aussitôt : les
+        messages sont envoyés hors transaction. Les messages réservés par un autre
+        worker sont ignorés ; ceux dont le bail a expiré (worker arrêté pendant
+        l'envoi) sont réservables de nouveau.
+        
+        Args:
+            limit: Le nombre maximum de messages
+            lease_seconds: La durée du bail
+            
+        Returns:
+            List[OutboxMessage]: Les messages réservés, les plus anciens d'abord
+        """
+        pass
+    
+    @abstractmethod
+    async def mark_sent(self, message_id: UUID) -> None:
+        """
+        Marque un message comme envoyé. Son contenu (données de santé) n'est pas
+        conservé.
+        
+        Args:
+            message_id: L'ID du message
+        """
+        pass
+    
+    @abstractmethod
+    async def mark_retry(self, message_id: UUID, error: str, delay_seconds: float) -> None:
+        """
+        Reprogramme un message après un échec d'envoi (il redevient en attente).
+        
+        Args:
+            message_id: L'ID du message
+            error: La cause de l'échec
+            delay_seconds: Le délai avant la prochaine tentative
+        """
+        pass
+    
+    @abstractmethod
+    async def mark_failed(self, message_id: UUID, error: str) -> None:
+        """
+        Abandonne un message après trop d'échecs.
+        
+        Args:
+            message_id: L'ID du message
+            error: La cause du dernier échec
+        """
+        pass
+    
+    @abstractmethod
+    async def purge(self, retention_seconds: float) -> int:
+        """
+        Supprime les messages envoyés ou abandonnés créés depuis plus de
+        `retention_seconds`.
+        
+        Args:
+            retention_seconds: La durée de conservation des messages traités
+            
+        Returns:
+            int: Le nombre de messages supprimés
+        """
+        pass
+    
+    @abstractmethod
+    async def pending_count(self) -> int:
+        """
+        Compte les messages en attente d'envoi.
+        
+        Returns:
+            int: Le nombre de messages en attente
+        """
+        pass
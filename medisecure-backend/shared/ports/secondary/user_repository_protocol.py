@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Dict, Iterable
 from uuid import UUID
 from shared.domain.entities.user import User
 
@@ -22,6 +22,19 @@ class UserRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_many(self, user_ids: Iterable[UUID]) -> Dict[UUID, User]:
+        """
+        Récupère plusieurs utilisateurs par leurs IDs (une seule requête pour tout le lot).
+        
+        Args:
+            user_ids: Les IDs des utilisateurs à récupérer
+            
+        Returns:
+            Dict[UUID, User]: Les utilisateurs trouvés, indexés par ID (les IDs inconnus sont absents)
+        """
+        pass
+    
     @abstractmethod
     async def get_by_email(self, email: str) -> Optional[User]:
         """
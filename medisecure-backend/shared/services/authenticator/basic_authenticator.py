@@ -1,12 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 import os
 from dotenv import load_dotenv
 import traceback
 
 from shared.ports.primary.authenticator_protocol import AuthenticatorProtocol
+from shared.services.authenticator.password_hasher import PasswordHasher
 
 # Charger les variables d'environnement
 load_dotenv()
@@ -17,11 +17,14 @@ class BasicAuthenticator(AuthenticatorProtocol):
     Implémente le port AuthenticatorProtocol.
     """
     
-    def __init__(self):
+    def __init__(self, password_hasher: Optional[PasswordHasher] = None):
         """
         Initialise l'authentificateur avec les clés et algorithmes de chiffrement.
+        
+        Args:
+            password_hasher: Le service de hachage des mots de passe (exécuté hors de la boucle d'événements)
         """
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+        self.password_hasher = password_hasher or PasswordHasher.from_env()
         self.jwt_secret_key = os.getenv("JWT_SECRET_KEY", "default_secret_key")
         self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
         self.access_token_expire_minutes = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
@@ -54,7 +57,7 @@ class BasicAuthenticator(AuthenticatorProtocol):
             print(traceback.format_exc())
             raise
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """
         Vérifie si un mot de passe en clair correspond au hash stocké.
         
@@ -65,17 +68,9 @@ class BasicAuthenticator(AuthenticatorProtocol):
         Returns:
             bool: True si le mot de passe correspond, False sinon
         """
-        try:
-            print(f"Vérification du mot de passe. Mot de passe en clair: {plain_password}, Hash: {hashed_password}")
-            result = self.pwd_context.verify(plain_password, hashed_password)
-            print(f"Résultat de la vérification: {result}")
-            return result
-        except Exception as e:
-            print(f"Erreur lors de la vérification du mot de passe: {str(e)}")
-            print(traceback.format_exc())
-            raise
+        return await self.password_hasher.verify(plain_password, hashed_password)
     
-    def get_password_hash(self, password: str) -> str:
+    async def get_password_hash(self, password: str) -> str:
         """
         Génère un hash à partir d'un mot de passe en clair.
         
@@ -85,9 +80,4 @@ class BasicAuthenticator(AuthenticatorProtocol):
         Returns:
             str: Le hash du mot de passe
         """
-        try:
-            return self.pwd_context.hash(password)
-        except Exception as e:
-            print(f"Erreur lors du hachage du mot de passe: {str(e)}")
-            print(traceback.format_exc())
-            raise
\ No newline at end of file
+        return await self.password_hasher.hash(password)
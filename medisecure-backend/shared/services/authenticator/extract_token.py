@@ -1,22 +1,23 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
+from jose import JWTError
 from typing import Dict, Any
-import os
-from dotenv import load_dotenv
 
-# Charger les variables d'environnement
-load_dotenv()
+from shared.container.container import get_container
 
 security = HTTPBearer()
 
 async def extract_token_payload(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     """
     Extrait et valide le payload du token JWT.
+    Réutilise le payload déjà vérifié par l'AuthenticationMiddleware pour cette requête,
+    sinon passe par le TokenVerifier partagé (cache des tokens déjà vérifiés).
     
     Args:
+        request: La requête HTTP
         credentials: Les informations d'authentification HTTP
         
     Returns:
@@ -29,15 +30,13 @@ async def extract_token_payload(
         # Récupérer le token
         token = credentials.credentials
         
-        # Décoder le token
-        payload = jwt.decode(
-            token, 
-            os.getenv("JWT_SECRET_KEY", "default_secret_key"), 
-            algorithms=[os.getenv("JWT_ALGORITHM", "HS256")]
-        )
+        if getattr(request.state, "token", None) == token:
+            payload = dict(request.state.user)
+        else:
+            payload = get_container().token_verifier().verify(token)
         
         # Assurez-vous que le rôle est en majuscules pour la vérification ultérieure
-        # Mais ne modifiez pas le payload original
+        # Le payload est une copie : le cache et request.state ne sont pas modifiés
         if "role" in payload and isinstance(payload["role"], str):
             payload["role"] = payload["role"].upper()
         
@@ -48,4 +47,4 @@ async def extract_token_payload(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
-        )
\ No newline at end of file
+        )
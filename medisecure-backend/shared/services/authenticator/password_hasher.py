@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+import bcrypt
+
+from shared.infrastructure.monitoring.prometheus_metrics import (
+    PASSWORD_HASH_IN_FLIGHT,
+    PASSWORD_HASH_QUEUE_SECONDS,
+    PASSWORD_HASH_SECONDS
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Facteur de coût bcrypt par défaut (2^12 itérations)
+DEFAULT_BCRYPT_ROUNDS = 12
+
+class PasswordHasher:
+    """
+    Service de hachage et de vérification des mots de passe (bcrypt).
+
+    Le calcul bcrypt (~100 à 300 ms de CPU selon le coût) est exécuté dans un pool de
+    threads borné, hors de la boucle d'événements : bcrypt libère le GIL pendant le
+    calcul. Un sémaphore limite le nombre de calculs simultanés, les suivants attendent
+    leur tour sans occuper la boucle ; ce temps d'attente est mesuré.
+    """
+
+    def __init__(self, rounds: int = DEFAULT_BCRYPT_ROUNDS, max_concurrency: Optional[int] = None):
+        """
+        Initialise le service.
+
+        Args:
+            rounds: Le facteur de coût bcrypt des nouveaux hash (4 à 31)
+            max_concurrency: Le nombre maximal de calculs simultanés (par défaut : nombre de CPU)
+        """
+        if not 4 <= rounds <= 31:
+            raise ValueError("Le facteur de coût bcrypt doit être compris entre 4 et 31")
+        self.rounds = rounds
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="password-hasher"
+        )
+        # Créé à la première utilisation, dans la boucle d'événements
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @classmethod
+    def from_env(cls) -> "PasswordHasher":
+        """Crée le service à partir de BCRYPT_ROUNDS et PASSWORD_HASH_CONCURRENCY."""
+        concurrency = os.getenv("PASSWORD_HASH_CONCURRENCY")
+        return cls(
+            rounds=int(os.getenv("BCRYPT_ROUNDS", str(DEFAULT_BCRYPT_ROUNDS))),
+            max_concurrency=int(concurrency) if concurrency else None
+        )
+
+    async def hash(self, password: str) -> str:
+        """
+        Génère un hash à partir d'un mot de passe en clair.
+
+        Args:
+            password: Le mot de passe en clair
+
+        Returns:
+            str: Le hash du mot de passe
+        """
+        return await self._run("hash", self.hash_sync, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Vérifie si un mot de passe en clair correspond au hash stocké.
+
+        Args:
+            password: Le mot de passe en clair
+            hashed_password: Le hash du mot de passe stocké
+
+        Returns:
+            bool: True si le mot de passe correspond, False sinon (y compris hash invalide)
+        """
+        return await self._run("verify", self.verify_sync, password, hashed_password)
+
+    def hash_sync(self, password: str) -> str:
+        """Version bloquante de hash, pour les scripts hors de la boucle d'événements."""
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)).decode("utf-8")
+
+    def verify_sync(self, password: str, hashed_password: str) -> bool:
+        """Version bloquante de verify, pour les scripts hors de la boucle d'événements."""
+        try:
+            return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+        except ValueError as e:
+            logger.error("Hash de mot de passe invalide: %s", e)
+            return False
+
+    def shutdown(self) -> None:
+        """Arrête le pool de threads."""
+        self._executor.shutdown(wait=False)
+
+    async def _run(self, operation: str, func: Callable[..., T], *args) -> T:
+        """Exécute un calcul dans le pool, après avoir obtenu une place du sémaphore."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        queued = time.perf_counter()
+        async with self._semaphore:
+            started = time.perf_counter()
+            PASSWORD_HASH_QUEUE_SECONDS.labels(operation=operation).observe(started - queued)
+            PASSWORD_HASH_IN_FLIGHT.inc()
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._executor, func, *args)
+            finally:
+                PASSWORD_HASH_IN_FLIGHT.dec()
+                PASSWORD_HASH_SECONDS.labels(operation=operation).observe(time.perf_counter() - started)
@@ -0,0 +1,98 @@
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Callable, Dict
+
+from jose import jwt
+from dotenv import load_dotenv
+
+from shared.infrastructure.cache.ttl_cache import TTLCache
+from shared.infrastructure.monitoring.prometheus_metrics import CACHE_EVICTIONS, CACHE_HITS, CACHE_MISSES
+
+# Charger les variables d'environnement
+load_dotenv()
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+CACHE_NAME = "tokens"
+
+class TokenVerifier:
+    """
+    Vérification des tokens JWT avec cache des payloads déjà vérifiés.
+
+    La clé et l'algorithme sont lus une seule fois. Un token valide n'est décodé
+    (signature vérifiée) qu'une fois : son payload est ensuite servi par un cache LRU,
+    indexé par l'empreinte SHA-256 du token (le token lui-même n'est pas conservé),
+    jusqu'à son expiration (claim exp). Les tokens invalides ne sont pas mis en cache.
+    """
+
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        max_size: int = 10000,
+        default_ttl_seconds: float = 300.0,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialise le vérificateur.
+
+        Args:
+            secret_key: La clé de signature des tokens
+            algorithm: L'algorithme de signature
+            max_size: Le nombre maximal de tokens en cache
+            default_ttl_seconds: La durée de cache d'un token sans claim exp
+            clock: L'horloge (timestamp UNIX, injectable pour les tests)
+        """
+        self.secret_key = secret_key
+        self.algorithm = algorithm
+        self._clock = clock
+        self._cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            ttl_seconds=default_ttl_seconds,
+            max_size=max_size,
+            clock=clock
+        )
+
+    @classmethod
+    def from_env(cls) -> "TokenVerifier":
+        """Crée le vérificateur à partir de JWT_SECRET_KEY, JWT_ALGORITHM et TOKEN_CACHE_MAX_SIZE."""
+        return cls(
+            secret_key=os.getenv("JWT_SECRET_KEY", "default_secret_key"),
+            algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+            max_size=int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+        )
+
+    def verify(self, token: str) -> Dict[str, Any]:
+        """
+        Vérifie un token et retourne son payload.
+
+        Args:
+            token: Le token JWT
+
+        Returns:
+            Dict[str, Any]: Une copie du payload (modifiable par l'appelant)
+
+        Raises:
+            JWTError: Si le token est invalide ou expiré
+        """
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        payload = self._cache.get(key)
+        if payload is not None:
+            CACHE_HITS.labels(cache=CACHE_NAME).inc()
+            return dict(payload)
+
+        CACHE_MISSES.labels(cache=CACHE_NAME).inc()
+        payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
+
+        exp = payload.get("exp")
+        ttl_seconds = float(exp) - self._clock() if isinstance(exp, (int, float)) else None
+        if ttl_seconds is None or ttl_seconds > 0:
+            if self._cache.set(key, payload, ttl_seconds=ttl_seconds) is not None:
+                CACHE_EVICTIONS.labels(cache=CACHE_NAME).inc()
+        return dict(payload)
+
+    def clear(self) -> None:
+        """Vide le cache (ex: après un changement de clé)."""
+        self._cache.clear()
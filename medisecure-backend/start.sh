@@ -57,6 +57,9 @@ echo "Host: $HOST"
 echo "Port: $PORT"
 echo "Environment: $ENVIRONMENT"
 
-# Démarrer l'API
+# Démarrer l'API : rechargement automatique en développement, serveur multi-workers sinon
 echo 'Démarrage de l API...'
-exec uvicorn api.main:app --host "$HOST" --port "$PORT" --reload
\ No newline at end of file
+if [ "$ENVIRONMENT" = "development" ]; then
+    exec uvicorn api.main:app --host "$HOST" --port "$PORT" --reload
+fi
+exec python -m api.server
\ No newline at end of file
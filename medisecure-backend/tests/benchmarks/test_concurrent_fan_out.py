@@ -0,0 +1,183 @@
+# tests/benchmarks/test_concurrent_fan_out.py
+"""
+Latence des chemins qui lisent plusieurs données indépendantes, avec un aller-retour
+vers la base simulé (LATENCY par requête).
+
+- Avant : lectures attendues l'une après l'autre (≈ 2 × LATENCY)
+- Après : lectures lancées en parallèle avec run_concurrently (≈ LATENCY)
+
+Chemin mesuré (uniquement avec --benchmark) : liste des patients avec total exact
+(list_all + count). La notification de création d'un rendez-vous lit le patient et
+le médecin l'un après l'autre sur la session de la réservation, sans autre
+connexion du pool.
+"""
+import asyncio
+import time
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+from dependency_injector import providers
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from appointment_management.infrastructure.adapters.secondary.smtp_notification_adapter import SmtpNotificationAdapter
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.primary.controllers.patient_controller import list_patients
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.container.container import Container
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.database.unit_of_work import UnitOfWork, get_current_session
+
+LATENCY = 0.005
+REQUESTS = 20
+REPEATS = 3
+TOKEN = {"sub": "bench", "role": "doctor"}
+
+class SlowPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire dont chaque lecture coûte un aller-retour simulé"""
+    async def get_by_id(self, patient_id):
+        await asyncio.sleep(LATENCY)
+        return await super().get_by_id(patient_id)
+
+    async def list_all(self, *args, **kwargs):
+        await asyncio.sleep(LATENCY)
+        return await super().list_all(*args, **kwargs)
+
+    async def count(self):
+        await asyncio.sleep(LATENCY)
+        return await super().count()
+
+class SlowUserRepository(InMemoryUserRepository):
+    """Repository en mémoire dont chaque lecture coûte un aller-retour simulé"""
+    async def get_by_id(self, user_id):
+        await asyncio.sleep(LATENCY)
+        return await super().get_by_id(user_id)
+
+class NullMailer:
+    """Mailer n'envoyant rien"""
+    async def send_email(self, to_email, subject, body, **options):
+        return True
+
+async def best_latency(request) -> float:
+    """Meilleure latence moyenne (s) d'une requête sur REPEATS séries de REQUESTS"""
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(REQUESTS):
+            await request()
+        best = min(best, (time.perf_counter() - started) / REQUESTS)
+    return best
+
+def make_patient(i: int) -> Patient:
+    """Crée un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="Jean",
+        last_name=f"Dupont{i}",
+        date_of_birth=date(1980, 1, 1),
+        gender="male",
+        email=f"jean.dupont{i}@example.com"
+    )
+
+def patient_list_container(repository: SlowPatientRepository) -> Container:
+    """Container dont le repository des patients contient 50 patients"""
+    for i in range(50):
+        patient = make_patient(i)
+        repository.patients[patient.id] = patient
+    container = Container()
+    container.patient_repository.override(providers.Object(repository))
+    return container
+
+async def list_first_page(container: Container):
+    """Liste la première page de patients avec total exact"""
+    return await list_patients(
+        skip=0, limit=20, pagination="offset", cursor=None, order_by="name",
+        fields="full", count="exact", token_payload=TOKEN, container=container
+    )
+
+@pytest.mark.asyncio
+async def test_patient_list_reads_page_and_total_together():
+    """Test que la page et le total exact sont lus en même temps"""
+    repository = SlowPatientRepository()
+    container = patient_list_container(repository)
+    running = 0
+    max_running = 0
+
+    def track(read):
+        async def tracked(*args, **kwargs):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            try:
+                return await read(*args, **kwargs)
+            finally:
+                running -= 1
+        return tracked
+
+    repository.list_all = track(repository.list_all)
+    repository.count = track(repository.count)
+
+    response = await list_first_page(container)
+
+    assert len(response.patients) == 20
+    assert response.total == 50
+    assert max_running == 2
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_patient_list_fan_out_latency(record_property):
+    """Mesure la liste des patients avec total exact, lectures successives ou parallèles"""
+    repository = SlowPatientRepository()
+    container = patient_list_container(repository)
+
+    async def sequential():
+        await repository.list_all(0, 20, fields="full")
+        await repository.count()
+
+    record_property("sequential_ms", await best_latency(sequential) * 1e3)
+    record_property("concurrent_ms", await best_latency(lambda: list_first_page(container)) * 1e3)
+
+@pytest.mark.asyncio
+async def test_notification_reads_participants_in_the_booking_transaction():
+    """Test que la notification lit le patient et le médecin sur la session du rendez-vous, l'un après l'autre"""
+    patients = SlowPatientRepository()
+    users = SlowUserRepository()
+    patient = make_patient(0)
+    patients.patients[patient.id] = patient
+    doctor = await users.create(User(
+        id=uuid4(),
+        email="doctor@medisecure.com",
+        first_name="Marie",
+        last_name="Curie",
+        role=UserRole.DOCTOR,
+        created_at=datetime.now()
+    ))
+    adapter = SmtpNotificationAdapter(NullMailer(), patients, users)
+    sessions = []
+    running = 0
+    max_running = 0
+
+    def track(read):
+        async def tracked(*args):
+            nonlocal running, max_running
+            sessions.append(get_current_session())
+            running += 1
+            max_running = max(max_running, running)
+            try:
+                return await read(*args)
+            finally:
+                running -= 1
+        return tracked
+
+    patients.get_by_id = track(patients.get_by_id)
+    users.get_by_id = track(users.get_by_id)
+
+    # Session sans connexion : aucune requête SQL n'est émise par les repositories en mémoire
+    async with UnitOfWork(AsyncSession) as unit_of_work:
+        session = unit_of_work.session
+        await adapter.send_appointment_created(patient.id, doctor.id, uuid4(), datetime(2026, 1, 5, 9, 0))
+
+    assert sessions == [session, session]
+    assert max_running == 1
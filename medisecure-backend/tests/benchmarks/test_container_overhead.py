@@ -0,0 +1,51 @@
+# tests/benchmarks/test_container_overhead.py
+"""
+Coût par requête de la résolution des dépendances.
+
+Avant : le router des patients créait un Container() à chaque requête, puis les
+cas d'utilisation et services. Après : toutes les requêtes utilisent le container
+créé au démarrage, dont les cas d'utilisation et services sans état sont des singletons.
+
+La mesure n'est exécutée qu'avec --benchmark ; les durées sont enregistrées comme
+propriétés du test (rapport JUnit, --junitxml).
+"""
+import logging
+import time
+
+import pytest
+
+from shared.container.container import Container, get_container
+
+ITERATIONS = 200
+
+def per_request_seconds(resolve) -> float:
+    """Durée moyenne d'une résolution, en secondes"""
+    resolve()
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        resolve()
+    return (time.perf_counter() - started) / ITERATIONS
+
+def resolve_with_fresh_container():
+    """Résolution d'avant : un container par requête"""
+    container = Container()
+    return container.get_patient_usecase()
+
+def resolve_with_shared_container():
+    """Résolution d'après : le container partagé"""
+    return get_container().get_patient_usecase()
+
+def test_shared_container_reuses_use_cases():
+    """Test que le container partagé retourne toujours le même cas d'utilisation"""
+    container = get_container()
+
+    assert get_container() is container
+    assert container.get_patient_usecase() is container.get_patient_usecase()
+
+@pytest.mark.benchmark
+def test_shared_container_per_request_overhead(caplog, record_property):
+    """Mesure le coût par requête des deux modes de résolution"""
+    caplog.set_level(logging.WARNING)
+
+    record_property("fresh_container_us", per_request_seconds(resolve_with_fresh_container) * 1e6)
+    record_property("shared_container_us", per_request_seconds(resolve_with_shared_container) * 1e6)
@@ -0,0 +1,77 @@
+# tests/benchmarks/test_json_response_rendering.py
+"""
+Temps de sérialisation JSON d'une liste de 1 000 patients (colonnes JSONB remplies).
+
+- jsonable_encoder + JSONResponse : chemin des anciennes versions de FastAPI
+- dump_json : sérialisation native des versions récentes de FastAPI (pydantic-core),
+  utilisée tant que les routers gardent la classe de réponse par défaut
+
+La mesure n'est exécutée qu'avec --benchmark.
+"""
+import json
+import time
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import router as appointment_router
+from patient_management.domain.entities.patient import Patient
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO, to_patient_response
+from patient_management.infrastructure.adapters.primary.controllers.patient_controller import router as patient_router
+
+ROWS = 1000
+ITERATIONS = 5
+
+PAGE = PatientListResponseDTO(
+    patients=[
+        to_patient_response(Patient(
+            id=uuid4(),
+            first_name=f"Prénom{i}",
+            last_name=f"Nom{i}",
+            date_of_birth=date(1980, 1, 1),
+            gender="female",
+            email=f"patient{i}@example.com",
+            allergies={"pollen": {"severity": "mild", "since": 2001}},
+            chronic_diseases={"asthma": True},
+            current_medications={"ventolin": "2x/day"}
+        ))
+        for i in range(ROWS)
+    ],
+    total=ROWS,
+    skip=0,
+    limit=ROWS
+)
+
+def seconds(render) -> float:
+    """Durée moyenne d'une sérialisation complète de la page, en secondes"""
+    render()
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        render()
+    return (time.perf_counter() - started) / ITERATIONS
+
+@pytest.mark.parametrize("router", [patient_router, appointment_router])
+def test_routers_keep_default_response_class(router):
+    """Test que les routers laissent FastAPI sérialiser les response_model lui-même"""
+    assert isinstance(router.default_response_class, DefaultPlaceholder)
+
+def test_native_serialization_matches_encoder():
+    """Test que la sérialisation native produit le même contenu que jsonable_encoder"""
+    dump_json = getattr(PAGE, "model_dump_json", None)
+    if dump_json is None:
+        pytest.skip("pydantic v1 : pas de sérialisation native")
+
+    assert json.loads(dump_json()) == json.loads(JSONResponse(jsonable_encoder(PAGE)).body)
+
+@pytest.mark.benchmark
+def test_serialization_time_per_1000_rows(record_property):
+    """Mesure les rendus JSON d'une page de 1 000 patients"""
+    record_property("jsonable_encoder_ms", seconds(lambda: JSONResponse(jsonable_encoder(PAGE)).body) * 1e3)
+
+    dump_json = getattr(PAGE, "model_dump_json", None)
+    if dump_json is not None:
+        record_property("dump_json_ms", seconds(dump_json) * 1e3)
@@ -0,0 +1,100 @@
+# tests/benchmarks/test_logging_overhead.py
+"""
+Débit des requêtes de création et de mise à jour de patients (contrôleur, cas
+d'utilisation et repository en mémoire) selon le niveau de journalisation.
+
+- DEBUG : les DTOs reçus sont formatés et écrits à chaque requête
+- INFO : les messages DEBUG sont écartés avant formatage (arguments %s non évalués)
+- INFO échantillonné à 10 % : seule une fraction des messages INFO est écrite
+
+La mesure n'est exécutée qu'avec --benchmark ; les débits sont enregistrés comme
+propriétés du test.
+"""
+import io
+import logging
+import time
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from dependency_injector import providers
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from patient_management.application.dtos.patient_dtos import PatientCreateDTO, PatientUpdateDTO
+from patient_management.infrastructure.adapters.primary.controllers.patient_controller import create_patient, update_patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.container.container import Container
+from shared.infrastructure.database.unit_of_work import UnitOfWork
+from shared.infrastructure.monitoring.logging_config import LoggingSettings, create_handler
+
+REQUESTS = 200
+REPEATS = 5
+TOKEN = {"sub": "bench", "role": "doctor"}
+
+async def handle_requests(settings: LoggingSettings, stream: io.StringIO, requests: int) -> float:
+    """
+    Traite `requests` créations + mises à jour de patients, journalisées dans `stream`.
+
+    Returns:
+        float: La durée du traitement, en secondes
+    """
+    root = logging.getLogger()
+    previous_level = root.level
+    handler = create_handler(settings, stream=stream)
+    root.addHandler(handler)
+    root.setLevel(settings.level)
+    try:
+        container = Container()
+        container.patient_repository.override(providers.Object(InMemoryPatientRepository()))
+        # Session sans connexion : aucune requête SQL n'est émise par le repository en mémoire
+        unit_of_work = UnitOfWork(AsyncSession)
+        commands = [
+            PatientCreateDTO(
+                first_name="Jean",
+                last_name=f"Dupont{i}",
+                date_of_birth=date(1980, 1, 1),
+                gender="male",
+                email=f"jean.dupont{i}@example.com",
+                allergies={"pollen": "mild"},
+                notes="Suivi annuel"
+            )
+            for i in range(requests // 2)
+        ]
+        update = PatientUpdateDTO(notes="Suivi trimestriel")
+
+        started = time.perf_counter()
+        for command in commands:
+            created = await create_patient(command, TOKEN, container, unit_of_work)
+            await update_patient(created.id, update, TOKEN, container, unit_of_work)
+        return time.perf_counter() - started
+    finally:
+        root.removeHandler(handler)
+        root.setLevel(previous_level)
+
+async def requests_per_second(settings: LoggingSettings) -> float:
+    """Meilleur débit (requêtes/s) sur REPEATS séries de REQUESTS créations + mises à jour"""
+    best = min([await handle_requests(settings, io.StringIO(), REQUESTS) for _ in range(REPEATS)])
+    return REQUESTS / best
+
+@pytest.mark.asyncio
+async def test_info_level_drops_request_debug_logs():
+    """Test qu'en INFO les messages DEBUG des requêtes ne sont pas écrits"""
+    debug, info = io.StringIO(), io.StringIO()
+
+    await handle_requests(LoggingSettings(level="DEBUG"), debug, 10)
+    await handle_requests(LoggingSettings(level="INFO"), info, 10)
+
+    assert " DEBUG " in debug.getvalue()
+    assert " DEBUG " not in info.getvalue()
+    assert len(info.getvalue().splitlines()) < len(debug.getvalue().splitlines())
+
+@pytest.mark.benchmark
+@pytest.mark.asyncio
+async def test_request_throughput_by_log_level(record_property):
+    """Mesure le débit des requêtes journalisées en DEBUG et en INFO"""
+    record_property("debug_requests_per_second", await requests_per_second(LoggingSettings(level="DEBUG")))
+    record_property("info_requests_per_second", await requests_per_second(LoggingSettings(level="INFO")))
+    record_property(
+        "sampled_info_requests_per_second",
+        await requests_per_second(LoggingSettings(level="INFO", info_sample_rate=0.1))
+    )
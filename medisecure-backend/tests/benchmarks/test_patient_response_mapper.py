@@ -0,0 +1,60 @@
+# tests/benchmarks/test_patient_response_mapper.py
+"""
+Coût par ligne de la conversion entité → PatientResponseDTO.
+
+Avant : copie champ par champ dans les arguments de PatientResponseDTO(...).
+Après : ResponseMapper, qui construit le DTO directement à partir des attributs
+de l'entité. Mesuré sur une page de 100 patients, uniquement avec --benchmark.
+"""
+import time
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.application.dtos.patient_dtos import PatientResponseDTO, to_patient_response
+
+PAGE_SIZE = 100
+ITERATIONS = 20
+REPEATS = 5
+
+PAGE = [
+    Patient(
+        id=uuid4(),
+        first_name=f"Prénom{i}",
+        last_name=f"Nom{i}",
+        date_of_birth=date(1980, 1, 1),
+        gender="female",
+        email=f"patient{i}@example.com",
+        allergies={"pollen": "mild"},
+        has_consent=True,
+        gdpr_consent=True
+    )
+    for i in range(PAGE_SIZE)
+]
+
+def copied(patient: Patient) -> PatientResponseDTO:
+    """Conversion d'avant : tous les champs copiés un par un"""
+    return PatientResponseDTO(**{field: getattr(patient, field) for field in to_patient_response.fields})
+
+def per_row_seconds(convert) -> float:
+    """Durée de conversion d'une ligne (meilleure de REPEATS mesures), en secondes"""
+    [convert(patient) for patient in PAGE]
+    timings = []
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            [convert(patient) for patient in PAGE]
+        timings.append((time.perf_counter() - started) / (ITERATIONS * PAGE_SIZE))
+    return min(timings)
+
+def test_mapper_matches_field_copy():
+    """Test que le mapper produit les mêmes DTO que la copie champ par champ"""
+    assert [to_patient_response(patient) for patient in PAGE] == [copied(patient) for patient in PAGE]
+
+@pytest.mark.benchmark
+def test_mapper_per_row_cost(record_property):
+    """Mesure le coût par ligne des deux conversions"""
+    record_property("field_copy_us", per_row_seconds(copied) * 1e6)
+    record_property("mapper_us", per_row_seconds(to_patient_response) * 1e6)
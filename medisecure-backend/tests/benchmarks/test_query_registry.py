@@ -0,0 +1,65 @@
+# tests/benchmarks/test_query_registry.py
+"""
+Coût de préparation d'une requête de repository avant sa recherche dans le cache de
+compilation de SQLAlchemy.
+
+- Avant : select(...) reconstruit à chaque appel, clé de cache recalculée
+- Après : requête du registre, construite une fois (clé de cache mémorisée)
+
+La mesure n'est exécutée qu'avec --benchmark.
+"""
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import TSRANGE
+from sqlalchemy.future import select
+
+from shared.infrastructure.database.models.patient_model import PatientModel  # noqa: F401 (relations de AppointmentModel)
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import QUERIES
+from appointment_management.infrastructure.models.appointment_model import ACTIVE_STATUS_PREDICATE, AppointmentModel
+
+ITERATIONS = 500
+REPEATS = 5
+
+def per_call_seconds(prepare) -> float:
+    """Meilleure durée moyenne d'une préparation sur REPEATS séries, en secondes"""
+    prepare()
+    best = float("inf")
+    for _ in range(REPEATS):
+        started = time.perf_counter()
+        for _ in range(ITERATIONS):
+            prepare()
+        best = min(best, (time.perf_counter() - started) / ITERATIONS)
+    return best
+
+def rebuilt_find_conflicts():
+    """Construction d'avant : requête reconstruite avec les valeurs de l'appel"""
+    start_time = datetime(2026, 1, 5, 9, 0)
+    query = select(AppointmentModel).where(
+        AppointmentModel.doctor_id == uuid4(),
+        text(ACTIVE_STATUS_PREDICATE),
+        AppointmentModel.period.op("&&")(
+            func.tsrange(start_time, start_time + timedelta(minutes=30), "[)", type_=TSRANGE)
+        )
+    )
+    return query._generate_cache_key()
+
+def registered_find_conflicts():
+    """Requête du registre : seules les valeurs des paramètres changent"""
+    return QUERIES["find_conflicts"]._generate_cache_key()
+
+def test_registry_reuses_find_conflicts_statement():
+    """Test que le registre retourne la même requête et la même clé de cache à chaque appel"""
+    assert QUERIES["find_conflicts"] is QUERIES["find_conflicts"]
+    assert registered_find_conflicts() is registered_find_conflicts()
+    assert rebuilt_find_conflicts() is not rebuilt_find_conflicts()
+
+@pytest.mark.benchmark
+def test_registered_query_preparation_cost(record_property):
+    """Mesure le coût par appel de find_conflicts, requête reconstruite ou enregistrée"""
+    record_property("rebuilt_us", per_call_seconds(rebuilt_find_conflicts) * 1e6)
+    record_property("registered_us", per_call_seconds(registered_find_conflicts) * 1e6)
@@ -0,0 +1,28 @@
+# tests/unit/api/test_main.py
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from dependency_injector import providers
+
+from api import main
+from shared.container.container import Container, reset_container, set_container_instance
+
+@pytest.mark.asyncio
+async def test_shutdown_stops_password_hasher_and_pool(monkeypatch):
+    """Test que l'arrêt de l'application libère les threads de hachage et le pool"""
+    monkeypatch.setenv("EMAIL_OUTBOX_WORKER_ENABLED", "false")
+    dispose_engine = AsyncMock()
+    monkeypatch.setattr(main, "dispose_engine", dispose_engine)
+    password_hasher = MagicMock()
+    container = Container()
+    container.password_hasher.override(providers.Object(password_hasher))
+    set_container_instance(container)
+
+    try:
+        await main.shutdown_event()
+    finally:
+        reset_container()
+
+    password_hasher.shutdown.assert_called_once_with()
+    dispose_engine.assert_awaited_once()
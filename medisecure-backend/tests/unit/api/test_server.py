@@ -0,0 +1,61 @@
+# tests/unit/api/test_server.py
+
+from api import server
+from api.server import ServerSettings, available_cpus, cgroup_cpu_limit, uvicorn_options
+
+def test_cgroup_v2_cpu_limit(tmp_path):
+    """Test la lecture du quota CPU d'un cgroup v2"""
+    (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+    assert cgroup_cpu_limit(tmp_path) == 1.5
+
+def test_cgroup_v2_without_limit(tmp_path):
+    """Test qu'un quota "max" signifie l'absence de limite"""
+    (tmp_path / "cpu.max").write_text("max 100000\n")
+
+    assert cgroup_cpu_limit(tmp_path) is None
+
+def test_cgroup_v1_cpu_limit(tmp_path):
+    """Test la lecture du quota CPU d'un cgroup v1"""
+    (tmp_path / "cpu").mkdir()
+    (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+    (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+    assert cgroup_cpu_limit(tmp_path) == 2.0
+
+def test_available_cpus_respects_cgroup_limit(tmp_path, monkeypatch):
+    """Test que le nombre de workers suit la limite du conteneur, arrondie au supérieur"""
+    monkeypatch.setattr(server.os, "sched_getaffinity", lambda pid: set(range(16)), raising=False)
+    (tmp_path / "cpu.max").write_text("250000 100000\n")
+
+    assert available_cpus(tmp_path) == 3
+
+def test_available_cpus_without_cgroup(tmp_path, monkeypatch):
+    """Test que sans limite cgroup, tous les CPUs autorisés sont utilisés"""
+    monkeypatch.setattr(server.os, "sched_getaffinity", lambda pid: {0, 1, 2, 3}, raising=False)
+
+    assert available_cpus(tmp_path) == 4
+
+def test_web_concurrency_overrides_cpu_count(monkeypatch):
+    """Test que WEB_CONCURRENCY force le nombre de workers"""
+    monkeypatch.setenv("WEB_CONCURRENCY", "6")
+
+    assert ServerSettings.from_env().workers == 6
+
+def test_multiple_workers_without_shared_cache(monkeypatch):
+    """Test que l'absence de cache partagé ne réduit pas le nombre de workers"""
+    monkeypatch.setenv("WEB_CONCURRENCY", "6")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert server.shared_cache_available() is False
+    assert ServerSettings.from_env().workers == 6
+
+def test_uvicorn_options_disable_reload():
+    """Test que le serveur de production ne surveille pas les fichiers"""
+    options = uvicorn_options(ServerSettings(workers=4, graceful_shutdown=15))
+
+    assert options["reload"] is False
+    assert options["workers"] == 4
+    assert options["lifespan"] == "on"
+    assert options["timeout_graceful_shutdown"] == 15
+    assert options["loop"] in ("uvloop", "asyncio")
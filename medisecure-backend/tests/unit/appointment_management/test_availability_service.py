@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import date, datetime, timedelta
+
+from appointment_management.application.usecases.get_doctor_availability_usecase import GetDoctorAvailabilityUseCase
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
+from appointment_management.domain.services.appointment_service import AppointmentService
+from appointment_management.domain.services.availability_service import AvailabilityService
+
+SLOT = timedelta(minutes=30)
+
+def make_appointment(doctor_id, start, minutes=30, status="scheduled"):
+    return Appointment(
+        id=uuid4(),
+        patient_id=uuid4(),
+        doctor_id=doctor_id,
+        start_time=start,
+        end_time=start + timedelta(minutes=minutes),
+        status=status
+    )
+
+def brute_force_slots(busy, day, start_hour=8, end_hour=18):
+    """Ancien algorithme : chaque créneau comparé à chaque rendez-vous"""
+    current = datetime.combine(day, datetime.min.time()) + timedelta(hours=start_hour)
+    close = datetime.combine(day, datetime.min.time()) + timedelta(hours=end_hour)
+    slots = []
+    while current + SLOT <= close:
+        if not any(start < current + SLOT and end > current for start, end in busy):
+            slots.append((current, current + SLOT))
+        current += SLOT
+    return slots
+
+def test_free_slots_skip_busy_intervals():
+    # Arrange
+    service = AvailabilityService()
+    day = datetime(2030, 1, 7)
+    busy = [
+        (day.replace(hour=9, minute=10), day.replace(hour=9, minute=40)),
+        (day.replace(hour=9, minute=30), day.replace(hour=10)),
+        (day.replace(hour=17), day.replace(hour=19)),
+    ]
+
+    # Act
+    slots = service.free_slots(busy, day, day + timedelta(days=1), SLOT)
+
+    # Assert
+    starts = [slot.start.strftime("%H:%M") for slot in slots]
+    assert starts[:3] == ["08:00", "08:30", "10:00"]
+    assert starts[-1] == "16:30"
+    assert [(s.start, s.end) for s in slots] == brute_force_slots(busy, day.date())
+
+def test_free_slots_over_several_days_respect_range_bounds():
+    # Arrange
+    service = AvailabilityService(start_hour=9, end_hour=12)
+    busy = [(datetime(2030, 1, 7, 11), datetime(2030, 1, 8, 10))]
+
+    # Act
+    slots = service.free_slots(busy, datetime(2030, 1, 7, 10), datetime(2030, 1, 9, 10), timedelta(hours=1))
+
+    # Assert
+    assert [slot.start for slot in slots] == [
+        datetime(2030, 1, 7, 10),
+        datetime(2030, 1, 8, 10),
+        datetime(2030, 1, 8, 11),
+        datetime(2030, 1, 9, 9),
+    ]
+
+def test_get_available_slots_keeps_legacy_format():
+    # Arrange
+    doctor_id = uuid4()
+    appointments = [
+        make_appointment(doctor_id, datetime(2030, 1, 7, 8)),
+        make_appointment(doctor_id, datetime(2030, 1, 7, 8, 30), status="cancelled"),
+    ]
+
+    # Act
+    slots = AppointmentService().get_available_slots(appointments, date(2030, 1, 7))
+
+    # Assert
+    assert slots[0] == {"start": datetime(2030, 1, 7, 8, 30), "end": datetime(2030, 1, 7, 9), "available": True}
+    assert len(slots) == 19
+
+@pytest.mark.asyncio
+class TestGetDoctorAvailabilityUseCase:
+
+    @pytest.fixture
+    def appointment_repository(self):
+        return AsyncMock(spec=AppointmentRepositoryPort)
+
+    @pytest.fixture
+    def use_case(self, appointment_repository):
+        return GetDoctorAvailabilityUseCase(appointment_repository, AvailabilityService())
+
+    async def test_single_range_query_for_all_doctors(self, use_case, appointment_repository):
+        # Arrange
+        first, second = uuid4(), uuid4()
+        start, end = datetime(2030, 1, 7), datetime(2030, 1, 8)
+        appointment_repository.find_active_in_range.return_value = [
+            make_appointment(first, datetime(2030, 1, 7, 8), minutes=600)
+        ]
+
+        # Act
+        result = await use_case.execute([first, second, first], start, end)
+
+        # Assert
+        appointment_repository.find_active_in_range.assert_awaited_once_with([first, second], start, end)
+        assert [availability.doctor_id for availability in result] == [first, second]
+        assert result[0].slots == []
+        assert len(result[1].slots) == 20
+
+    async def test_invalid_period_is_rejected(self, use_case, appointment_repository):
+        start = datetime(2030, 1, 7)
+
+        with pytest.raises(ValueError):
+            await use_case.execute([uuid4()], start, start)
+        with pytest.raises(ValueError):
+            await use_case.execute([uuid4()], start, start + timedelta(days=60))
+
+        appointment_repository.find_active_in_range.assert_not_called()
@@ -0,0 +1,134 @@
+# tests/unit/appointment_management/test_booking_concurrency.py
+
+import asyncio
+import pytest
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from appointment_management.application.dtos.appointment_dto import CreateAppointmentDTO
+from appointment_management.application.usecases.create_appointment_usecase import CreateAppointmentUseCase
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from appointment_management.domain.ports.secondary.appointment_repository_port import BOOKING_LOCK
+from appointment_management.domain.ports.secondary.notification_port import NotificationPort
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgreSQLAppointmentRepository
+from shared.infrastructure.database.advisory_lock import ADVISORY_XACT_LOCK, advisory_lock_key
+
+CONCURRENT_BOOKINGS = 50
+
+class RecordingSession:
+    """Session factice enregistrant l'ordre des opérations"""
+    def __init__(self):
+        self.operations = []
+
+    async def execute(self, statement, params=None):
+        self.operations.append(("execute", statement, params))
+
+    def add(self, model):
+        self.operations.append(("add", model))
+
+    async def flush(self):
+        self.operations.append(("flush",))
+
+def make_command(doctor_id, start_time):
+    """Crée une demande de rendez-vous de 30 minutes"""
+    return CreateAppointmentDTO(
+        patient_id=uuid4(),
+        doctor_id=doctor_id,
+        start_time=start_time,
+        end_time=start_time + timedelta(minutes=30)
+    )
+
+async def book_all(use_case, commands):
+    """Lance toutes les réservations en même temps et retourne (réussites, conflits)"""
+    results = await asyncio.gather(*(use_case.execute(command) for command in commands), return_exceptions=True)
+    unexpected = [r for r in results if isinstance(r, Exception) and not isinstance(r, AppointmentConflictException)]
+    assert not unexpected
+    booked = [r for r in results if not isinstance(r, Exception)]
+    return booked, len(results) - len(booked)
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_of_one_slot_book_it_once():
+    """Stress : des réservations simultanées du même créneau n'en réservent qu'une"""
+    repository = InMemoryAppointmentRepository()
+    use_case = CreateAppointmentUseCase(repository, AsyncMock(spec=NotificationPort))
+    doctor_id = uuid4()
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    # Créneaux identiques ou qui se chevauchent de 15 minutes
+    commands = [
+        make_command(doctor_id, start_time + timedelta(minutes=15 * (i % 2)))
+        for i in range(CONCURRENT_BOOKINGS)
+    ]
+
+    booked, conflicts = await book_all(use_case, commands)
+
+    assert len(booked) == 1
+    assert conflicts == CONCURRENT_BOOKINGS - 1
+    assert len(repository.appointments) == 1
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_of_distinct_slots_all_succeed():
+    """Stress : les créneaux distincts de plusieurs médecins sont tous réservés"""
+    repository = InMemoryAppointmentRepository()
+    use_case = CreateAppointmentUseCase(repository, AsyncMock(spec=NotificationPort))
+    doctors = [uuid4() for _ in range(5)]
+    start_time = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    commands = [
+        make_command(doctor_id, start_time + timedelta(minutes=30 * slot))
+        for doctor_id in doctors
+        for slot in range(CONCURRENT_BOOKINGS // len(doctors))
+    ]
+
+    booked, conflicts = await book_all(use_case, commands)
+
+    assert len(booked) == CONCURRENT_BOOKINGS
+    assert conflicts == 0
+
+@pytest.mark.asyncio
+async def test_cancelled_appointment_frees_the_slot():
+    """Test qu'un rendez-vous annulé n'est pas un conflit"""
+    repository = InMemoryAppointmentRepository()
+    doctor_id = uuid4()
+    start_time = datetime.now() + timedelta(days=1)
+    await repository.create(Appointment(
+        id=uuid4(),
+        patient_id=uuid4(),
+        doctor_id=doctor_id,
+        start_time=start_time,
+        end_time=start_time + timedelta(minutes=30),
+        status="cancelled"
+    ))
+
+    conflicts = await repository.find_conflicts(doctor_id, start_time, start_time + timedelta(minutes=30))
+
+    assert conflicts == []
+
+@pytest.mark.asyncio
+async def test_postgres_booking_locks_the_doctor_before_inserting():
+    """Test que le verrou consultatif du médecin est pris dans la transaction, avant l'insertion"""
+    session = RecordingSession()
+
+    @asynccontextmanager
+    async def session_factory():
+        yield session
+
+    repository = PostgreSQLAppointmentRepository(session_factory)
+    start_time = datetime.now() + timedelta(days=1)
+    appointment = Appointment(
+        id=uuid4(),
+        patient_id=uuid4(),
+        doctor_id=uuid4(),
+        start_time=start_time,
+        end_time=start_time + timedelta(minutes=30)
+    )
+
+    await repository.book(appointment)
+
+    assert [operation[0] for operation in session.operations] == ["execute", "add", "flush"]
+    assert session.operations[0][1:] == (
+        ADVISORY_XACT_LOCK,
+        {"lock_key": advisory_lock_key(BOOKING_LOCK, appointment.doctor_id)}
+    )
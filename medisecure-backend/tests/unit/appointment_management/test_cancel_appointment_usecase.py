@@ -46,7 +46,7 @@ class TestCancelAppointmentUseCase:
         # Assert
         assert appointment.status == "cancelled"
         appointment_repository.save.assert_called_once_with(appointment)
-        notification_port.send_appointment_cancelled.assert_called_once_with(
+        notification_port.send_appointment_cancelled.assert_awaited_once_with(
             patient_id=patient_id,
             doctor_id=doctor_id,
             appointment_id=appointment_id,
@@ -0,0 +1,67 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta
+from sqlalchemy.exc import IntegrityError
+
+from appointment_management.application.dtos.appointment_dto import CreateAppointmentDTO
+from appointment_management.application.usecases.create_appointment_usecase import CreateAppointmentUseCase
+from appointment_management.domain.exceptions.appointment_exceptions import AppointmentConflictException
+from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
+from appointment_management.domain.ports.secondary.notification_port import NotificationPort
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import is_overlap_violation
+
+class FakeDriverError(Exception):
+    """Erreur de driver factice portant un SQLSTATE"""
+    def __init__(self, sqlstate, message=""):
+        super().__init__(message)
+        self.sqlstate = sqlstate
+
+@pytest.mark.asyncio
+class TestCreateAppointmentUseCase:
+    
+    @pytest.fixture
+    def appointment_repository(self):
+        return AsyncMock(spec=AppointmentRepositoryPort)
+
+    @pytest.fixture
+    def use_case(self, appointment_repository):
+        return CreateAppointmentUseCase(appointment_repository, AsyncMock(spec=NotificationPort))
+
+    @pytest.fixture
+    def command(self):
+        start_time = datetime.now() + timedelta(days=1)
+        return CreateAppointmentDTO(
+            patient_id=uuid4(),
+            doctor_id=uuid4(),
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=30)
+        )
+
+    async def test_create_books_in_a_single_call(self, use_case, appointment_repository, command):
+        # Act
+        result = await use_case.execute(command)
+        
+        # Assert
+        appointment_repository.book.assert_awaited_once()
+        appointment_repository.find_conflicts.assert_not_called()
+        booked = appointment_repository.book.await_args.args[0]
+        assert result.id == str(booked.id)
+        assert booked.doctor_id == command.doctor_id
+
+    async def test_create_propagates_conflict(self, use_case, appointment_repository, command):
+        # Arrange
+        appointment_repository.book.side_effect = AppointmentConflictException(
+            command.doctor_id, command.start_time, command.end_time
+        )
+        
+        # Act & Assert
+        with pytest.raises(ValueError, match="n'est pas disponible"):
+            await use_case.execute(command)
+
+def test_is_overlap_violation_detects_exclusion_constraint():
+    overlap = IntegrityError("INSERT", {}, FakeDriverError("23P01"))
+    foreign_key = IntegrityError("INSERT", {}, FakeDriverError("23503", "violates foreign key constraint"))
+    
+    assert is_overlap_violation(overlap)
+    assert not is_overlap_violation(foreign_key)
@@ -0,0 +1,121 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+from datetime import datetime, timedelta
+
+from appointment_management.application.usecases.get_appointments_usecase import GetAppointmentsUseCase
+from appointment_management.domain.entities.appointment import Appointment, ParticipantName
+from appointment_management.domain.ports.secondary.appointment_repository_port import AppointmentRepositoryPort
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgreSQLAppointmentRepository
+from shared.infrastructure.database.models.patient_model import PatientModel  # noqa: F401
+from sqlalchemy.dialects import postgresql
+from shared.application.pagination.keyset import InvalidCursorException, encode_cursor
+
+def make_appointments(doctor_id, count):
+    start = datetime(2030, 1, 7, 9, 0)
+    return [
+        Appointment(
+            id=uuid4(),
+            patient_id=uuid4(),
+            doctor_id=doctor_id,
+            start_time=start + timedelta(hours=i),
+            end_time=start + timedelta(hours=i, minutes=30)
+        )
+        for i in range(count)
+    ]
+
+@pytest.mark.asyncio
+class TestGetAppointmentsUseCase:
+    
+    @pytest.fixture
+    def appointment_repository(self):
+        return AsyncMock(spec=AppointmentRepositoryPort)
+
+    @pytest.fixture
+    def use_case(self, appointment_repository):
+        return GetAppointmentsUseCase(appointment_repository)
+
+    async def test_filters_are_pushed_down_to_repository(self, use_case, appointment_repository):
+        # Arrange
+        doctor_id = uuid4()
+        start, end = datetime(2030, 1, 7), datetime(2030, 1, 14)
+        appointment_repository.find_with_filters.return_value = make_appointments(doctor_id, 2)
+        
+        # Act
+        page = await use_case.execute(doctor_id=doctor_id, start_date=start, end_date=end, statuses=["scheduled"])
+        
+        # Assert
+        appointment_repository.find_with_filters.assert_awaited_once_with(
+            patient_id=None,
+            doctor_id=doctor_id,
+            start_time=start,
+            end_time=end,
+            statuses=["scheduled"],
+            limit=None,
+            after=None,
+            include=()
+        )
+        appointment_repository.find_all_by_doctor_id.assert_not_called()
+        assert len(page.items) == 2
+        assert page.next_cursor is None
+
+    async def test_limit_returns_cursor_of_next_page(self, use_case, appointment_repository):
+        # Arrange
+        doctor_id = uuid4()
+        appointments = make_appointments(doctor_id, 3)
+        appointment_repository.find_with_filters.return_value = appointments
+        
+        # Act
+        page = await use_case.execute(doctor_id=doctor_id, limit=2)
+        appointment_repository.find_with_filters.return_value = appointments[2:]
+        next_page = await use_case.execute(doctor_id=doctor_id, limit=2, cursor=page.next_cursor)
+        
+        # Assert
+        assert [item.id for item in page.items] == [str(a.id) for a in appointments[:2]]
+        assert appointment_repository.find_with_filters.await_args.kwargs["limit"] == 3
+        assert appointment_repository.find_with_filters.await_args.kwargs["after"] == (
+            appointments[1].start_time,
+            appointments[1].id
+        )
+        assert next_page.next_cursor is None
+
+    async def test_invalid_cursor_is_rejected(self, use_case):
+        with pytest.raises(InvalidCursorException):
+            await use_case.execute(limit=10, cursor="invalid")
+
+    async def test_cursor_with_tampered_key_is_rejected(self, use_case):
+        with pytest.raises(InvalidCursorException):
+            await use_case.execute(limit=10, cursor=encode_cursor("start_time", [1]))
+
+    async def test_include_returns_participant_names(self, use_case, appointment_repository):
+        # Arrange
+        doctor_id = uuid4()
+        appointment = make_appointments(doctor_id, 1)[0]
+        appointment.patient = ParticipantName(appointment.patient_id, "Hélène", "Dupont")
+        appointment.doctor = ParticipantName(doctor_id, "Marie", "Curie")
+        appointment_repository.find_with_filters.return_value = [appointment]
+        
+        # Act
+        page = await use_case.execute(doctor_id=doctor_id, include=["patient", "doctor"])
+        
+        # Assert
+        assert appointment_repository.find_with_filters.await_args.kwargs["include"] == ("patient", "doctor")
+        assert page.items[0].patient.last_name == "Dupont"
+        assert page.items[0].doctor.id == str(doctor_id)
+
+    async def test_unknown_include_is_rejected(self, use_case):
+        with pytest.raises(ValueError):
+            await use_case.execute(include=["notes"])
+
+def test_include_joins_only_name_columns():
+    """Les noms sont lus par jointure dans la même requête, sans les données médicales du patient"""
+    repository = PostgreSQLAppointmentRepository(session_factory=None)
+    query = repository._filters_query(None, uuid4(), None, None, None, 50, None, ("patient", "doctor"))
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    select_list = sql.split("FROM")[0]
+
+    assert "JOIN patients ON patients.id = appointments.patient_id" in sql
+    assert "JOIN users ON users.id = appointments.doctor_id" in sql
+    assert "patients.last_name AS patient_last_name" in select_list
+    assert "allergies" not in select_list and "hashed_password" not in select_list
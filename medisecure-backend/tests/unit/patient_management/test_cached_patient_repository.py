@@ -0,0 +1,152 @@
+# tests/unit/patient_management/test_cached_patient_repository.py
+
+import asyncio
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.cached_patient_repository import CachedPatientRepository
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.infrastructure.cache.memory_cache import InMemoryCache
+
+@pytest.fixture
+def inner():
+    """Fixture pour créer le repository décoré, avec un espion sur get_by_id"""
+    repository = InMemoryPatientRepository()
+    repository.get_by_id = AsyncMock(wraps=repository.get_by_id)
+    return repository
+
+@pytest.fixture
+def repository(inner):
+    """Fixture pour créer le repository avec cache"""
+    return CachedPatientRepository(inner, InMemoryCache("patients-test", ttl_seconds=60, max_size=100))
+
+@pytest.fixture
+def patient():
+    """Fixture pour créer un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="Hélène",
+        last_name="Dupont",
+        date_of_birth=date(1980, 1, 1),
+        gender="female",
+        allergies={"u": "pollen"}
+    )
+
+@pytest.mark.asyncio
+async def test_get_by_id_reads_through_cache(repository, inner, patient):
+    """Test qu'un patient lu une fois est ensuite servi par le cache"""
+    await repository.create(patient)
+
+    first = await repository.get_by_id(patient.id)
+    second = await repository.get_by_id(patient.id)
+
+    assert inner.get_by_id.await_count == 1
+    assert second == first == patient
+    # Chaque lecture retourne une nouvelle instance
+    second.first_name = "Modifié"
+    assert (await repository.get_by_id(patient.id)).first_name == "Hélène"
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cache(repository, inner, patient):
+    """Test que update et delete invalident l'entrée du patient"""
+    await repository.create(patient)
+    await repository.get_by_id(patient.id)
+
+    patient.last_name = "Durand"
+    await repository.update(patient)
+    assert (await repository.get_by_id(patient.id)).last_name == "Durand"
+
+    await repository.delete(patient.id)
+    assert await repository.get_by_id(patient.id) is None
+
+@pytest.mark.asyncio
+async def test_cache_errors_fall_back_to_repository(inner, patient):
+    """Test qu'un cache indisponible n'empêche pas la lecture"""
+    failing_cache = AsyncMock()
+    failing_cache.get.side_effect = ConnectionError("cache down")
+    failing_cache.set.side_effect = ConnectionError("cache down")
+    repository = CachedPatientRepository(inner, failing_cache)
+    await inner.create(patient)
+
+    assert await repository.get_by_id(patient.id) == patient
+
+@pytest.mark.asyncio
+async def test_get_many_reads_only_missing_patients(repository, inner, patient):
+    """Test que get_many ne lit dans le repository que les patients absents du cache"""
+    other = Patient(id=uuid4(), first_name="Paul", last_name="Martin", date_of_birth=date(1990, 5, 2), gender="male")
+    await repository.create(patient)
+    await repository.create(other)
+    await repository.get_by_id(patient.id)
+    inner.get_many = AsyncMock(wraps=inner.get_many)
+
+    patients = await repository.get_many([patient.id, other.id, uuid4()])
+
+    assert set(patients) == {patient.id, other.id}
+    assert patients[patient.id].allergies == {"u": "pollen"}
+    assert patient.id not in inner.get_many.await_args.args[0]
+
+@pytest.mark.asyncio
+async def test_get_many_uses_one_cache_round_trip_per_direction(inner, patient):
+    """Test que get_many lit et alimente le cache en un appel groupé chacun, quel que soit le nombre de patients"""
+    cache = InMemoryCache("patients-test", ttl_seconds=60, max_size=100)
+    cache.get = AsyncMock(wraps=cache.get)
+    cache.get_many = AsyncMock(wraps=cache.get_many)
+    cache.set_many = AsyncMock(wraps=cache.set_many)
+    repository = CachedPatientRepository(inner, cache)
+    others = [
+        Patient(id=uuid4(), first_name="Paul", last_name=f"Martin{i}", date_of_birth=date(1990, 5, 2), gender="male")
+        for i in range(5)
+    ]
+    for other in [patient, *others]:
+        await inner.create(other)
+
+    await repository.get_many([patient.id] + [other.id for other in others])
+    patients = await repository.get_many([patient.id] + [other.id for other in others])
+
+    assert len(patients) == 6
+    assert cache.get_many.await_count == 2
+    assert cache.set_many.await_count == 1
+    assert len(cache.set_many.await_args.args[0]) == 6
+    cache.get.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_get_many_falls_back_to_repository_on_cache_errors(inner, patient):
+    """Test qu'un cache indisponible n'empêche pas la lecture groupée"""
+    failing_cache = AsyncMock()
+    failing_cache.get_many.side_effect = ConnectionError("cache down")
+    failing_cache.set_many.side_effect = ConnectionError("cache down")
+    repository = CachedPatientRepository(inner, failing_cache)
+    await inner.create(patient)
+
+    patients = await repository.get_many([patient.id])
+
+    assert set(patients) == {patient.id}
+
+@pytest.mark.asyncio
+async def test_read_started_before_update_does_not_refill_cache(repository, inner, patient):
+    """Test qu'une lecture de l'ancienne version terminée après l'invalidation ne remplit pas le cache"""
+    await repository.create(patient)
+    stale = Patient(**{**patient.__dict__})
+    read_started = asyncio.Event()
+    update_done = asyncio.Event()
+
+    async def slow_read(patient_id):
+        read_started.set()
+        await update_done.wait()
+        return stale
+
+    inner.get_by_id = slow_read
+    reader = asyncio.create_task(repository.get_by_id(patient.id))
+    await read_started.wait()
+    patient.last_name = "Durand"
+    await inner.update(patient)
+    await repository._invalidate(patient.id)
+    update_done.set()
+    await reader
+
+    inner.get_by_id = AsyncMock(return_value=patient)
+    assert (await repository.get_by_id(patient.id)).last_name == "Durand"
+    inner.get_by_id.assert_awaited_once()
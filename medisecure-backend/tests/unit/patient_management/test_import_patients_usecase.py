@@ -0,0 +1,112 @@
+# tests/unit/patient_management/test_import_patients_usecase.py
+
+import json
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.application.usecases.import_patients_usecase import ImportPatientsUseCase
+from patient_management.infrastructure.adapters.primary.patient_import_parser import (
+    CSV,
+    NDJSON,
+    parse_patient_rows,
+    resolve_import_format
+)
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.adapters.primary.uuid_generator import UuidGenerator
+
+async def stream(*chunks: bytes):
+    """Simule le corps d'une requête lu morceau par morceau"""
+    for chunk in chunks:
+        yield chunk
+
+@pytest.fixture
+def repository():
+    """Fixture pour créer le repository, avec des espions sur les écritures et vérifications"""
+    repository = InMemoryPatientRepository()
+    repository.bulk_create = AsyncMock(wraps=repository.bulk_create)
+    repository.find_existing_emails = AsyncMock(wraps=repository.find_existing_emails)
+    return repository
+
+@pytest.fixture
+def use_case(repository):
+    """Fixture pour créer le cas d'utilisation avec des lots de 2 patients"""
+    return ImportPatientsUseCase(repository, PatientService(), UuidGenerator(), batch_size=2)
+
+def test_resolve_import_format():
+    """Test la détection du format à partir du Content-Type"""
+    assert resolve_import_format("application/x-ndjson") == NDJSON
+    assert resolve_import_format("text/csv; charset=utf-8") == CSV
+    assert resolve_import_format("application/json") is None
+    assert resolve_import_format(None) is None
+
+@pytest.mark.asyncio
+async def test_ndjson_import_writes_batches_and_reports_row_errors(use_case, repository):
+    """Test l'import NDJSON : une vérification et une écriture par lot, erreurs par ligne"""
+    await repository.create(Patient(
+        id=uuid4(),
+        first_name="Existing",
+        last_name="Patient",
+        date_of_birth=date(1970, 1, 1),
+        gender="female",
+        email="taken@example.com"
+    ))
+    lines = [
+        {"first_name": "Jean", "last_name": "Martin", "date_of_birth": "1980-05-01", "gender": "male", "email": "jean@example.com"},
+        {"first_name": "Anne", "last_name": "Durand", "date_of_birth": "1990-02-03", "gender": "female", "email": "taken@example.com"},
+        {"first_name": "", "last_name": "Vide", "date_of_birth": "1985-01-01", "gender": "male"},
+        {"first_name": "Paul", "last_name": "Petit", "date_of_birth": "1975-07-08", "gender": "male", "email": "jean@example.com"},
+        {"first_name": "Léa", "last_name": "Mineure", "date_of_birth": str(date.today().replace(year=date.today().year - 10)), "gender": "female"},
+        {"first_name": "Marc", "last_name": "Blanc", "date_of_birth": "1960-12-24", "gender": "male", "allergies": {"pollen": "severe"}},
+    ]
+    body = "\n".join(json.dumps(line) for line in lines).encode("utf-8") + b"\n{not json}\n"
+
+    # Morceaux arbitraires : les lignes et caractères UTF-8 sont coupés
+    chunks = [body[i:i + 7] for i in range(0, len(body), 7)]
+    report = await use_case.execute(parse_patient_rows(stream(*chunks), NDJSON))
+
+    assert report.total_rows == 7
+    assert report.imported == 2
+    assert report.failed == 5
+    assert [error.row for error in report.errors] == [2, 3, 4, 5, 7]
+    assert "already exists" in report.errors[0].errors[0]
+    assert "Duplicate email" in report.errors[2].errors[0]
+    assert "Guardian consent" in report.errors[3].errors[0]
+    assert "Invalid JSON" in report.errors[4].errors[0]
+
+    assert repository.find_existing_emails.await_count == 2
+    assert repository.bulk_create.await_count == 2
+    assert await repository.count() == 3
+    assert (await repository.get_by_email("jean@example.com")).last_name == "Martin"
+
+@pytest.mark.asyncio
+async def test_csv_import_handles_quotes_empty_cells_and_json_columns(use_case, repository):
+    """Test l'import CSV : champs multilignes, cellules vides et colonnes JSON"""
+    body = (
+        "﻿first_name,last_name,date_of_birth,gender,email,notes,allergies\r\n"
+        'Jean,Martin,1980-05-01,male,,"Première ligne\r\n""citée""",\r\n'
+        'Anne,Durand,1990-02-03,female,anne@example.com,,"{""pollen"": ""mild""}"\r\n'
+        "Paul,Petit,1975-07-08\r\n"
+    ).encode("utf-8")
+
+    report = await use_case.execute(parse_patient_rows(stream(body), CSV))
+
+    assert report.total_rows == 3
+    assert report.imported == 2
+    assert report.errors[0].row == 3
+    assert "Expected 7 columns" in report.errors[0].errors[0]
+
+    patients = await repository.list_all()
+    by_name = {patient.first_name: patient for patient in patients}
+    assert by_name["Jean"].email is None
+    assert by_name["Jean"].notes == 'Première ligne\n"citée"'
+    assert by_name["Anne"].allergies == {"pollen": "mild"}
+
+@pytest.mark.asyncio
+async def test_invalid_encoding_aborts_import(use_case):
+    """Test qu'un fichier qui n'est pas en UTF-8 est rejeté"""
+    with pytest.raises(ValueError):
+        await use_case.execute(parse_patient_rows(stream(b"first_name\n\xff\xfe\n"), CSV))
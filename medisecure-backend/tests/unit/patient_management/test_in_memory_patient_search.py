@@ -0,0 +1,61 @@
+# tests/unit/patient_management/test_in_memory_patient_search.py
+
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+def make_patient(first_name: str, last_name: str, phone_number: str = None) -> Patient:
+    """Crée un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name=first_name,
+        last_name=last_name,
+        date_of_birth=date(1980, 1, 1),
+        gender="female",
+        phone_number=phone_number
+    )
+
+@pytest.mark.asyncio
+async def test_search_by_name_is_accent_insensitive_and_ranked():
+    """Test la recherche par nom sans accents, classée par pertinence"""
+    repository = InMemoryPatientRepository()
+    await repository.create(make_patient("Paul", "Martinez"))
+    await repository.create(make_patient("Hélène", "Martin"))
+    await repository.create(make_patient("Léa", "Bernard"))
+
+    results = await repository.search(name="martin")
+
+    assert [p.last_name for p in results] == ["Martin", "Martinez"]
+    assert [p.first_name for p in await repository.search(name="helene")] == ["Hélène"]
+
+@pytest.mark.asyncio
+async def test_search_indexes_follow_updates_and_deletes():
+    """Test que les index de recherche suivent les mises à jour et suppressions"""
+    repository = InMemoryPatientRepository()
+    patient = await repository.create(make_patient("Jean", "Dupont", "0601020304"))
+
+    patient.last_name = "Durand"
+    await repository.update(patient)
+    assert await repository.search(name="dupont") == []
+    assert len(await repository.search(name="durand", phone="0102")) == 1
+
+    await repository.delete(patient.id)
+    assert await repository.search(phone="0102") == []
+
+@pytest.mark.asyncio
+async def test_search_with_total_counts_all_pages():
+    """Test que le total de la recherche ne dépend pas de la pagination"""
+    repository = InMemoryPatientRepository()
+    for last_name in ["Martin", "Martineau", "Martinez", "Bernard"]:
+        await repository.create(make_patient("Test", last_name))
+
+    patients, total = await repository.search_with_total(name="martin", skip=0, limit=2)
+    empty_page, total_beyond = await repository.search_with_total(name="martin", skip=10, limit=2)
+
+    assert len(patients) == 2
+    assert total == 3
+    assert empty_page == []
+    assert total_beyond == 3
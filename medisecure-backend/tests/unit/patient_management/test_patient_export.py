@@ -0,0 +1,64 @@
+# tests/unit/patient_management/test_patient_export.py
+
+import json
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.primary import patient_export_writer
+from patient_management.infrastructure.adapters.primary.patient_export_writer import write_patients
+from patient_management.infrastructure.adapters.primary.patient_import_parser import CSV, NDJSON, parse_patient_rows
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+async def make_repository() -> InMemoryPatientRepository:
+    """Crée un repository contenant trois patients"""
+    repository = InMemoryPatientRepository()
+    for last_name in ("Martin", "Durand", "Petit"):
+        await repository.create(Patient(
+            id=uuid4(),
+            first_name="Hélène",
+            last_name=last_name,
+            date_of_birth=date(1980, 1, 1),
+            gender="female",
+            email=f"{last_name.lower()}@example.com",
+            allergies={"pollen": "mild"},
+            notes='Ligne 1\n"citée", ligne 2'
+        ))
+    return repository
+
+async def collect(chunks):
+    """Lit tous les morceaux d'un export"""
+    return [chunk async for chunk in chunks]
+
+@pytest.mark.asyncio
+async def test_ndjson_export_streams_sorted_rows_in_chunks(monkeypatch):
+    """Test l'export NDJSON : une ligne par patient, par morceaux, dans l'ordre demandé"""
+    repository = await make_repository()
+    monkeypatch.setattr(patient_export_writer, "ROWS_PER_CHUNK", 2)
+
+    chunks = await collect(write_patients(repository.stream_all(order_by="name"), NDJSON))
+
+    assert len(chunks) == 2
+    rows = [json.loads(line) for line in b"".join(chunks).decode("utf-8").splitlines()]
+    assert [row["last_name"] for row in rows] == ["Durand", "Martin", "Petit"]
+    assert rows[0]["date_of_birth"] == "1980-01-01"
+    assert rows[0]["allergies"] == {"pollen": "mild"}
+
+@pytest.mark.asyncio
+async def test_csv_export_can_be_reimported():
+    """Test que le CSV exporté est relu à l'identique par l'import"""
+    repository = await make_repository()
+    body = b"".join(await collect(write_patients(repository.stream_all(), CSV)))
+
+    async def stream():
+        yield body
+
+    rows = [row async for row in parse_patient_rows(stream(), CSV)]
+
+    assert [row.error for row in rows] == [None, None, None]
+    assert rows[0].data["last_name"] == "Durand"
+    assert rows[0].data["notes"] == 'Ligne 1\n"citée", ligne 2'
+    assert rows[0].data["allergies"] == {"pollen": "mild"}
+    assert rows[0].data["has_consent"] == "false"
+    assert "consent_date" not in rows[0].data
@@ -0,0 +1,103 @@
+# tests/unit/patient_management/test_patient_keyset_pagination.py
+
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from dependency_injector import providers
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.ports.secondary.patient_repository_protocol import PATIENT_SORT_KEY_TYPES, patient_sort_key
+from patient_management.infrastructure.adapters.primary.controllers.patient_controller import list_patients
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from shared.container.container import Container
+from shared.application.pagination.keyset import (
+    InvalidCursorException,
+    build_keyset_page,
+    decode_cursor,
+    encode_cursor
+)
+
+def make_patient(last_name: str) -> Patient:
+    """Crée un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="Test",
+        last_name=last_name,
+        date_of_birth=date(1980, 1, 1),
+        gender="female"
+    )
+
+@pytest.fixture
+def repository():
+    """Fixture pour créer un repository en mémoire avec des patients"""
+    repo = InMemoryPatientRepository()
+    for last_name in ["Martin", "Bernard", "Dubois", "Martin", "Petit", "Durand", "Leroy"]:
+        patient = make_patient(last_name)
+        repo.patients[patient.id] = patient
+    return repo
+
+def test_cursor_roundtrip():
+    """Test l'encodage puis le décodage d'un curseur"""
+    patient = make_patient("Martin")
+    key = patient_sort_key(patient, "name")
+
+    cursor = decode_cursor(encode_cursor("name", key), "name", PATIENT_SORT_KEY_TYPES["name"])
+
+    assert cursor.values == key
+
+def test_cursor_rejected_for_other_order():
+    """Test qu'un curseur émis pour un autre tri est refusé"""
+    cursor = encode_cursor("name", ("Martin", uuid4()))
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, "created_at", PATIENT_SORT_KEY_TYPES["created_at"])
+    with pytest.raises(InvalidCursorException):
+        decode_cursor("not-a-cursor", "name", PATIENT_SORT_KEY_TYPES["name"])
+
+@pytest.mark.parametrize("order_by,key", [
+    ("name", [1]),
+    ("name", ["Martin"]),
+    ("name", ["Martin", "not-a-uuid-tag"]),
+    ("name", [1, {"u": str(uuid4())}]),
+    ("created_at", ["Martin", {"u": str(uuid4())}]),
+    ("name", ["Martin", {"u": str(uuid4())}, 3])
+])
+def test_cursor_rejected_when_key_does_not_match_order(order_by, key):
+    """Test qu'un curseur dont la clé ne correspond pas aux colonnes de tri est refusé"""
+    cursor = encode_cursor(order_by, key)
+
+    with pytest.raises(InvalidCursorException):
+        decode_cursor(cursor, order_by, PATIENT_SORT_KEY_TYPES[order_by])
+
+@pytest.mark.asyncio
+async def test_keyset_pages_cover_all_patients_once(repository):
+    """Test que le parcours par curseur renvoie chaque patient une seule fois, dans l'ordre"""
+    seen = []
+    after = None
+    while True:
+        rows = await repository.list_all(limit=3, after=after, order_by="name")
+        page = build_keyset_page(rows, 2, "name", patient_sort_key)
+        seen.extend(page.items)
+        if page.next_cursor is None:
+            break
+        after = decode_cursor(page.next_cursor, "name", PATIENT_SORT_KEY_TYPES["name"]).values
+
+    keys = [patient_sort_key(p, "name") for p in seen]
+    assert keys == sorted(keys)
+    assert len({p.id for p in seen}) == await repository.count()
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("pagination,total", [("offset", 7), ("cursor", None)])
+async def test_list_counts_exactly_by_default_in_offset_mode(repository, pagination, total):
+    """Test que le total est exact par défaut en mode décalage et absent en mode curseur"""
+    container = Container()
+    container.patient_repository.override(providers.Object(repository))
+
+    response = await list_patients(
+        skip=0, limit=3, pagination=pagination, cursor=None, order_by="name", fields="summary",
+        count=None, token_payload={"sub": "test", "role": "doctor"}, container=container
+    )
+
+    assert response.total == total
+    assert response.total_estimated is False
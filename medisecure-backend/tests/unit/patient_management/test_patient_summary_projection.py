@@ -0,0 +1,82 @@
+# tests/unit/patient_management/test_patient_summary_projection.py
+
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.entities.patient_summary import PatientSummary
+from patient_management.domain.ports.secondary.patient_repository_protocol import patient_sort_key
+from patient_management.application.dtos.patient_dtos import PatientListResponseDTO, to_patient_summary
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.application.pagination.keyset import build_keyset_page
+
+@pytest.fixture
+def repository():
+    """Fixture pour créer un repository en mémoire"""
+    return InMemoryPatientRepository()
+
+async def add_patients(repository: InMemoryPatientRepository) -> None:
+    """Ajoute trois patients avec des données médicales"""
+    for last_name in ("Martin", "Durand", "Petit"):
+        await repository.create(Patient(
+            id=uuid4(),
+            first_name="Hélène",
+            last_name=last_name,
+            date_of_birth=date(1980, 1, 1),
+            gender="female",
+            allergies={"pollen": "severe"},
+            notes="Notes confidentielles"
+        ))
+
+@pytest.mark.asyncio
+async def test_summary_list_omits_medical_data(repository):
+    """Test que la projection résumée ne retourne ni données médicales ni notes"""
+    await add_patients(repository)
+
+    patients = await repository.list_all(fields="summary")
+    response = PatientListResponseDTO(
+        patients=to_patient_summary.many(patients),
+        total=None,
+        skip=0,
+        limit=100
+    )
+    payload = response.model_dump() if hasattr(response, "model_dump") else response.dict()
+
+    assert all(isinstance(patient, PatientSummary) for patient in patients)
+    assert {"allergies", "notes"}.isdisjoint(payload["patients"][0])
+    assert payload["patients"][0]["first_name"] == "Hélène"
+
+@pytest.mark.asyncio
+async def test_summary_supports_keyset_pagination(repository):
+    """Test que la pagination par curseur fonctionne sur la vue résumée"""
+    await add_patients(repository)
+
+    first = await repository.search(limit=3, order_by="name", fields="summary")
+    page = build_keyset_page(first, 2, "name", patient_sort_key)
+    second = await repository.search(
+        limit=3,
+        after=patient_sort_key(page.items[-1], "name"),
+        order_by="name",
+        fields="summary"
+    )
+
+    assert [p.last_name for p in page.items + second] == ["Durand", "Martin", "Petit"]
+
+def test_postgres_summary_selects_only_summary_columns():
+    """Test que la requête résumée ne lit pas les colonnes JSONB ni les notes"""
+    repository = PostgresPatientRepository(session_factory=None)
+    query = repository._search_query(
+        select(*repository._projection("summary")), "dupont", None, None, None, ranked=True
+    )
+
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    select_list = sql.split("FROM")[0]
+
+    assert "allergies" not in select_list
+    assert "notes" not in select_list
+    assert "patients.last_name" in select_list
@@ -0,0 +1,48 @@
+# tests/unit/shared/test_advisory_lock.py
+
+import pytest
+from uuid import uuid4
+
+from shared.infrastructure.database.advisory_lock import ADVISORY_XACT_LOCK, advisory_lock_key, advisory_xact_lock
+from shared.infrastructure.monitoring.prometheus_metrics import LOCK_WAIT_SECONDS
+
+class RecordingSession:
+    """Session factice enregistrant les requêtes exécutées"""
+    def __init__(self):
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        self.executed.append((statement, params))
+
+def observed_waits(lock: str) -> float:
+    """Nombre d'attentes mesurées pour un verrou"""
+    for metric in LOCK_WAIT_SECONDS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_count") and sample.labels == {"lock": lock}:
+                return sample.value
+    return 0
+
+def test_advisory_lock_key_is_stable_and_namespaced():
+    """Test que la clé ne dépend que de l'espace de noms et de l'identifiant (pas de hash() aléatoire)"""
+    doctor_id = uuid4()
+
+    key = advisory_lock_key("appointment_booking", doctor_id)
+
+    assert key == advisory_lock_key("appointment_booking", doctor_id)
+    assert key != advisory_lock_key("other", doctor_id)
+    assert key != advisory_lock_key("appointment_booking", uuid4())
+    assert -2 ** 63 <= key < 2 ** 63
+
+@pytest.mark.asyncio
+async def test_advisory_xact_lock_executes_lock_statement_and_measures_wait():
+    """Test que le verrou est demandé dans la session avec la clé calculée et que l'attente est mesurée"""
+    session = RecordingSession()
+    doctor_id = uuid4()
+    before = observed_waits("test_advisory")
+
+    await advisory_xact_lock(session, "test_advisory", doctor_id)
+
+    assert session.executed == [
+        (ADVISORY_XACT_LOCK, {"lock_key": advisory_lock_key("test_advisory", doctor_id)})
+    ]
+    assert observed_waits("test_advisory") == before + 1
@@ -14,18 +14,19 @@ def authenticator():
     """Fixture pour créer une instance de BasicAuthenticator pour les tests"""
     return BasicAuthenticator()
 
-def test_password_hashing(authenticator):
+@pytest.mark.asyncio
+async def test_password_hashing(authenticator):
     """Test le hash et la vérification des mots de passe"""
     # Arrange
     password = "test_password"
     
     # Act
-    hashed_password = authenticator.get_password_hash(password)
-    result = authenticator.verify_password(password, hashed_password)
+    hashed_password = await authenticator.get_password_hash(password)
+    result = await authenticator.verify_password(password, hashed_password)
     
     # Assert
     assert result is True
-    assert authenticator.verify_password("wrong_password", hashed_password) is False
+    assert await authenticator.verify_password("wrong_password", hashed_password) is False
 
 def test_jwt_token_creation(authenticator):
     """Test la création de tokens JWT"""
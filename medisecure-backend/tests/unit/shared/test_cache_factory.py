@@ -0,0 +1,34 @@
+# tests/unit/shared/test_cache_factory.py
+import pytest
+
+from shared.infrastructure.cache.factory import create_cache
+from shared.infrastructure.cache.memory_cache import InMemoryCache
+from shared.infrastructure.cache.null_cache import NullCache
+
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+def test_single_worker_keeps_memory_cache(monkeypatch):
+    """Test qu'un seul worker garde le cache en mémoire"""
+    monkeypatch.delenv("WEB_CONCURRENCY", raising=False)
+
+    assert isinstance(create_cache("patients", 60, 100, invalidated=True), InMemoryCache)
+
+def test_invalidated_cache_disabled_with_several_workers(monkeypatch):
+    """Test qu'un cache invalidé à l'écriture est désactivé sans Redis avec plusieurs workers"""
+    monkeypatch.setenv("WEB_CONCURRENCY", "4")
+
+    assert isinstance(create_cache("patients", 60, 100, invalidated=True), NullCache)
+    assert isinstance(create_cache("tokens", 60, 100), InMemoryCache)
+
+@pytest.mark.asyncio
+async def test_null_cache_stores_nothing():
+    """Test que le cache désactivé ne conserve aucune valeur"""
+    cache = NullCache("patients")
+
+    await cache.set("a", "1")
+    await cache.set_many({"b": "2"})
+
+    assert await cache.get("a") is None
+    assert await cache.get_many(["a", "b"]) == {}
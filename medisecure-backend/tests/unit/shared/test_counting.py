@@ -0,0 +1,58 @@
+# tests/unit/shared/test_counting.py
+
+import pytest
+
+from shared.application.pagination.counting import CachedCounter
+from shared.infrastructure.cache.ttl_cache import TTLCache
+
+class FakeClock:
+    """Horloge contrôlée par le test"""
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+def test_ttl_cache_expires_entries():
+    """Test l'expiration des entrées après le TTL"""
+    clock = FakeClock()
+    cache = TTLCache(ttl_seconds=10, clock=clock)
+    cache.set("patients", 42)
+
+    clock.now = 9.9
+    assert cache.get("patients") == 42
+
+    clock.now = 10.0
+    assert cache.get("patients") is None
+    assert len(cache) == 0
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test l'éviction LRU lorsque la taille maximale est atteinte"""
+    cache = TTLCache(ttl_seconds=10, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    assert cache.set("c", 3) == "b"
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+
+@pytest.mark.asyncio
+async def test_cached_counter_loads_once_per_ttl():
+    """Test que l'estimation n'est recalculée qu'après expiration du cache"""
+    clock = FakeClock()
+    counter = CachedCounter(TTLCache(ttl_seconds=30, clock=clock))
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return 1000 + len(calls)
+
+    first = await counter.estimated("patients", loader)
+    second = await counter.estimated("patients", loader)
+    clock.now = 31
+    third = await counter.estimated("patients", loader)
+
+    assert (first.total, second.total, third.total) == (1001, 1001, 1002)
+    assert first.estimated
+    assert len(calls) == 2
@@ -0,0 +1,97 @@
+# tests/unit/shared/test_data_loader.py
+
+import asyncio
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from shared.application.batching.data_loader import DataLoader
+from shared.adapters.secondary.in_memory_user_repository import InMemoryUserRepository
+from shared.domain.entities.user import User
+from shared.domain.enums.roles import UserRole
+from shared.infrastructure.database.models.patient_model import PatientModel  # noqa: F401
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import QUERIES
+
+class RecordingBatchLoad:
+    """Fonction de lot enregistrant les clés reçues à chaque appel"""
+    def __init__(self, values, error=None):
+        self.values = values
+        self.error = error
+        self.calls = []
+
+    async def __call__(self, keys):
+        self.calls.append(list(keys))
+        if self.error is not None:
+            raise self.error
+        return {key: self.values[key] for key in keys if key in self.values}
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_coalesced():
+    """Test que les lectures d'un même tour de boucle forment un seul lot, sans doublon"""
+    batch_load = RecordingBatchLoad({1: "a", 2: "b"})
+    loader = DataLoader(batch_load)
+
+    values = await asyncio.gather(loader.load(1), loader.load(2), loader.load(1), loader.load(3))
+
+    assert values == ["a", "b", "a", None]
+    assert batch_load.calls == [[1, 2, 3]]
+
+@pytest.mark.asyncio
+async def test_loaded_values_are_memoized():
+    """Test qu'une clé déjà chargée n'est pas relue"""
+    batch_load = RecordingBatchLoad({1: "a", 2: "b"})
+    loader = DataLoader(batch_load)
+
+    await loader.load(1)
+    assert await loader.load_many([1, 2]) == ["a", "b"]
+
+    assert batch_load.calls == [[1], [2]]
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_batches():
+    """Test le découpage des lots trop grands"""
+    batch_load = RecordingBatchLoad({})
+    loader = DataLoader(batch_load, max_batch_size=2)
+
+    await loader.load_many([1, 2, 3])
+
+    assert batch_load.calls == [[1, 2], [3]]
+
+@pytest.mark.asyncio
+async def test_errors_are_propagated_and_not_memoized():
+    """Test qu'une erreur est transmise aux appelants puis que la lecture peut être relancée"""
+    batch_load = RecordingBatchLoad({1: "a"}, error=ConnectionError("db down"))
+    loader = DataLoader(batch_load)
+
+    with pytest.raises(ConnectionError):
+        await loader.load(1)
+
+    batch_load.error = None
+    assert await loader.load(1) == "a"
+
+@pytest.mark.asyncio
+async def test_loader_over_user_repository():
+    """Test un loader sur get_many du repository des utilisateurs"""
+    repository = InMemoryUserRepository()
+    doctor = await repository.create(User(
+        id=uuid4(),
+        email="doctor@medisecure.com",
+        first_name="Marie",
+        last_name="Curie",
+        role=UserRole.DOCTOR,
+        created_at=datetime.now()
+    ))
+    loader = DataLoader(repository.get_many)
+
+    found, missing = await loader.load_many([doctor.id, uuid4()])
+
+    assert found.last_name == "Curie"
+    assert missing is None
+
+def test_postgres_get_many_uses_a_single_array_parameter():
+    """Test que get_many envoie une seule requête id = ANY($1), quelle que soit la taille du lot"""
+    sql = str(QUERIES["get_many"].compile(dialect=asyncpg.dialect()))
+
+    assert "patients.id = ANY ($1::UUID[])" in sql
@@ -0,0 +1,194 @@
+# tests/unit/shared/test_email_outbox_worker.py
+
+import pytest
+from contextlib import asynccontextmanager
+from typing import Dict, List
+from unittest.mock import AsyncMock
+from uuid import UUID, uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.domain.entities.outbox_message import OutboxMessage
+from shared.infrastructure.database.unit_of_work import UnitOfWork, get_current_session
+from shared.infrastructure.services.email_outbox_worker import EmailOutboxWorker
+from shared.infrastructure.services.outbox_mailer import OutboxMailer
+from shared.ports.secondary.email_outbox_protocol import EmailOutboxProtocol
+
+class FakeOutbox(EmailOutboxProtocol):
+    """Boîte d'envoi en mémoire"""
+    def __init__(self):
+        self.messages: Dict[UUID, OutboxMessage] = {}
+        self.status: Dict[UUID, str] = {}
+        self.delays: List[float] = []
+        self.recorded_in_session: List[bool] = []
+        self.purges: List[float] = []
+
+    async def enqueue(self, sender: str, recipients: List[str], raw_message: str) -> UUID:
+        message = OutboxMessage(id=uuid4(), sender=sender, recipients=recipients, raw_message=raw_message)
+        self.messages[message.id] = message
+        self.status[message.id] = "pending"
+        return message.id
+
+    async def claim_batch(self, limit: int, lease_seconds: float) -> List[OutboxMessage]:
+        claimed = [m for m in self.messages.values() if self.status[m.id] == "pending"][:limit]
+        for message in claimed:
+            self.status[message.id] = "sending"
+        return claimed
+
+    async def mark_sent(self, message_id: UUID) -> None:
+        self.recorded_in_session.append(get_current_session() is not None)
+        self.status[message_id] = "sent"
+
+    async def mark_retry(self, message_id: UUID, error: str, delay_seconds: float) -> None:
+        self.recorded_in_session.append(get_current_session() is not None)
+        self.messages[message_id].attempts += 1
+        self.status[message_id] = "pending"
+        self.delays.append(delay_seconds)
+
+    async def mark_failed(self, message_id: UUID, error: str) -> None:
+        self.recorded_in_session.append(get_current_session() is not None)
+        self.messages[message_id].attempts += 1
+        self.status[message_id] = "failed"
+
+    async def purge(self, retention_seconds: float) -> int:
+        self.purges.append(retention_seconds)
+        done = [message_id for message_id, status in self.status.items() if status in ("sent", "failed")]
+        for message_id in done:
+            del self.messages[message_id]
+            del self.status[message_id]
+        return len(done)
+
+    async def pending_count(self) -> int:
+        return sum(1 for status in self.status.values() if status == "pending")
+
+@asynccontextmanager
+async def fake_unit_of_work():
+    """Unité de travail sans base de données"""
+    yield
+
+@pytest.fixture
+def outbox():
+    return FakeOutbox()
+
+@pytest.fixture
+def client():
+    return AsyncMock()
+
+@pytest.fixture
+def worker(outbox, client):
+    return EmailOutboxWorker(
+        outbox=outbox,
+        client=client,
+        unit_of_work_factory=fake_unit_of_work,
+        batch_size=10,
+        max_attempts=3,
+        base_backoff_seconds=30
+    )
+
+@pytest.mark.asyncio
+async def test_mailer_enqueues_instead_of_sending(outbox):
+    """Test que le mailer enregistre le message dans la boîte d'envoi"""
+    mailer = OutboxMailer(outbox)
+
+    sent = await mailer.send_email("patient@example.com", "Rendez-vous", "Bonjour", cc=["doctor@example.com"])
+
+    assert sent is True
+    message = next(iter(outbox.messages.values()))
+    assert message.recipients == ["patient@example.com", "doctor@example.com"]
+    assert "Subject: Rendez-vous" in message.raw_message
+
+@pytest.mark.asyncio
+async def test_mailer_propagates_enqueue_failure():
+    """Test qu'un échec d'enregistrement est propagé (annulation de l'unité de travail) et non ignoré"""
+    outbox = AsyncMock(spec=EmailOutboxProtocol)
+    outbox.enqueue.side_effect = ConnectionError("base indisponible")
+    mailer = OutboxMailer(outbox)
+
+    with pytest.raises(ConnectionError):
+        await mailer.send_email("patient@example.com", "Rendez-vous", "Bonjour")
+
+@pytest.mark.asyncio
+async def test_mailer_enqueue_failure_rolls_back_unit_of_work():
+    """Test que l'unité de travail de l'opération métier est annulée si l'email n'est pas enregistré"""
+    outbox = AsyncMock(spec=EmailOutboxProtocol)
+    outbox.enqueue.side_effect = ConnectionError("base indisponible")
+    unit_of_work = UnitOfWork(AsyncSession)
+    rolled_back = []
+
+    with pytest.raises(ConnectionError):
+        async with unit_of_work:
+            unit_of_work.session.rollback = AsyncMock(side_effect=lambda: rolled_back.append(True))
+            await OutboxMailer(outbox).send_email("patient@example.com", "Rendez-vous", "Bonjour")
+
+    assert rolled_back == [True]
+
+@pytest.mark.asyncio
+async def test_worker_sends_batch_over_one_client(worker, outbox, client):
+    """Test l'envoi d'un lot de messages"""
+    for i in range(3):
+        await outbox.enqueue("noreply@medisecure.com", [f"patient{i}@example.com"], "message")
+
+    processed = await worker.run_once()
+
+    assert processed == 3
+    assert client.send.await_count == 3
+    assert set(outbox.status.values()) == {"sent"}
+
+@pytest.mark.asyncio
+async def test_worker_retries_with_backoff_then_gives_up(worker, outbox, client):
+    """Test les nouvelles tentatives avec délai exponentiel puis l'abandon"""
+    message_id = await outbox.enqueue("noreply@medisecure.com", ["patient@example.com"], "message")
+    client.send.side_effect = ConnectionError("SMTP indisponible")
+
+    for _ in range(3):
+        await worker.run_once()
+
+    assert outbox.delays == [30, 60]
+    assert outbox.status[message_id] == "failed"
+    assert await worker.run_once() == 0
+
+@pytest.mark.asyncio
+async def test_worker_sends_outside_any_transaction(outbox, client):
+    """Test qu'aucune session n'est ouverte pendant l'envoi SMTP et que chaque résultat a sa transaction"""
+    worker = EmailOutboxWorker(outbox, client, lambda: UnitOfWork(AsyncSession), batch_size=10)
+    sessions_during_send = []
+    client.send.side_effect = lambda *args: sessions_during_send.append(get_current_session())
+    for i in range(3):
+        await outbox.enqueue("noreply@medisecure.com", [f"patient{i}@example.com"], "message")
+
+    await worker.run_once()
+
+    assert sessions_during_send == [None, None, None]
+    assert outbox.recorded_in_session == [True, True, True]
+    assert set(outbox.status.values()) == {"sent"}
+
+@pytest.mark.asyncio
+async def test_worker_postpones_messages_once_lease_is_too_short(outbox, client):
+    """Test qu'aucun envoi n'est commencé s'il risque de finir après l'expiration du bail"""
+    worker = EmailOutboxWorker(
+        outbox, client, fake_unit_of_work, lease_seconds=10, send_timeout_seconds=10
+    )
+    message_id = await outbox.enqueue("noreply@medisecure.com", ["patient@example.com"], "message")
+
+    assert await worker.run_once() == 0
+    client.send.assert_not_awaited()
+    # Le message reste réservé jusqu'à l'expiration de son bail
+    assert outbox.status[message_id] == "sending"
+
+@pytest.mark.asyncio
+async def test_worker_purges_processed_messages_at_most_once_per_interval(outbox, client):
+    """Test que les messages traités sont purgés selon la durée de conservation, sans purge à chaque lot"""
+    worker = EmailOutboxWorker(outbox, client, fake_unit_of_work, retention_seconds=86400, purge_interval_seconds=3600)
+    await outbox.enqueue("noreply@medisecure.com", ["patient@example.com"], "message")
+    await worker.run_once()
+
+    assert await worker.purge_if_due() == 1
+    assert await worker.purge_if_due() == 0
+    assert outbox.purges == [86400]
+    assert outbox.messages == {}
+
+def test_backoff_is_capped():
+    """Test le plafonnement du délai entre deux tentatives"""
+    worker = EmailOutboxWorker(FakeOutbox(), AsyncMock(), fake_unit_of_work, max_backoff_seconds=100)
+
+    assert [worker.backoff_seconds(n) for n in (1, 2, 3, 4)] == [30, 60, 100, 100]
@@ -0,0 +1,86 @@
+# tests/unit/shared/test_logging_config.py
+
+import json
+import logging
+
+import pytest
+
+from shared.infrastructure.database.pool import PoolSettings
+from shared.infrastructure.monitoring.logging_config import (
+    JsonFormatter,
+    LoggingSettings,
+    SamplingFilter,
+    configure_logging,
+    create_handler
+)
+
+def make_record(level: int, msg: str = "Patient %s consulté", args=("p-1",), **extra) -> logging.LogRecord:
+    """Crée un enregistrement de log"""
+    record = logging.LogRecord("medisecure.test", level, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+def test_sampling_filter_keeps_warnings_and_samples_info():
+    """Test que seuls les messages INFO (et en dessous) sont échantillonnés"""
+    sampling = SamplingFilter(0.5, random_func=iter([0.7, 0.2]).__next__)
+
+    assert sampling.filter(make_record(logging.WARNING)) is True
+    assert sampling.filter(make_record(logging.ERROR)) is True
+    assert sampling.filter(make_record(logging.INFO)) is False
+    assert sampling.filter(make_record(logging.INFO)) is True
+
+def test_sampling_filter_rejects_invalid_rate():
+    """Test qu'un taux hors de [0, 1] est refusé"""
+    with pytest.raises(ValueError):
+        SamplingFilter(1.5)
+
+def test_json_formatter_includes_extra_fields():
+    """Test que le format JSON contient le message formaté et les champs extra"""
+    record = make_record(logging.INFO, patient_id="p-1", duration_ms=12)
+
+    payload = json.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Patient p-1 consulté"
+    assert payload["level"] == "INFO"
+    assert payload["logger"] == "medisecure.test"
+    assert payload["patient_id"] == "p-1"
+    assert payload["duration_ms"] == 12
+
+def test_handler_rejects_unknown_format():
+    """Test qu'un format de sortie inconnu est refusé"""
+    with pytest.raises(ValueError):
+        create_handler(LoggingSettings(format="xml"))
+
+def test_settings_from_env(monkeypatch):
+    """Test la lecture des variables d'environnement LOG_*"""
+    monkeypatch.setenv("LOG_LEVEL", "debug")
+    monkeypatch.setenv("LOG_FORMAT", "JSON")
+    monkeypatch.setenv("LOG_INFO_SAMPLE_RATE", "0.25")
+
+    settings = LoggingSettings.from_env()
+
+    assert settings == LoggingSettings(level="DEBUG", format="json", info_sample_rate=0.25)
+
+def test_configure_logging_replaces_previous_handler():
+    """Test qu'un second appel remplace le handler installé au lieu d'en ajouter un"""
+    root = logging.getLogger()
+    previous_level = root.level
+    try:
+        configure_logging(LoggingSettings(level="WARNING"))
+        configure_logging(LoggingSettings(level="WARNING", info_sample_rate=0.5))
+
+        installed = [h for h in root.handlers if getattr(h, "_medisecure", False)]
+        assert len(installed) == 1
+        assert isinstance(installed[0].filters[0], SamplingFilter)
+        assert root.level == logging.WARNING
+    finally:
+        configure_logging(LoggingSettings())
+        root.setLevel(previous_level)
+
+def test_sql_echo_disabled_by_default(monkeypatch):
+    """Test que les requêtes SQL ne sont journalisées que sur demande (DB_ECHO)"""
+    monkeypatch.delenv("DB_ECHO", raising=False)
+    assert PoolSettings.from_env().echo is False
+
+    monkeypatch.setenv("DB_ECHO", "true")
+    assert PoolSettings.from_env().echo is True
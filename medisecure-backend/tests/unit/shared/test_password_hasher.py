@@ -0,0 +1,68 @@
+# tests/unit/shared/test_password_hasher.py
+
+import asyncio
+import threading
+import time
+import pytest
+
+from shared.services.authenticator.password_hasher import PasswordHasher
+
+@pytest.fixture
+def hasher():
+    """Fixture pour créer un service de hachage rapide (coût minimal)"""
+    password_hasher = PasswordHasher(rounds=4, max_concurrency=2)
+    yield password_hasher
+    password_hasher.shutdown()
+
+@pytest.mark.asyncio
+async def test_hash_uses_configured_cost(hasher):
+    """Test le facteur de coût des nouveaux hash et leur vérification"""
+    hashed = await hasher.hash("secret")
+
+    assert hashed.startswith("$2b$04$")
+    assert await hasher.verify("secret", hashed) is True
+    assert await hasher.verify("wrong", hashed) is False
+
+@pytest.mark.asyncio
+async def test_invalid_hash_is_rejected(hasher):
+    """Test qu'un hash invalide est refusé sans erreur"""
+    assert await hasher.verify("secret", "not-a-bcrypt-hash") is False
+
+def test_invalid_cost_is_rejected():
+    """Test le refus d'un facteur de coût hors limites"""
+    with pytest.raises(ValueError):
+        PasswordHasher(rounds=3)
+
+@pytest.mark.asyncio
+async def test_concurrency_is_bounded_and_loop_stays_free(hasher):
+    """Test que les calculs sont limités et ne bloquent pas la boucle d'événements"""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_verify(password: str, hashed_password: str) -> bool:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return True
+
+    hasher.verify_sync = slow_verify
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.005)
+            ticks += 1
+
+    ticker_task = asyncio.create_task(ticker())
+    results = await asyncio.gather(*(hasher.verify("secret", "hash") for _ in range(6)))
+    ticker_task.cancel()
+
+    assert all(results)
+    assert peak == 2
+    assert ticks > 10
@@ -0,0 +1,92 @@
+# tests/unit/shared/test_query_registry.py
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.engine.interfaces import CacheStats
+
+from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.pool import (
+    COMPILED_CACHE_NAME,
+    PREPARED_CACHE_NAME,
+    PoolSettings,
+    create_pooled_engine,
+    record_statement_cache
+)
+from shared.infrastructure.database.query_registry import QueryRegistry
+from shared.infrastructure.monitoring.prometheus_metrics import CACHE_HITS, CACHE_MISSES
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import QUERIES as PATIENT_QUERIES
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import QUERIES as APPOINTMENT_QUERIES
+
+class FakeContext:
+    """Contexte d'exécution factice portant le statut du cache de compilation"""
+    def __init__(self, cache_hit):
+        self.cache_hit = cache_hit
+
+class FakeAdaptConnection:
+    """Connexion asyncpg adaptée factice avec son cache de requêtes préparées"""
+    def __init__(self, statements):
+        self._prepared_statement_cache = dict.fromkeys(statements)
+
+class FakeCursor:
+    """Curseur factice rattaché à une connexion adaptée"""
+    def __init__(self, statements=()):
+        self._adapt_connection = FakeAdaptConnection(statements)
+
+def counter(metric, cache: str) -> float:
+    """Valeur courante d'un compteur de cache"""
+    return metric.labels(cache=cache)._value.get()
+
+def test_registry_rejects_duplicate_names():
+    """Test qu'un nom de requête ne peut être enregistré qu'une fois"""
+    registry = QueryRegistry()
+    statement = registry.register("count", select(PatientModel.id))
+
+    assert registry["count"] is statement
+    assert "count" in registry
+    with pytest.raises(ValueError):
+        registry.register("count", select(PatientModel.id))
+
+def test_hot_queries_are_registered():
+    """Test que les requêtes fréquentes des repositories sont construites une fois"""
+    assert {"get_by_id", "get_by_email"} <= set(PATIENT_QUERIES)
+    assert {"find_by_id", "find_conflicts", "find_all_by_doctor_id"} <= set(APPOINTMENT_QUERIES)
+
+def test_registered_queries_use_bound_parameters():
+    """Test que les valeurs sont liées à l'exécution (texte SQL identique d'un appel à l'autre)"""
+    compiled = APPOINTMENT_QUERIES["find_conflicts_excluding"].compile(dialect=asyncpg.dialect())
+
+    assert {"doctor_id", "start_time", "end_time", "exclude_appointment_id"} <= set(compiled.params)
+    assert "status IN ('scheduled', 'confirmed')" in str(compiled)
+
+def test_reused_statement_keeps_its_cache_key():
+    """Test que la clé du cache de compilation n'est calculée qu'une fois"""
+    statement = PATIENT_QUERIES["get_by_id"]
+
+    assert statement._generate_cache_key() is statement._generate_cache_key()
+
+def test_record_statement_cache_counts_hits_and_misses():
+    """Test le comptage des succès et absences des deux caches de requêtes"""
+    sql = "SELECT patients.id FROM patients WHERE patients.id = $1::UUID"
+    compiled_hits = counter(CACHE_HITS, COMPILED_CACHE_NAME)
+    compiled_misses = counter(CACHE_MISSES, COMPILED_CACHE_NAME)
+    prepared_hits = counter(CACHE_HITS, PREPARED_CACHE_NAME)
+    prepared_misses = counter(CACHE_MISSES, PREPARED_CACHE_NAME)
+
+    record_statement_cache(None, FakeCursor(), sql, {}, FakeContext(CacheStats.CACHE_MISS), False)
+    record_statement_cache(None, FakeCursor([sql]), sql, {}, FakeContext(CacheStats.CACHE_HIT), False)
+    record_statement_cache(None, FakeCursor(), sql, [], FakeContext(CacheStats.CACHE_HIT), True)
+
+    assert counter(CACHE_HITS, COMPILED_CACHE_NAME) == compiled_hits + 2
+    assert counter(CACHE_MISSES, COMPILED_CACHE_NAME) == compiled_misses + 1
+    assert counter(CACHE_HITS, PREPARED_CACHE_NAME) == prepared_hits + 1
+    assert counter(CACHE_MISSES, PREPARED_CACHE_NAME) == prepared_misses + 1
+
+def test_engine_compiled_cache_size():
+    """Test que la taille du cache de compilation suit la configuration"""
+    engine = create_pooled_engine(
+        "postgresql+asyncpg://u:p@localhost:5432/db",
+        PoolSettings(compiled_cache_size=50, echo=False)
+    )
+
+    assert engine.sync_engine._compiled_cache.capacity == 50
@@ -0,0 +1,93 @@
+# tests/unit/shared/test_redis_cache.py
+
+import pytest
+
+from shared.infrastructure.cache import redis_cache
+from shared.infrastructure.cache.redis_cache import RedisCache
+
+class FakePipeline:
+    """Pipeline Redis factice : les commandes sont envoyées ensemble à execute()"""
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    def set(self, key, value, px=None, nx=False):
+        self.commands.append((key, value, px, nx))
+        return self
+
+    async def execute(self):
+        self.client.round_trips += 1
+        return [self.client.store(*command) for command in self.commands]
+
+class FakeRedis:
+    """Client Redis factice comptant les échanges avec le serveur"""
+    def __init__(self):
+        self.values = {}
+        self.expirations = {}
+        self.round_trips = 0
+
+    def store(self, key, value, px, nx):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value
+        self.expirations[key] = px
+        return True
+
+    async def set(self, key, value, px=None, nx=False):
+        self.round_trips += 1
+        return self.store(key, value, px, nx)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.values.get(key) for key in keys]
+
+    def pipeline(self, transaction=True):
+        assert transaction is False
+        return FakePipeline(self)
+
+class FakeRedisModule:
+    """Remplace redis.asyncio (paquet optionnel)"""
+    def __init__(self, client):
+        self.client = client
+
+    def from_url(self, url, decode_responses=False):
+        return self.client
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(redis_cache, "redis_asyncio", FakeRedisModule(client))
+    return client
+
+@pytest.mark.asyncio
+async def test_set_many_and_get_many_use_one_round_trip_each(client):
+    """Test que set_many (pipeline) et get_many (MGET) font chacun un seul échange, clés préfixées"""
+    cache = RedisCache("patients", "redis://cache:6379/0", ttl_seconds=60)
+
+    await cache.set_many({"a": "1", "b": "2", "c": "3"})
+    values = await cache.get_many(["a", "b", "missing"])
+
+    assert values == {"a": "1", "b": "2"}
+    assert client.round_trips == 2
+    assert client.expirations["medisecure:patients:a"] == 60000
+
+@pytest.mark.asyncio
+async def test_empty_batches_do_not_reach_the_server(client):
+    """Test qu'un lot vide ne déclenche aucun échange"""
+    cache = RedisCache("patients", "redis://cache:6379/0", ttl_seconds=60)
+
+    assert await cache.get_many([]) == {}
+    await cache.set_many({})
+
+    assert client.round_trips == 0
+
+@pytest.mark.asyncio
+async def test_if_absent_keeps_existing_values(client):
+    """Test que if_absent (SET NX) ne remplace pas une valeur existante"""
+    cache = RedisCache("patients", "redis://cache:6379/0", ttl_seconds=60)
+    await cache.set("a", "1")
+
+    await cache.set("a", "2", if_absent=True)
+    await cache.set_many({"a": "3", "b": "4"}, if_absent=True)
+
+    assert await cache.get_many(["a", "b"]) == {"a": "1", "b": "4"}
@@ -0,0 +1,105 @@
+# tests/unit/shared/test_task_group.py
+
+import asyncio
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from shared.application.concurrency.task_group import TaskGroup, run_concurrently
+from shared.infrastructure.database.unit_of_work import UnitOfWork, get_current_session
+
+class Probe:
+    """Lecture simulée enregistrant le nombre de lectures simultanées et la session vue"""
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+        self.sessions = []
+        self.cancelled = 0
+
+    async def read(self, value, delay=0.01, error=None):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.sessions.append(get_current_session())
+        try:
+            await asyncio.sleep(delay)
+            if error is not None:
+                raise error
+            return value
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.running -= 1
+
+@pytest.mark.asyncio
+async def test_run_concurrently_returns_results_in_order():
+    """Test que les lectures s'exécutent en même temps et que l'ordre des résultats est conservé"""
+    probe = Probe()
+
+    results = await run_concurrently(probe.read("a", delay=0.02), probe.read("b", delay=0.01))
+
+    assert results == ["a", "b"]
+    assert probe.max_running == 2
+
+@pytest.mark.asyncio
+async def test_first_error_cancels_siblings():
+    """Test que la première erreur annule les autres tâches avant d'être propagée"""
+    probe = Probe()
+
+    with pytest.raises(ValueError):
+        async with TaskGroup() as group:
+            group.spawn(probe.read("a", delay=1))
+            group.spawn(probe.read("b", delay=0, error=ValueError("boom")))
+
+    assert probe.cancelled == 1
+    assert probe.running == 0
+
+@pytest.mark.asyncio
+async def test_timeout_cancels_pending_tasks():
+    """Test que le dépassement du délai annule les tâches en cours"""
+    probe = Probe()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await run_concurrently(probe.read("a", delay=1), probe.read("b", delay=0), timeout=0.01)
+
+    assert probe.cancelled == 1
+    assert probe.running == 0
+
+@pytest.mark.asyncio
+async def test_error_in_block_cancels_spawned_tasks():
+    """Test qu'une erreur dans le corps du bloc annule les tâches déjà lancées"""
+    probe = Probe()
+
+    with pytest.raises(RuntimeError):
+        async with TaskGroup() as group:
+            group.spawn(probe.read("a", delay=1))
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+    assert probe.cancelled == 1
+
+@pytest.mark.asyncio
+async def test_reads_sharing_a_unit_of_work_run_sequentially():
+    """Test que les lectures d'une unité de travail ne sont pas lancées en même temps sur sa session"""
+    probe = Probe()
+
+    async with UnitOfWork(AsyncSession) as unit_of_work:
+        session = unit_of_work.session
+        results = await run_concurrently(probe.read("a"), probe.read("b"))
+
+    assert results == ["a", "b"]
+    assert probe.max_running == 1
+    assert probe.sessions == [session, session]
+
+@pytest.mark.asyncio
+async def test_sequential_error_closes_pending_coroutines():
+    """Test qu'après une erreur, les lectures non démarrées sont fermées sans avertissement"""
+    probe = Probe()
+    pending = probe.read("c")
+
+    with pytest.raises(ValueError):
+        async with UnitOfWork(AsyncSession):
+            await run_concurrently(probe.read("a", error=ValueError("boom")), pending)
+
+    assert pending.cr_frame is None
+    assert len(probe.sessions) == 1
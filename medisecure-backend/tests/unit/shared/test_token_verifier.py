@@ -0,0 +1,59 @@
+# tests/unit/shared/test_token_verifier.py
+
+import time
+import pytest
+from unittest.mock import patch
+from jose import JWTError, jwt
+
+from shared.services.authenticator.token_verifier import TokenVerifier
+
+SECRET = "test-secret"
+
+def make_token(**claims) -> str:
+    """Crée un token signé de test"""
+    return jwt.encode({"sub": "doctor@example.com", "role": "doctor", **claims}, SECRET, algorithm="HS256")
+
+@pytest.fixture
+def verifier():
+    """Fixture pour créer un vérificateur avec un petit cache"""
+    return TokenVerifier(SECRET, max_size=2)
+
+def test_verified_token_is_decoded_once(verifier):
+    """Test qu'un token déjà vérifié est servi par le cache"""
+    token = make_token(exp=int(time.time()) + 600)
+
+    with patch("shared.services.authenticator.token_verifier.jwt.decode", wraps=jwt.decode) as decode:
+        first = verifier.verify(token)
+        second = verifier.verify(token)
+
+    assert decode.call_count == 1
+    assert first == second
+    assert first["sub"] == "doctor@example.com"
+
+def test_returned_payload_is_a_copy(verifier):
+    """Test que la modification du payload par l'appelant n'altère pas le cache"""
+    token = make_token(exp=int(time.time()) + 600)
+
+    verifier.verify(token)["role"] = "ADMIN"
+
+    assert verifier.verify(token)["role"] == "doctor"
+
+def test_cached_token_expires_with_exp_claim():
+    """Test que l'entrée du cache expire avec le token"""
+    now = [time.time()]
+    verifier = TokenVerifier(SECRET, clock=lambda: now[0])
+    token = make_token(exp=int(now[0]) + 60)
+    verifier.verify(token)
+
+    now[0] += 120
+    with patch("shared.services.authenticator.token_verifier.jwt.decode", side_effect=JWTError("expired")):
+        with pytest.raises(JWTError):
+            verifier.verify(token)
+
+def test_invalid_token_is_rejected_and_not_cached(verifier):
+    """Test le refus d'un token mal signé"""
+    forged = jwt.encode({"sub": "intruder"}, "other-secret", algorithm="HS256")
+
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            verifier.verify(forged)
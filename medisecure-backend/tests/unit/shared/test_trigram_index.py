@@ -0,0 +1,59 @@
+# tests/unit/shared/test_trigram_index.py
+
+import pytest
+
+from shared.infrastructure.search.trigram_index import (
+    TrigramIndex,
+    escape_like,
+    normalize_text,
+    similarity
+)
+
+@pytest.fixture
+def index():
+    """Fixture pour créer un index avec quelques noms"""
+    index = TrigramIndex()
+    index.add(1, ["Hélène", "Dupont"])
+    index.add(2, ["Jean", "Lefèvre"])
+    index.add(3, ["Anaïs", "Martin"])
+    return index
+
+def test_normalize_text_removes_accents_and_case():
+    """Test la normalisation (équivalent de lower(unaccent(...)))"""
+    assert normalize_text("Hélène LEFÈVRE") == "helene lefevre"
+    assert normalize_text(None) == ""
+
+def test_search_is_accent_insensitive(index):
+    """Test la recherche par sous-chaîne sans accents"""
+    assert index.search("helene") == {1}
+    assert index.search("LEFEV") == {2}
+    assert index.search("ène") == {1}
+
+def test_search_short_terms_use_index(index):
+    """Test la recherche d'un ou deux caractères"""
+    assert index.search("a") == {2, 3}
+    assert index.search("ma") == {3}
+    assert index.search("z") == set()
+
+def test_search_rejects_false_positive_candidates(index):
+    """Test que les candidats partageant des trigrammes sans contenir le terme sont écartés"""
+    index.add(4, ["Duxxxpon"])
+    assert index.search("dupon") == {1}
+
+def test_remove_and_reindex(index):
+    """Test la suppression et la réindexation d'une entrée"""
+    index.remove(1)
+    assert index.search("helene") == set()
+
+    index.add(2, ["Jeanne", "Moreau"])
+    assert index.search("lefevre") == set()
+    assert index.search("moreau") == {2}
+
+def test_similarity_ranks_closest_name_first():
+    """Test le score de similarité trigramme"""
+    assert similarity("Martin", "martin") == 1.0
+    assert similarity("Martin", "Martinez") > similarity("Martin", "Marchand")
+
+def test_escape_like():
+    """Test l'échappement des caractères spéciaux LIKE"""
+    assert escape_like("50%_a\\b") == "50\\%\\_a\\\\b"
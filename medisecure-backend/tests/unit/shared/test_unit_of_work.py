@@ -0,0 +1,146 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from shared.infrastructure.database.unit_of_work import (
+    SessionScope,
+    after_transaction,
+    UnitOfWork,
+    get_current_session,
+)
+
+class FakeTransaction:
+    """Transaction factice utilisable avec `async with` et `await`"""
+    def __init__(self, session):
+        self.session = session
+    
+    def __await__(self):
+        self.session.began += 1
+        return self._noop().__await__()
+    
+    async def _noop(self):
+        return self
+    
+    async def __aenter__(self):
+        self.session.began += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            await self.session.commit()
+        else:
+            await self.session.rollback()
+        return False
+
+class FakeSession:
+    """Session factice comptant les transactions"""
+    def __init__(self):
+        self.began = 0
+        self.info = {}
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.close = AsyncMock()
+    
+    def begin(self):
+        return FakeTransaction(self)
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+        return False
+
+class FakeSessionFactory:
+    """Factory factice enregistrant les sessions créées"""
+    def __init__(self):
+        self.sessions = []
+    
+    def __call__(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+@pytest.fixture
+def session_factory():
+    return FakeSessionFactory()
+
+@pytest.mark.asyncio
+async def test_repositories_share_the_unit_of_work_session(session_factory):
+    """Test que toutes les opérations d'une unité de travail utilisent une seule session"""
+    # Arrange
+    scope = SessionScope(session_factory)
+    
+    # Act
+    async with UnitOfWork(session_factory):
+        async with scope() as first:
+            pass
+        async with scope() as second:
+            pass
+    
+    # Assert
+    assert first is second
+    assert len(session_factory.sessions) == 1
+    session = session_factory.sessions[0]
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+    session.close.assert_awaited_once()
+    assert get_current_session() is None
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error(session_factory):
+    """Test que la transaction est annulée si le cas d'utilisation échoue"""
+    with pytest.raises(ValueError):
+        async with UnitOfWork(session_factory):
+            raise ValueError("boom")
+    
+    session = session_factory.sessions[0]
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+    assert get_current_session() is None
+
+@pytest.mark.asyncio
+async def test_nested_unit_of_work_joins_outer_transaction(session_factory):
+    """Test qu'une unité de travail imbriquée ne valide pas la transaction englobante"""
+    async with UnitOfWork(session_factory) as outer:
+        async with UnitOfWork(session_factory) as inner:
+            assert inner.session is outer.session
+        outer.session.commit.assert_not_awaited()
+    
+    assert len(session_factory.sessions) == 1
+    session_factory.sessions[0].commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_scope_without_unit_of_work_uses_short_lived_session(session_factory):
+    """Test qu'en dehors d'une unité de travail, chaque appel a sa propre transaction"""
+    scope = SessionScope(session_factory)
+    
+    async with scope() as first:
+        # Un appel imbriqué réutilise la session du scope autonome
+        async with scope() as nested:
+            assert nested is first
+    async with scope() as second:
+        pass
+    
+    assert first is not second
+    assert len(session_factory.sessions) == 2
+    for session in session_factory.sessions:
+        session.commit.assert_awaited_once()
+
+@pytest.mark.asyncio
+async def test_after_transaction_callbacks_run_once_the_unit_of_work_ends():
+    """Test que les callbacks de fin de transaction attendent la fin de l'unité de travail"""
+    factory = FakeSessionFactory()
+    calls = []
+    
+    async def callback():
+        calls.append(factory.sessions[0].commit.await_count)
+    
+    async with UnitOfWork(factory):
+        await after_transaction(callback)
+        assert calls == []
+    
+    assert calls == [1]
+    
+    # Sans transaction active, le callback est exécuté immédiatement
+    await after_transaction(callback)
+    assert len(calls) == 2
@@ -13,6 +13,9 @@ export interface Appointment {
   notes?: string;
   createdAt: string;
   updatedAt: string;
+  // Renseignés si la liste est demandée avec include (noms lus par le backend en une requête)
+  patientName?: string;
+  doctorName?: string;
 }
 
 export interface AppointmentCreateDto {
@@ -39,8 +42,12 @@ export interface AppointmentFilter {
   status?: string;
   startDate?: string;
   endDate?: string;
+  include?: Array<"patient" | "doctor">;
 }
 
+const fullName = (participant: any): string | undefined =>
+  participant ? `${participant.first_name} ${participant.last_name}` : undefined;
+
 // Adapteur : Backend (snake_case) -> Frontend (camelCase)
 const adaptAppointmentFromApi = (backDto: any): Appointment => {
   return {
@@ -54,6 +61,8 @@ const adaptAppointmentFromApi = (backDto: any): Appointment => {
     notes: backDto.notes,
     createdAt: backDto.created_at,
     updatedAt: backDto.created_at, // Le backend n'a pas updated_at dans le DTO de réponse
+    patientName: fullName(backDto.patient),
+    doctorName: fullName(backDto.doctor),
   };
 };
 
@@ -96,6 +105,7 @@ const appointmentService = {
         if (filter.startDate) queryParams.append("start_date", filter.startDate);
         if (filter.endDate) queryParams.append("end_date", filter.endDate);
         // Status non supporté par le endpoint backend actuel selon l'analyse
+        if (filter.include?.length) queryParams.append("include", filter.include.join(","));
       }
 
       const url = `${ENDPOINTS.APPOINTMENTS.BASE}?${queryParams.toString()}`;
@@ -160,6 +170,8 @@ const appointmentService = {
       return appointmentService.getAllAppointments({
         startDate: startDate.toISOString(),
         endDate: endDate.toISOString(),
+        // Noms du patient et du médecin dans la même réponse (pas d'appel par rendez-vous)
+        include: ["patient", "doctor"],
       });
     } catch (error) {
       console.error(`Error fetching calendar for ${year}/${month}:`, error);
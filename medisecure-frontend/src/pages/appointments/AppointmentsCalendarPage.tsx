@@ -421,9 +421,10 @@ const AppointmentsCalendarPage: React.FC = () => {
                           }`}
                         >
                           {formatTime(appointment.startTime)} -
-                          {appointment.patientId
-                            ? "ID: " + appointment.patientId.substring(0, 8)
-                            : "Patient"}
+                          {appointment.patientName ??
+                            (appointment.patientId
+                              ? "ID: " + appointment.patientId.substring(0, 8)
+                              : "Patient")}
                         </div>
                       ))}
                       {day.appointments.length > 3 && (
@@ -495,7 +496,9 @@ const AppointmentsCalendarPage: React.FC = () => {
                     {getStatusBadge(appointment.status)}
                   </div>
                   <div className="text-slate-900 font-medium mb-1">
-                    Patient ID: {appointment.patientId}
+                    {appointment.patientName
+                      ? `Patient : ${appointment.patientName}`
+                      : `Patient ID: ${appointment.patientId}`}
                   </div>
                   <div className="text-slate-900 font-medium mb-1">
                     Médecin ID: {appointment.doctorId}